@@ -1,5 +1,14 @@
+from array import array
+
+import numpy as np
+
+
 class Job:
-    def __init__(self, id, arrival_time, burst_time):
+    __slots__ = ('id', 'arrival_time', 'burst_time', 'remaining_time', 'start_time',
+                 'completion_time', 'current_queue', 'vruntime', 'nice', 'priority', 'allotment_used',
+                 'dispatch_time', 'cpu')
+
+    def __init__(self, id, arrival_time, burst_time, nice=0, priority=1):
         self.id = id
         self.arrival_time = arrival_time
         self.burst_time = burst_time
@@ -7,7 +16,316 @@ class Job:
         self.start_time = None
         self.completion_time = None
         self.current_queue = 0#for MLFQ
+        self.allotment_used = 0  # MLFQ: mevcut seviyede çalışılan süre
+        self.dispatch_time = None  # MLFQ: son dilimin başladığı an
+        self.cpu = None  # SMP: en son çalıştığı CPU
         self.vruntime = 0  # CFS-specific
+        self.nice = nice  # CFS ağırlığı için, -20..19
+        self.priority = priority  # ağırlık w_j: weighted objective'ler, WSPT, CFS payı, MLFQ başlangıç seviyesi
+
+    def __repr__(self):
+        return f"Job(id={self.id}, arrival={self.arrival_time}, burst={self.burst_time})"
+
+
+class TableJob(Job):
+    # In-flight copy of a JobTable row; the engine writes it back on completion
+    __slots__ = ('row',)
+
+
+# -----------------------------
+# Columnar job table
+# -----------------------------
+class _Column:
+    # JobView attribute backed by one column of the table
+    def __init__(self, name):
+        self.name = name
+
+    def __get__(self, view, owner):
+        if view is None:
+            return self
+        value = getattr(view.table, self.name)[view.index].item()
+        if isinstance(value, float):
+            if value != value:  # NaN = not set yet
+                return None
+            if value.is_integer():
+                return int(value)
+        return value
+
+    def __set__(self, view, value):
+        getattr(view.table, self.name)[view.index] = np.nan if value is None else value
+
+
+class JobView:
+    """Job-compatible view of one row of a JobTable; reads and writes go to the arrays."""
+    __slots__ = ('table', 'index')
+
+    id = _Column('id')
+    arrival_time = _Column('arrival_time')
+    burst_time = _Column('burst_time')
+    remaining_time = _Column('remaining_time')
+    start_time = _Column('start_time')
+    completion_time = _Column('completion_time')
+    current_queue = _Column('current_queue')
+    vruntime = _Column('vruntime')
+    nice = _Column('nice')
+    priority = _Column('priority')
+
+    def __init__(self, table, index):
+        self.table = table
+        self.index = index
+
+    def __repr__(self):
+        return f"Job(id={self.id}, arrival={self.arrival_time}, burst={self.burst_time})"
+
+
+class JobTable:
+    """Struct-of-arrays job storage: one typed NumPy array per Job attribute.
+
+    Times are float64 with NaN for "not set" (start/completion of a job that
+    has not run yet). Indexing or iterating yields JobView rows, so code
+    written against Job objects keeps working.
+    """
+
+    columns = ('id', 'arrival_time', 'burst_time', 'remaining_time', 'start_time',
+               'completion_time', 'current_queue', 'vruntime', 'nice', 'priority')
+
+    def __init__(self, ids, arrival_time, burst_time, is_sorted=False, nice=None, priority=None):
+        self.is_sorted = is_sorted  # satırlar zaten arrival_time'a göre sıralı
+        self.id = np.asarray(ids, dtype=np.int64)
+        self.arrival_time = np.asarray(arrival_time, dtype=np.float64)
+        self.burst_time = np.asarray(burst_time, dtype=np.float64)
+        n = len(self.id)
+        self.remaining_time = self.burst_time.copy()
+        self.start_time = np.full(n, np.nan)
+        self.completion_time = np.full(n, np.nan)
+        self.current_queue = np.zeros(n, dtype=np.int32)
+        self.vruntime = np.zeros(n, dtype=np.float64)
+        self.nice = np.zeros(n, dtype=np.int32) if nice is None else np.asarray(nice, dtype=np.int32)
+        self.priority = np.ones(n) if priority is None else np.asarray(priority, dtype=np.float64)
+
+    @classmethod
+    def from_jobs(cls, jobs):
+        return cls([job.id for job in jobs],
+                   [job.arrival_time for job in jobs],
+                   [job.burst_time for job in jobs],
+                   nice=[getattr(job, 'nice', 0) for job in jobs],
+                   priority=[getattr(job, 'priority', 1) for job in jobs])
+
+    def to_jobs(self):
+        jobs = []
+        for view in self:
+            job = Job(view.id, view.arrival_time, view.burst_time, view.nice, view.priority)
+            job.remaining_time = view.remaining_time
+            job.start_time = view.start_time
+            job.completion_time = view.completion_time
+            job.current_queue = view.current_queue
+            job.vruntime = view.vruntime
+            jobs.append(job)
+        return jobs
+
+    def jobs(self, indices):
+        # Satırları (in-flight) Job nesnelerine çevir, blok halinde
+        indices = np.asarray(indices)
+        jobs = []
+        for index, id, arrival, burst, remaining, queue, vruntime, nice, priority in zip(
+                indices.tolist(), self.id[indices].tolist(), self.arrival_time[indices].tolist(),
+                self.burst_time[indices].tolist(), self.remaining_time[indices].tolist(),
+                self.current_queue[indices].tolist(), self.vruntime[indices].tolist(),
+                self.nice[indices].tolist(), self.priority[indices].tolist()):
+            job = TableJob(id, arrival, burst, nice, priority)
+            job.remaining_time = remaining
+            job.current_queue = queue
+            job.vruntime = vruntime
+            job.row = index
+            jobs.append(job)
+        return jobs
+
+    def write_back(self, jobs):
+        if not jobs:
+            return
+        rows = np.fromiter((job.row for job in jobs), dtype=np.int64, count=len(jobs))
+        for name in ('remaining_time', 'start_time', 'completion_time', 'current_queue', 'vruntime'):
+            # None (başlamamış) -> NaN
+            values = np.array([getattr(job, name) for job in jobs], dtype=np.float64)
+            getattr(self, name)[rows] = values
+
+    def copy(self):
+        table = JobTable.__new__(JobTable)
+        table.is_sorted = self.is_sorted
+        for name in self.columns:
+            setattr(table, name, getattr(self, name).copy())
+        return table
+
+    def reset(self):
+        self.remaining_time[:] = self.burst_time
+        self.start_time[:] = np.nan
+        self.completion_time[:] = np.nan
+        self.current_queue[:] = 0
+        self.vruntime[:] = 0
+
+    def arrival_order(self):
+        if self.is_sorted:
+            return np.arange(len(self))
+        return np.argsort(self.arrival_time, kind='stable')
+
+    @property
+    def nbytes(self):
+        return sum(getattr(self, name).nbytes for name in self.columns)
+
+    def __len__(self):
+        return len(self.id)
+
+    def __getitem__(self, index):
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("job index out of range")
+        return JobView(self, index)
+
+    def __iter__(self):
+        for index in range(len(self)):
+            yield JobView(self, index)
+
+    def __repr__(self):
+        return f"JobTable(n={len(self)})"
+
+
+def as_job_list(jobs):
+    # Scheduler'lar için: JobTable gelirse satır görünümlerine çevir
+    if isinstance(jobs, JobTable):
+        return list(jobs)
+    return jobs
+
+
+# -----------------------------
+# Pre-sorted workloads
+# -----------------------------
+class SortedJobs(tuple):
+    """Jobs already in arrival order; schedulers use it as is instead of sorting."""
+    __slots__ = ()
+
+
+def by_arrival(jobs):
+    # Geliş sırasına göre işler; sıralı olduğu bilinen girdiler yeniden sıralanmaz
+    if isinstance(jobs, SortedJobs):
+        return jobs
+    if isinstance(jobs, JobTable):
+        return SortedJobs(JobView(jobs, index) for index in jobs.arrival_order().tolist())
+    return SortedJobs(sorted(jobs, key=lambda job: job.arrival_time))
+
+
+class Workload:
+    """Immutable job set, sorted by arrival once and replayed under many policies.
+
+    The id/arrival/burst/nice/priority arrays are read-only. table() and
+    jobs() hand out fresh per-run state (remaining, start, completion, ...)
+    that is already marked as sorted, so no scheduler sorts the trace again.
+    """
+
+    def __init__(self, ids, arrival_time, burst_time, nice=None, priority=None):
+        ids = np.asarray(ids, dtype=np.int64)
+        arrival_time = np.asarray(arrival_time, dtype=np.float64)
+        burst_time = np.asarray(burst_time, dtype=np.float64)
+        n = len(ids)
+        nice = np.zeros(n, dtype=np.int32) if nice is None else np.asarray(nice, dtype=np.int32)
+        priority = np.ones(n) if priority is None else np.asarray(priority, dtype=np.float64)
+        if len(arrival_time) and np.any(arrival_time[1:] < arrival_time[:-1]):
+            order = np.argsort(arrival_time, kind='stable')
+            ids, arrival_time, burst_time = ids[order], arrival_time[order], burst_time[order]
+            nice, priority = nice[order], priority[order]
+        self.id = ids
+        self.arrival_time = arrival_time
+        self.burst_time = burst_time
+        self.nice = nice
+        self.priority = priority
+        for array in (self.id, self.arrival_time, self.burst_time, self.nice, self.priority):
+            array.flags.writeable = False
+
+    @classmethod
+    def from_jobs(cls, jobs):
+        if isinstance(jobs, (JobTable, Workload)):
+            return cls(jobs.id, jobs.arrival_time, jobs.burst_time, jobs.nice, jobs.priority)
+        return cls([job.id for job in jobs],
+                   [job.arrival_time for job in jobs],
+                   [job.burst_time for job in jobs],
+                   nice=[getattr(job, 'nice', 0) for job in jobs],
+                   priority=[getattr(job, 'priority', 1) for job in jobs])
+
+    def __len__(self):
+        return len(self.id)
+
+    def table(self):
+        return JobTable(self.id, self.arrival_time, self.burst_time, is_sorted=True,
+                        nice=self.nice, priority=self.priority)
+
+    def jobs(self):
+        return SortedJobs(Job(id, arrival, burst, nice, priority) for id, arrival, burst, nice, priority in zip(
+            self.id.tolist(), self.arrival_time.tolist(), self.burst_time.tolist(),
+            self.nice.tolist(), self.priority.tolist()))
+
+    def __repr__(self):
+        return f"Workload(n={len(self)})"
+
+
+# -----------------------------
+# Execution intervals
+# -----------------------------
+class IntervalLog:
+    """Append-only execution log: one (job, cpu, start, end) row per run slice.
+
+    Rows live in typed arrays (8 + 4 + 8 + 8 bytes each). append() merges a
+    slice into the previous row of the same CPU when the same job simply
+    kept running, so back-to-back quanta take one row; extend() adds rows in
+    bulk without merging.
+    """
+
+    def __init__(self):
+        self.job = array('q')
+        self.cpu = array('i')
+        self.start = array('d')
+        self.end = array('d')
+        self.last_row = {}  # cpu -> o CPU'daki son satır
+
+    @classmethod
+    def from_schedule(cls, schedule, cpu=0):
+        # DP çizelgeleri: [(job, start, finish), ...]
+        log = cls()
+        for job, start, finish in schedule:
+            log.append(job.id, cpu, start, finish)
+        return log
+
+    def append(self, job, cpu, start, end):
+        row = self.last_row.get(cpu)
+        if row is not None and self.job[row] == job and self.end[row] == start:
+            self.end[row] = end
+            return
+        self.last_row[cpu] = len(self.job)
+        self.job.append(job)
+        self.cpu.append(cpu)
+        self.start.append(start)
+        self.end.append(end)
+
+    def extend(self, job, cpu, start, end):
+        n = len(start)
+        for column, values, dtype in ((self.job, job, np.int64), (self.cpu, cpu, np.int32),
+                                      (self.start, start, np.float64), (self.end, end, np.float64)):
+            column.frombytes(np.ascontiguousarray(np.broadcast_to(np.asarray(values, dtype=dtype), (n,))).tobytes())
+        self.last_row.clear()
+
+    def arrays(self):
+        # Kopya: array'in buffer'ı dışarı verilirse artık büyüyemez
+        return (np.array(self.job, dtype=np.int64), np.array(self.cpu, dtype=np.int32),
+                np.array(self.start, dtype=np.float64), np.array(self.end, dtype=np.float64))
+
+    @property
+    def nbytes(self):
+        return sum(column.itemsize * len(column) for column in (self.job, self.cpu, self.start, self.end))
+
+    def __len__(self):
+        return len(self.job)
+
+    def __iter__(self):
+        return zip(self.job, self.cpu, self.start, self.end)
 
     def __repr__(self):
-        return f"Job(id={self.id}, arrival={self.arrival_time}, burst={self.burst_time})"
\ No newline at end of file
+        return f"IntervalLog(n={len(self)})"
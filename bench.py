@@ -0,0 +1,350 @@
+"""Benchmark suite: wall time, peak RSS and events/sec for every scheduler.
+
+Each case runs in its own freshly spawned process, so peak RSS (ru_maxrss)
+belongs to that case alone. Every scheduler is run along three ladders,
+with sizes chosen for its complexity: job count, arrival density (offered
+load) and burst distribution.
+
+    python bench.py --out bench.json                    # full suite
+    python bench.py --quick --only SRTF CFS             # a subset, small sizes
+    python bench.py --baseline bench.json --out new.json  # fails on regressions
+    python bench.py --only DPParallel DPParallelPool    # multi-core speedup of the layer DP
+
+"events" is what the scheduler iterates over: engine events for the
+simulated schedulers, jobs for FCFS and the subset DPs, labels for the
+parallel layer DPs, states or nodes for the preemptive DP and branch and
+bound, scored children for beam search, and operations or search
+iterations for the job shop.
+"""
+import argparse
+import contextlib
+import io
+import json
+import multiprocessing
+import os
+import platform
+import resource
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from workloads import generate
+
+SIZES = {
+    "FCFS": [10_000, 100_000, 1_000_000],
+    "MLFQ": [1_000, 10_000, 100_000],
+    "SRTF": [1_000, 10_000, 100_000],
+    "CFS": [1_000, 10_000, 100_000],
+    "DP": [12, 16, 20],
+    "DPBottomUp": [12, 16, 20],
+    "DPParallel": [16, 20, 24],
+    "DPParallelPool": [16, 20, 24],
+    "BnB": [20, 40, 60],
+    "PreemptiveDP": [8, 12, 16],
+    "Beam": [200, 1_000, 2_000],
+    "JSS": [100, 1_000, 10_000],
+    "JSSTabu": [10, 20, 50],
+}
+QUICK_SIZES = {name: sizes[:2] for name, sizes in SIZES.items()}
+
+LOADS = (0.5, 0.9, 1.2)
+BURSTS = ("exponential", "uniform", "pareto")
+DEFAULT_LOAD = 0.9
+DEFAULT_BURST = "exponential"
+MEAN_BURST = 5.0
+
+
+def make_workload(n, load=DEFAULT_LOAD, burst=DEFAULT_BURST, seed=0):
+    # Poisson gelişler; ortalama burst MEAN_BURST, load = geliş hızı x ortalama burst
+    return generate(n, "poisson", burst, utilization=load, mean_burst=MEAN_BURST, integral=True, seed=seed)
+
+
+def make_job_shop(n_jobs, n_machines, seed=0):
+    rng = np.random.default_rng(seed)
+    return {job: [(int(m), int(d)) for m, d in zip(rng.permutation(n_machines), rng.integers(1, 100, n_machines))]
+            for job in range(n_jobs)}
+
+
+# -----------------------------
+# Cases
+# -----------------------------
+def _run_engine(scheduler, workload, **params):
+    stats = {}
+    scheduler(workload.table(), stats=stats, **params)
+    return stats["events"]
+
+
+def run_fcfs(n, load, burst, seed):
+    from schedlers.FCFS import FCFSScheduler
+    workload = make_workload(n, load, burst, seed)
+    return lambda: (FCFSScheduler(workload.table()), n)[1]
+
+
+def run_mlfq(n, load, burst, seed):
+    from schedlers.MLFQ import MLFQScheduler
+    workload = make_workload(n, load, burst, seed)
+    return lambda: _run_engine(MLFQScheduler, workload)
+
+
+def run_srtf(n, load, burst, seed):
+    from schedlers.SRTF import SRTFScheduler
+    workload = make_workload(n, load, burst, seed)
+    return lambda: _run_engine(SRTFScheduler, workload, time_quantum=None)
+
+
+def run_cfs(n, load, burst, seed):
+    from schedlers.CFS import CFSScheduler
+    workload = make_workload(n, load, burst, seed)
+    return lambda: _run_engine(CFSScheduler, workload)
+
+
+def run_dp(n, load, burst, seed):
+    from schedlers.DP_algs import dp_scheduler
+    jobs = make_workload(n, load, burst, seed).jobs()
+    return lambda: (dp_scheduler(jobs), n)[1]
+
+
+def run_dp_bottom_up(n, load, burst, seed):
+    from schedlers.DP_algs import dp_scheduler_bottom_up
+    jobs = make_workload(n, load, burst, seed).jobs()
+    return lambda: (dp_scheduler_bottom_up(jobs, verbose=False), n)[1]
+
+
+def run_dp_parallel(n, load, burst, seed, processes=1):
+    from schedlers.DP_parallel import parallel_dp_scheduler
+    jobs = make_workload(n, load, burst, seed).jobs()
+
+    def run():
+        stats = {}
+        parallel_dp_scheduler(jobs, processes=processes, stats=stats, verbose=False)
+        return stats["labels"]
+    return run
+
+
+def run_dp_parallel_pool(n, load, burst, seed):
+    # Tüm çekirdekler; DPParallel (tek süreç) ile oranı SPEEDUPS raporlar
+    return run_dp_parallel(n, load, burst, seed, processes=os.cpu_count())
+
+
+def run_bnb(n, load, burst, seed):
+    from schedlers.BnB import bnb_scheduler
+    jobs = make_workload(n, load, burst, seed).jobs()
+    return lambda: bnb_scheduler(jobs)[2]["nodes"]
+
+
+def run_beam(n, load, burst, seed):
+    from schedlers.beam import beam_scheduler
+    jobs = make_workload(n, load, burst, seed).jobs()
+    return lambda: beam_scheduler(jobs)[2]["children"]
+
+
+def run_preemptive_dp(n, load, burst, seed):
+    from schedlers.DP_sched_preemptive import preemptive_dp_scheduler
+    jobs = make_workload(n, load, burst, seed).jobs()
+
+    def run():
+        stats = {}
+        preemptive_dp_scheduler(jobs, stats=stats, verbose=False)
+        return stats["states"]
+    return run
+
+
+def run_jss(n, load, burst, seed):
+    from schedlers.JSS import JobShopScheduler
+    operations = make_job_shop(n, max(10, min(100, n // 100)), seed)
+
+    def run():
+        scheduler = JobShopScheduler(operations)
+        scheduler.run()
+        return len(scheduler.schedule)
+    return run
+
+
+def run_jss_tabu(n, load, burst, seed):
+    from schedlers.JSS import JobShopScheduler
+    from schedlers.JSS_opt import tabu_search
+    operations = make_job_shop(n, 10, seed)
+
+    def run():
+        scheduler = JobShopScheduler(operations)
+        scheduler.run()
+        stats = {}
+        tabu_search(scheduler, max_iter=500, seed=seed, stats=stats)
+        return stats["iterations"]
+    return run
+
+
+CASES = {
+    "FCFS": run_fcfs,
+    "MLFQ": run_mlfq,
+    "SRTF": run_srtf,
+    "CFS": run_cfs,
+    "DP": run_dp,
+    "DPBottomUp": run_dp_bottom_up,
+    "DPParallel": run_dp_parallel,
+    "DPParallelPool": run_dp_parallel_pool,
+    "BnB": run_bnb,
+    "PreemptiveDP": run_preemptive_dp,
+    "Beam": run_beam,
+    "JSS": run_jss,
+    "JSSTabu": run_jss_tabu,
+}
+# Yoğunluk / dağılım ayarı olmayanlar (iş atölyesi örnekleri)
+SIZE_ONLY = ("JSS", "JSSTabu")
+# Aynı iş, farklı süreç sayısı: (çok süreçli, tek süreçli)
+SPEEDUPS = (("DPParallelPool", "DPParallel"),)
+
+
+def expand_cases(names, sizes):
+    """Ladders per scheduler: sizes at the default load and burst, then load
+    and burst ladders at the middle size."""
+    cases = []
+    for name in names:
+        ladder = sizes[name]
+        for n in ladder:
+            cases.append((name, n, DEFAULT_LOAD, DEFAULT_BURST))
+        if name in SIZE_ONLY:
+            continue
+        middle = ladder[len(ladder) // 2]
+        for load in LOADS:
+            if load != DEFAULT_LOAD:
+                cases.append((name, middle, load, DEFAULT_BURST))
+        for burst in BURSTS:
+            if burst != DEFAULT_BURST:
+                cases.append((name, middle, DEFAULT_LOAD, burst))
+    return cases
+
+
+def case_key(result):
+    return f"{result['scheduler']}/n={result['n']}/load={result['load']}/burst={result['burst']}"
+
+
+def _measure(task):
+    name, n, load, burst, seed = task
+    run = CASES[name](n, load, burst, seed)
+    with contextlib.redirect_stdout(io.StringIO()):
+        started = time.perf_counter()
+        events = run()
+        wall = time.perf_counter() - started
+    # Kendi Pool'unu açan case'lerde en büyük alt süreç de sayılır
+    peak = max(resource.getrusage(who).ru_maxrss for who in (resource.RUSAGE_SELF, resource.RUSAGE_CHILDREN))
+    if sys.platform == "darwin":  # macOS bayt, Linux KB döndürür
+        peak //= 1024
+    return {
+        "scheduler": name, "n": n, "load": load, "burst": burst, "seed": seed,
+        "wall": wall, "peak_rss_kb": peak, "events": events,
+        "events_per_sec": events / wall if wall > 0 else None,
+    }
+
+
+def run_benchmarks(names=None, quick=False, repeat=1, seed=0, processes=1):
+    """Run every case `repeat` times, each time in a fresh process; keep the fastest run."""
+    names = list(CASES) if names is None else names
+    for name in names:
+        if name not in CASES:
+            raise ValueError(f"Unknown benchmark: {name}")
+    tasks = [case + (seed,) for case in expand_cases(names, QUICK_SIZES if quick else SIZES)
+             for _ in range(repeat)]
+
+    # Executor süreçleri daemon değil: bir case kendi Pool'unu açabilir
+    context = multiprocessing.get_context("spawn")
+    best = {}
+    with ProcessPoolExecutor(processes, mp_context=context, max_tasks_per_child=1) as pool:
+        for result in pool.map(_measure, tasks):
+            key = case_key(result)
+            if key not in best or result["wall"] < best[key]["wall"]:
+                peak = max(result["peak_rss_kb"], best.get(key, result)["peak_rss_kb"])
+                best[key] = dict(result, peak_rss_kb=peak)
+            print(f"{key:<55} {result['wall']:9.3f}s {result['peak_rss_kb'] / 1024:8.1f} MB", flush=True)
+    return list(best.values())
+
+
+def environment():
+    return {
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "platform": platform.platform(),
+        "cpus": os.cpu_count(),
+        "time": time.strftime("%Y-%m-%dT%H:%M:%S"),
+    }
+
+
+def speedups(results):
+    """(key, speedup) for every case of a multi-process scheduler in SPEEDUPS
+    whose single-process counterpart ran too."""
+    walls = {case_key(result): result["wall"] for result in results}
+    rows = []
+    for result in results:
+        for parallel, serial in SPEEDUPS:
+            if result["scheduler"] != parallel:
+                continue
+            reference = walls.get(case_key(dict(result, scheduler=serial)))
+            if reference is not None and result["wall"] > 0:
+                rows.append((case_key(result), reference / result["wall"]))
+    return rows
+
+
+def compare(results, baseline, tolerance=0.25):
+    """Compare against a baseline file's results; returns (rows, regressions).
+
+    A case regresses when its wall time or peak RSS is more than `tolerance`
+    (relative) above the baseline.
+    """
+    reference = {case_key(result): result for result in baseline["results"]}
+    rows = []
+    regressions = []
+    for result in results:
+        key = case_key(result)
+        if key not in reference:
+            continue
+        old = reference[key]
+        time_ratio = result["wall"] / old["wall"] if old["wall"] else float("inf")
+        rss_ratio = result["peak_rss_kb"] / old["peak_rss_kb"] if old["peak_rss_kb"] else float("inf")
+        rows.append((key, time_ratio, rss_ratio))
+        if time_ratio > 1 + tolerance or rss_ratio > 1 + tolerance:
+            regressions.append(key)
+    return rows, regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--only", nargs="+", choices=list(CASES), help="schedulers to run")
+    parser.add_argument("--quick", action="store_true", help="only the two smallest sizes")
+    parser.add_argument("--repeat", type=int, default=1, help="runs per case (fastest is kept)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--processes", type=int, default=1,
+                        help="parallel cases (>1 makes wall times noisier)")
+    parser.add_argument("--out", help="write results to this JSON file")
+    parser.add_argument("--baseline", help="compare against this JSON file")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="allowed relative slowdown / RSS growth")
+    args = parser.parse_args(argv)
+
+    results = run_benchmarks(args.only, args.quick, args.repeat, args.seed, args.processes)
+    report = {"environment": environment(), "results": results}
+    rows = speedups(results)
+    if rows:
+        print(f"\nspeedup over one process ({os.cpu_count()} cpus):")
+        for key, speedup in rows:
+            print(f"{key:<55} {speedup:6.2f}x")
+    if args.out:
+        with open(args.out, "w") as f:
+            json.dump(report, f, indent=2)
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        rows, regressions = compare(results, baseline, args.tolerance)
+        print("\nvs baseline (time x / rss x):")
+        for key, time_ratio, rss_ratio in rows:
+            flag = "  REGRESSION" if key in regressions else ""
+            print(f"{key:<55} {time_ratio:6.2f}x {rss_ratio:6.2f}x{flag}")
+        if regressions:
+            print(f"\n{len(regressions)} regression(s)")
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,215 @@
+"""Chunked trace readers.
+
+Every reader yields JobTable chunks of at most `chunk_size` rows, so a trace
+is never materialized as a whole. Records need an arrival and a burst time;
+the id is optional (row number, starting at 1, when missing), and so are
+"nice" (default 0) and "priority" (the weight, default 1). Column names are
+matched loosely: "arrival_time"/"arrival", "burst_time"/"burst", "id",
+"priority"/"weight".
+
+    for job in iter_jobs(open_trace("trace.csv")):   # lazy Job stream
+        ...
+    replay("trace.parquet", SRTFPolicy(4))          # bounded-memory metrics
+"""
+import csv
+import heapq
+import json
+import os
+import tempfile
+
+import numpy as np
+
+from Job import Job, JobTable
+from metrics import MetricsAccumulator
+from schedlers.engine import EventEngine
+
+CHUNK_SIZE = 65536
+
+_ALIASES = {
+    "id": ("id", "job_id"),
+    "arrival_time": ("arrival_time", "arrival", "submit_time"),
+    "burst_time": ("burst_time", "burst", "runtime", "duration"),
+    "nice": ("nice",),
+    "priority": ("priority", "weight"),
+}
+_DTYPES = {"id": np.int64, "arrival_time": np.float64, "burst_time": np.float64,
+           "nice": np.int64, "priority": np.float64}
+
+
+def _resolve(names):
+    # Dosyadaki kolon adlarını id / arrival_time / burst_time / nice / priority'a eşle
+    lookup = {}
+    lowered = {name.lower(): name for name in names}
+    for column, aliases in _ALIASES.items():
+        for alias in aliases:
+            if alias in lowered:
+                lookup[column] = lowered[alias]
+                break
+    for column in ("arrival_time", "burst_time"):
+        if column not in lookup:
+            raise ValueError(f"trace has no {column} column (got {list(names)})")
+    return lookup
+
+
+def _chunk(columns, offset):
+    # columns: kolon -> dizi; id, nice, priority olmayabilir
+    ids = columns.get("id")
+    if ids is None:
+        ids = np.arange(offset + 1, offset + 1 + len(columns["arrival_time"]))
+    return JobTable(ids, columns["arrival_time"], columns["burst_time"],
+                    nice=columns.get("nice"), priority=columns.get("priority"))
+
+
+def iter_csv(path, chunk_size=CHUNK_SIZE):
+    with open(path, newline="") as f:
+        reader = csv.reader(f)
+        header = next(reader)
+        lookup = _resolve(header)
+        positions = {column: header.index(name) for column, name in lookup.items()}
+        offset = 0
+        rows = []
+        for row in reader:
+            if not row:
+                continue
+            rows.append(row)
+            if len(rows) == chunk_size:
+                yield _csv_chunk(rows, positions, offset)
+                offset += len(rows)
+                rows = []
+        if rows:
+            yield _csv_chunk(rows, positions, offset)
+
+
+def _csv_chunk(rows, positions, offset):
+    columns = {column: np.array([row[position] for row in rows], dtype=_DTYPES[column])
+               for column, position in positions.items()}
+    return _chunk(columns, offset)
+
+
+def iter_jsonl(path, chunk_size=CHUNK_SIZE):
+    with open(path) as f:
+        lookup = None
+        offset = 0
+        records = []
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            record = json.loads(line)
+            if lookup is None:
+                lookup = _resolve(record.keys())
+            records.append(record)
+            if len(records) == chunk_size:
+                yield _record_chunk(records, lookup, offset)
+                offset += len(records)
+                records = []
+        if records:
+            yield _record_chunk(records, lookup, offset)
+
+
+def _record_chunk(records, lookup, offset):
+    columns = {column: np.array([record[name] for record in records], dtype=_DTYPES[column])
+               for column, name in lookup.items()}
+    return _chunk(columns, offset)
+
+
+def iter_parquet(path, chunk_size=CHUNK_SIZE):
+    try:
+        import pyarrow.parquet as pq
+    except ImportError as e:
+        raise ImportError("reading Parquet traces requires pyarrow") from e
+
+    parquet = pq.ParquetFile(path)
+    lookup = _resolve(parquet.schema_arrow.names)
+    offset = 0
+    for batch in parquet.iter_batches(batch_size=chunk_size, columns=list(lookup.values())):
+        columns = {column: batch.column(batch.schema.get_field_index(name)).to_numpy()
+                   for column, name in lookup.items()}
+        yield _chunk(columns, offset)
+        offset += batch.num_rows
+
+
+def iter_npy(path, chunk_size=CHUNK_SIZE):
+    """Memory-mapped .npy: a structured array with named fields or an (n, 2|3) array.
+
+    A plain 2-D array is read as (arrival, burst) or (id, arrival, burst).
+    """
+    data = np.load(path, mmap_mode="r")
+    if data.dtype.names:
+        lookup = _resolve(data.dtype.names)
+        columns = {column: data[name] for column, name in lookup.items()}
+    elif data.ndim == 2 and data.shape[1] in (2, 3):
+        names = ("arrival_time", "burst_time") if data.shape[1] == 2 else ("id", "arrival_time", "burst_time")
+        columns = {column: data[:, i] for i, column in enumerate(names)}
+    else:
+        raise ValueError(f"unsupported .npy layout: shape {data.shape}, dtype {data.dtype}")
+
+    for offset in range(0, len(data), chunk_size):
+        part = slice(offset, offset + chunk_size)
+        yield _chunk({column: values[part] for column, values in columns.items()}, offset)
+
+
+READERS = {
+    ".csv": iter_csv,
+    ".jsonl": iter_jsonl,
+    ".json": iter_jsonl,
+    ".parquet": iter_parquet,
+    ".npy": iter_npy,
+}
+
+
+def open_trace(path, chunk_size=CHUNK_SIZE):
+    extension = os.path.splitext(path)[1].lower()
+    if extension not in READERS:
+        raise ValueError(f"Unknown trace format: {extension}")
+    return READERS[extension](path, chunk_size)
+
+
+def iter_jobs(chunks):
+    # JobTable parçalarından tek tek Job üret (akışın sırası korunur)
+    for table in chunks:
+        for id, arrival, burst, nice, priority in zip(table.id.tolist(), table.arrival_time.tolist(),
+                                                      table.burst_time.tolist(), table.nice.tolist(),
+                                                      table.priority.tolist()):
+            yield Job(id, arrival, burst, nice, priority)
+
+
+def merge_sorted(*sources):
+    """k-way merge of several arrival-sorted chunk streams into one Job stream."""
+    return heapq.merge(*(iter_jobs(source) for source in sources), key=lambda job: job.arrival_time)
+
+
+def sort_stream(chunks, chunk_size=CHUNK_SIZE, run_dir=None):
+    """External sort of an unsorted chunk stream.
+
+    Each chunk is sorted with NumPy and spilled to a structured .npy run
+    (every column, so nice and priority survive the sort); the runs are
+    then memory-mapped and k-way merged, so only one chunk per run is in
+    memory at a time. Yields Job objects in arrival order.
+    """
+    with tempfile.TemporaryDirectory(prefix="trace-runs-", dir=run_dir) as directory:
+        runs = []
+        for k, table in enumerate(chunks):
+            order = table.arrival_order()
+            path = os.path.join(directory, f"run{k:06d}.npy")
+            run = np.empty(len(order), dtype=[(column, _DTYPES[column]) for column in _ALIASES])
+            for column in _ALIASES:
+                run[column] = getattr(table, column)[order]
+            np.save(path, run)
+            runs.append(path)
+        yield from merge_sorted(*(iter_npy(path, chunk_size) for path in runs))
+
+
+def replay(source, policy, scheduler_name=None, chunk_size=CHUNK_SIZE, presorted=True):
+    """Stream a trace file (or an iterable of JobTable chunks) through the event engine.
+
+    The trace must be sorted by arrival time unless presorted=False, in which
+    case it goes through sort_stream first. Only runnable jobs and the
+    per-job metric values are kept in memory.
+    """
+    if isinstance(source, (str, os.PathLike)):
+        source = open_trace(source, chunk_size)
+    jobs = iter_jobs(source) if presorted else sort_stream(source, chunk_size)
+    metrics = MetricsAccumulator()
+    EventEngine(jobs, policy, on_complete=metrics).run()
+    return metrics.summary(scheduler_name)
@@ -0,0 +1,105 @@
+import numpy as np
+
+from Job import JobTable
+
+METRICS = ("Response", "Turnaround", "Waiting", "Slowdown")
+PERCENTILES = (50, 95, 99)
+
+
+def job_arrays(jobs):
+    # arrival, burst, start, completion dizileri (tek geçiş)
+    if isinstance(jobs, JobTable):
+        return jobs.arrival_time, jobs.burst_time, jobs.start_time, jobs.completion_time
+    rows = np.array([(job.arrival_time, job.burst_time, job.start_time, job.completion_time)
+                     for job in jobs], dtype=np.float64).reshape(-1, 4)
+    return rows[:, 0], rows[:, 1], rows[:, 2], rows[:, 3]
+
+
+def per_job_metrics(jobs):
+    """Per-job response, turnaround, waiting and slowdown as one (4, n) array."""
+    return metric_values(*job_arrays(jobs))
+
+
+def metric_values(arrival, burst, start, completion):
+    values = np.empty((len(METRICS), len(arrival)))
+    np.subtract(start, arrival, out=values[0])
+    np.subtract(completion, arrival, out=values[1])
+    np.subtract(values[1], burst, out=values[2])
+    np.divide(values[1], burst, out=values[3])
+    return values
+
+
+def compute_metrics(jobs, scheduler_name=None):
+    return summarize(per_job_metrics(jobs), scheduler_name)
+
+
+def summarize(values, scheduler_name=None):
+    result = {} if scheduler_name is None else {"Scheduler": scheduler_name}
+    if values.shape[1] == 0:
+        summary = np.full((len(METRICS), 2 + len(PERCENTILES)), np.nan)
+    else:
+        summary = np.column_stack([
+            values.mean(axis=1),
+            np.percentile(values, PERCENTILES, axis=1).T,
+            values.max(axis=1),
+        ])
+
+    for name, row in zip(METRICS, summary.tolist()):
+        suffix = "" if name == "Slowdown" else " Time"
+        result[f"Avg {name}{suffix}"] = row[0]
+        for p, value in zip(PERCENTILES, row[1:-1]):
+            result[f"P{p} {name}{suffix}"] = value
+        result[f"Max {name}{suffix}"] = row[-1]
+    result["Jobs"] = values.shape[1]
+    return result
+
+
+class MetricsAccumulator:
+    """on_complete callback that keeps only per-job metric values (4 floats per job).
+
+    Finished Job objects are dropped right away, so a streamed replay does
+    not hold the trace in memory; summary() gives the same dict as
+    compute_metrics.
+    """
+
+    CHUNK = 65536
+
+    def __init__(self):
+        self.rows = []
+        self.chunks = []
+
+    def __call__(self, job):
+        self.rows.append((job.arrival_time, job.burst_time, job.start_time, job.completion_time))
+        if len(self.rows) >= self.CHUNK:
+            self._flush()
+
+    def _flush(self):
+        if self.rows:
+            self.chunks.append(np.array(self.rows, dtype=np.float64))
+            self.rows = []
+
+    def __len__(self):
+        return sum(len(chunk) for chunk in self.chunks) + len(self.rows)
+
+    def summary(self, scheduler_name=None):
+        self._flush()
+        rows = np.concatenate(self.chunks) if self.chunks else np.empty((0, 4))
+        return summarize(metric_values(*rows.T), scheduler_name)
+
+
+def print_job_metrics(jobs):
+    ids = jobs.id.tolist() if isinstance(jobs, JobTable) else [job.id for job in jobs]
+    response, turnaround, waiting, _ = per_job_metrics(jobs).tolist()
+    for job_id, r, t, w in zip(ids, response, turnaround, waiting):
+        print(f"Job {job_id}: Response={r:g}, Turnaround={t:g}, Waiting={w:g}")
+
+
+def print_summary(result):
+    print("\nAverages:")
+    print(f"Avg Response Time = {result['Avg Response Time']:.2f}")
+    print(f"Avg Turnaround Time = {result['Avg Turnaround Time']:.2f}")
+    print(f"Avg Waiting Time = {result['Avg Waiting Time']:.2f}")
+    print("Tail latency (p50 / p95 / p99 / max):")
+    for name in ("Response", "Turnaround", "Waiting"):
+        print(f"{name:<10} = " + " / ".join(
+            f"{result[f'{label} {name} Time']:.2f}" for label in ("P50", "P95", "P99", "Max")))
@@ -0,0 +1,151 @@
+"""Optional reporting: Gantt charts and scheduler comparison plots.
+
+matplotlib is imported only when a plot is drawn, with the headless Agg
+backend unless MPLBACKEND says otherwise, so importing the schedulers (or
+this module) never pays matplotlib's startup or needs a display. Figures
+are written to .png, .svg or .html files.
+"""
+import base64
+import io
+import os
+
+import numpy as np
+
+# Bu sayının üstünde aralıklar piksel çözünürlüğünde birleştirilir
+MAX_INTERVALS = 20000
+# Bu sayının altında her çubuğa etiket yazılır
+MAX_LABELS = 200
+
+
+def _pyplot():
+    import matplotlib
+    if not os.environ.get("MPLBACKEND"):
+        matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
+    return plt
+
+
+def save_figure(fig, path):
+    """Write a figure to path; the format follows the extension (.png, .svg, .html)."""
+    extension = os.path.splitext(path)[1].lower()
+    if extension == ".html":
+        buffer = io.BytesIO()
+        fig.savefig(buffer, format="png", dpi=100, bbox_inches="tight")
+        image = base64.b64encode(buffer.getvalue()).decode("ascii")
+        title = fig.axes[0].get_title() if fig.axes else ""
+        with open(path, "w") as f:
+            f.write(f"<!DOCTYPE html>\n<html><head><meta charset=\"utf-8\"><title>{title}</title></head>\n"
+                    f"<body><img alt=\"{title}\" src=\"data:image/png;base64,{image}\"></body></html>\n")
+    elif extension in (".png", ".svg"):
+        fig.savefig(path, bbox_inches="tight")
+    else:
+        raise ValueError(f"Unknown report format: {extension}")
+    _pyplot().close(fig)
+    return path
+
+
+def lane_segments(log, lanes='job', resolution=0):
+    """Group an IntervalLog into per-lane bars: {lane: (starts, widths, jobs)}.
+
+    With a resolution, bars of a lane that start in the same time bin of that
+    width, or are less than one bin apart, are merged into one (colored by
+    its first job), so a huge trace is drawn with about one bar per bin and
+    lane.
+    """
+    job, cpu, start, end = log.arrays()
+    lane = job if lanes == 'job' else cpu
+    order = np.lexsort((start, lane))
+    lane, job, start, end = lane[order], job[order], start[order], end[order]
+
+    new_lane = np.ones(len(lane), dtype=bool)
+    new_lane[1:] = lane[1:] != lane[:-1]
+    if resolution > 0 and len(lane):
+        # Lane içinde o ana kadarki en geç bitiş: lane'leri zamanda ayrık bloklara kaydırıp tek accumulate
+        shift = np.cumsum(new_lane) * (end.max() - start.min() + 1)
+        reach = np.maximum.accumulate(end + shift) - shift
+        bins = np.floor((start - start.min()) / resolution)
+        new_bar = new_lane.copy()
+        new_bar[1:] |= (start[1:] - reach[:-1] > resolution) | (bins[1:] != bins[:-1])
+        first_rows = np.flatnonzero(new_bar)
+        last_rows = np.append(first_rows[1:], len(lane)) - 1
+        lane, job, start, end = lane[first_rows], job[first_rows], start[first_rows], reach[last_rows]
+        new_lane = new_lane[first_rows]
+
+    segments = {}
+    bounds = np.append(np.flatnonzero(new_lane), len(lane))
+    for first, last in zip(bounds[:-1], bounds[1:]):
+        segments[lane[first].item()] = (start[first:last], end[first:last] - start[first:last], job[first:last])
+    return segments
+
+
+def plot_gantt(log, lanes='job', path=None, ax=None, title="Gantt Chart", lane_name="{}", labels=None,
+               max_intervals=MAX_INTERVALS):
+    """Draw an IntervalLog as a Gantt chart, one broken_barh call per lane.
+
+    lanes='job' puts every job on its own row, lanes='cpu' every CPU (or
+    machine). Traces with more than max_intervals rows are downsampled to
+    the plot's time resolution. labels (one string per log row) are written
+    on the bars of small logs; by default the bars show "J<id>". With a path
+    the figure is saved (see save_figure) and the path is returned,
+    otherwise the axes.
+    """
+    plt = _pyplot()
+    if ax is None:
+        _, ax = plt.subplots(figsize=(12, 3 if lanes == 'job' else 5))
+    if not len(log):
+        return ax if path is None else save_figure(ax.figure, path)
+
+    job, cpu, start, end = log.arrays()
+    resolution = 0
+    if len(log) > max_intervals:
+        resolution = (end.max() - start.min()) / 2000
+    segments = lane_segments(log, lanes, resolution)
+    colors = plt.get_cmap('tab20').colors
+
+    y_of = {lane: y for y, lane in enumerate(sorted(segments))}
+    for lane, (starts, widths, jobs) in segments.items():
+        ax.broken_barh(np.column_stack([starts, widths]), (y_of[lane] - 0.25, 0.5),
+                       facecolors=[colors[j % len(colors)] for j in jobs.tolist()],
+                       edgecolor='black' if resolution == 0 else 'none')
+
+    if len(log) <= MAX_LABELS and resolution == 0:
+        lane = job if lanes == 'job' else cpu
+        if labels is None:
+            labels = [f"J{j}" for j in job.tolist()]
+        for y, s, e, text in zip(lane.tolist(), start.tolist(), end.tolist(), labels):
+            ax.text((s + e) / 2, y_of[y], text, ha='center', va='center', color='white', fontsize=8)
+
+    ax.set_yticks(list(y_of.values()))
+    ax.set_yticklabels([lane_name.format(lane) for lane in y_of])
+    ax.set_xlabel("Time")
+    ax.set_title(title)
+    ax.grid(True, axis='x', linestyle='--', alpha=0.6)
+    if path is not None:
+        return save_figure(ax.figure, path)
+    return ax
+
+
+def plot_scheduler_comparison(results, path="scheduler_comparison.png"):
+    plt = _pyplot()
+    metrics = ["Avg Response Time", "Avg Turnaround Time", "Avg Waiting Time"]
+    schedulers = [res["Scheduler"] for res in results]
+
+    x = np.arange(len(schedulers))
+    width = 0.25
+
+    fig, ax = plt.subplots(figsize=(10, 6))
+
+    for i, metric in enumerate(metrics):
+        values = [res[metric] for res in results]
+        ax.bar(x + i*width, values, width, label=metric)
+
+    ax.set_xlabel("Schedulers")
+    ax.set_ylabel("Average Time (ms)")
+    ax.set_title("Scheduler Comparison")
+    ax.set_xticks(x + width)
+    ax.set_xticklabels(schedulers)
+    ax.legend()
+    ax.grid(axis='y')
+
+    plt.tight_layout()
+    return save_figure(fig, path)
@@ -0,0 +1,278 @@
+import heapq
+import time as time_module
+
+from Job import by_arrival
+from schedlers.DP_algs import OBJECTIVES, job_cost, job_weight, objective_title, objective_weight, \
+    smith_before
+
+
+def srpt_completion_sum(time, releases, bursts):
+    """Sum of completion times of preemptive SRPT from `time` (releases sorted).
+
+    SRPT is optimal for the preemptive relaxation, so this is a lower bound on
+    the sum of completion times of any non-preemptive schedule of the same jobs.
+    """
+    heap = []
+    total = 0
+    i = 0
+    k = len(releases)
+    while i < k or heap:
+        if not heap and time < releases[i]:
+            time = releases[i]
+        while i < k and releases[i] <= time:
+            heapq.heappush(heap, bursts[i])
+            i += 1
+        remaining = heapq.heappop(heap)
+        next_release = releases[i] if i < k else float('inf')
+        if time + remaining <= next_release:
+            time += remaining
+            total += time
+        else:
+            heapq.heappush(heap, remaining - (next_release - time))
+            time = next_release
+    return total
+
+
+def wspt_key(burst, weight):
+    # Smith oranı p / w; ağırlığı 0 olan iş en sona
+    return burst / weight if weight else float('inf')
+
+
+def weighted_completion_bound(time, releases, bursts, weights):
+    """Lower bound on the sum of w_j C_j of jobs from `time` (releases sorted).
+
+    Job splitting (Belouadah, Posner and Potts): run the available job with
+    the largest w_j / p_j, preempting at releases, and charge every piece its
+    share w_j * length / p_j of the weight at the piece's end. That schedule
+    is optimal once jobs may be split, so it bounds every non-preemptive
+    one. The result is raised to sum w_j (r_j + p_j) if that is larger.
+    """
+    heap = []
+    total = 0
+    alone = 0
+    i = 0
+    k = len(releases)
+    while i < k or heap:
+        if not heap and time < releases[i]:
+            time = releases[i]
+        while i < k and releases[i] <= time:
+            heapq.heappush(heap, (wspt_key(bursts[i], weights[i]), i, bursts[i]))
+            alone += weights[i] * (releases[i] + bursts[i])
+            i += 1
+        key, j, remaining = heapq.heappop(heap)
+        next_release = releases[i] if i < k else float('inf')
+        run = min(remaining, next_release - time)
+        time += run
+        # Parça ağırlığı w_j * run / p_j (p_j = 0: tüm ağırlık)
+        total += weights[j] * (run / bursts[j] if bursts[j] else 1) * time
+        if run < remaining:
+            heapq.heappush(heap, (key, j, remaining - run))
+    return max(total, alone)
+
+
+def sequence_cost(jobs, order, objective, time=0):
+    # Verilen sırayı non-preemptive çalıştır: (cost, schedule)
+    cost = 0
+    schedule = []
+    for i in order:
+        job = jobs[i]
+        start = max(time, job.arrival_time)
+        time = start + job.burst_time
+        cost += job_cost(objective, job, start, time)
+        schedule.append((job, start, time))
+    return cost, schedule
+
+
+def nondelay_order(jobs, key):
+    # Non-delay liste çizelgesi: hazır işler arasından key(job)'u en küçük olan
+    order = []
+    heap = []
+    i = 0
+    time = 0
+    while i < len(jobs) or heap:
+        if not heap and time < jobs[i].arrival_time:
+            time = jobs[i].arrival_time
+        while i < len(jobs) and jobs[i].arrival_time <= time:
+            heapq.heappush(heap, (key(jobs[i]), i))
+            i += 1
+        _, j = heapq.heappop(heap)
+        order.append(j)
+        time += jobs[j].burst_time
+    return order
+
+
+def spt_order(jobs):
+    return nondelay_order(jobs, lambda job: job.burst_time)
+
+
+def wspt_order(jobs):
+    # Smith: burst / priority
+    return nondelay_order(jobs, lambda job: wspt_key(job.burst_time, job_weight(job)))
+
+
+def heuristic_orders(jobs, objective):
+    orders = [spt_order(jobs), srpt_order(jobs)]
+    if objective.startswith('weighted_'):
+        orders.append(wspt_order(jobs))
+    return orders
+
+
+def relaxation_bound(time, releases, bursts, weights, objective):
+    """Lower bound on the objective of the remaining jobs (releases sorted, >= time).
+
+    SRPT for the unweighted objectives, weighted_completion_bound otherwise.
+    """
+    if objective.startswith('weighted_'):
+        bound = weighted_completion_bound(time, releases, bursts, weights)
+    else:
+        bound = srpt_completion_sum(time, releases, bursts)
+    if not objective.endswith('turnaround'):
+        # non-preemptive: start - arrival = completion - burst - arrival
+        bound -= sum(weight * burst for weight, burst in zip(weights, bursts))
+    return bound
+
+
+def srpt_order(jobs):
+    # SRTF/SRPT çözümündeki bitiş sırası, non-preemptive sıra olarak
+    heap = []
+    finished = []
+    i = 0
+    time = 0
+    while i < len(jobs) or heap:
+        if not heap and time < jobs[i].arrival_time:
+            time = jobs[i].arrival_time
+        while i < len(jobs) and jobs[i].arrival_time <= time:
+            heapq.heappush(heap, (jobs[i].burst_time, i))
+            i += 1
+        remaining, j = heapq.heappop(heap)
+        next_release = jobs[i].arrival_time if i < len(jobs) else float('inf')
+        if time + remaining <= next_release:
+            time += remaining
+            finished.append(j)
+        else:
+            heapq.heappush(heap, (remaining - (next_release - time), j))
+            time = next_release
+    return finished
+
+
+def bnb_scheduler(jobs, objective='turnaround', node_limit=None, time_limit=None, verbose=False, log=None):
+    """Depth-first branch and bound for the non-preemptive objectives of dp_scheduler.
+
+    Uses the same schedule model as dp_scheduler_bottom_up: any unscheduled job
+    may go next (starting at max(time, arrival)) and only active choices are
+    branched on. The incumbent is seeded with the better of the non-delay SPT
+    and SRPT-completion-order heuristics; a node is cut when its cost plus the
+    SRPT relaxation of the remaining jobs cannot beat the incumbent, or when an
+    earlier node reached the same job set no later and no more expensively.
+    The weighted objectives start from the non-delay WSPT order as well and
+    are bounded with weighted_completion_bound. A job is not branched on
+    right after a job it should precede by Smith's rule if it had already
+    arrived when that job started (as in dp_scheduler_bottom_up).
+
+    node_limit / time_limit (seconds) stop the search early. Returns
+    (schedule, jobs, stats); stats holds the best cost, a proven lower bound,
+    the relative optimality gap and whether the search finished ("optimal").
+    """
+    if objective not in OBJECTIVES:
+        raise ValueError("Unknown objective")
+    started = time_module.perf_counter()
+    jobs = by_arrival(jobs)
+    n = len(jobs)
+    arrivals = [job.arrival_time for job in jobs]
+    bursts = [job.burst_time for job in jobs]
+    weights = [objective_weight(objective, job) for job in jobs]
+    full_mask = (1 << n) - 1
+
+    def lower_bound(time, mask, cost):
+        remaining = [i for i in range(n) if not (mask & (1 << i))]
+        releases = [max(time, arrivals[i]) for i in remaining]
+        rest = [bursts[i] for i in remaining]
+        rest_weights = [weights[i] for i in remaining]
+        bound = relaxation_bound(time, releases, rest, rest_weights, objective)
+        return cost + bound - sum(weights[i] * arrivals[i] for i in remaining)
+
+    best_cost, best_schedule = min(
+        (sequence_cost(jobs, order, objective) for order in heuristic_orders(jobs, objective)),
+        key=lambda item: item[0])
+    root_bound = lower_bound(0, 0, 0) if n else 0
+
+    # mask -> Pareto listesi [(time, cost)]
+    seen = {}
+    # (lower bound, time, mask, cost, path); path = (job index, start, parent path)
+    stack = [(root_bound, 0, 0, 0, None)]
+    nodes = 0
+    finished = True
+
+    while stack:
+        if (node_limit is not None and nodes >= node_limit) or \
+                (time_limit is not None and nodes % 256 == 0 and time_module.perf_counter() - started > time_limit):
+            finished = False
+            break
+
+        bound, time, mask, cost, path = stack.pop()
+        if bound >= best_cost:
+            continue
+        nodes += 1
+
+        if mask == full_mask:
+            best_cost = cost
+            best_schedule = []
+            while path is not None:
+                i, start, path = path
+                best_schedule.append((jobs[i], start, start + bursts[i]))
+            best_schedule.reverse()
+            continue
+
+        front = seen.setdefault(mask, [])
+        if any(t <= time and c <= cost for t, c in front):
+            continue
+        front[:] = [(t, c) for t, c in front if not (time <= t and cost <= c)]
+        front.append((time, cost))
+
+        remaining = [i for i in range(n) if not (mask & (1 << i))]
+        horizon = min(max(time, arrivals[i]) + bursts[i] for i in remaining)
+        children = []
+        for i in remaining:
+            start = max(time, arrivals[i])
+            # p = 0 olan iş ufku kendisi belirleyebilir: start == horizon'da da açılır
+            if start > horizon or (start == horizon and bursts[i] > 0):
+                continue
+            if path is not None and arrivals[i] <= path[1] and smith_before(i, path[0], bursts, weights):
+                continue
+            finish = start + bursts[i]
+            child_cost = cost + job_cost(objective, jobs[i], start, finish)
+            child_mask = mask | (1 << i)
+            child_bound = lower_bound(finish, child_mask, child_cost)
+            if child_bound < best_cost:
+                children.append((child_bound, finish, child_mask, child_cost, (i, start, path)))
+
+        # En umut verici çocuk en son eklenir, ilk o açılır
+        children.sort(key=lambda child: child[0], reverse=True)
+        stack.extend(children)
+
+    if finished:
+        proven_bound = best_cost
+    else:
+        proven_bound = min([best_cost] + [node[0] for node in stack])
+    gap = (best_cost - proven_bound) / best_cost if best_cost else 0.0
+
+    stats = {
+        "cost": best_cost,
+        "lower_bound": proven_bound,
+        "root_bound": root_bound,
+        "gap": gap,
+        "optimal": finished,
+        "nodes": nodes,
+        "elapsed": time_module.perf_counter() - started,
+    }
+
+    if verbose:
+        status = "optimal" if finished else f"gap {gap:.2%}"
+        print(f"Best Total {objective_title(objective)} Time = {best_cost} ({status}, {nodes} nodes)")
+    for job, start, finish in best_schedule:
+        job.start_time = start
+        job.completion_time = finish
+        if log is not None:
+            log.append(job.id, 0, start, finish)
+
+    return best_schedule, jobs, stats
@@ -1,42 +1,102 @@
 import heapq
 
-def CFSScheduler(jobs, time_quantum=2):
-    time = 0
-    jobs = sorted(jobs, key=lambda job: job.arrival_time)
-    job_index = 0
-    ready_queue = []
-    completed_jobs = []
-
-    while job_index < len(jobs) or ready_queue:
-        # Add new arriving jobs
-        while job_index < len(jobs) and jobs[job_index].arrival_time <= time:
-            heapq.heappush(ready_queue, (jobs[job_index].vruntime, jobs[job_index].id, jobs[job_index]))
-            job_index += 1
-
-        if ready_queue:
-            _, _, current_job = heapq.heappop(ready_queue)
-
-            if current_job.start_time is None:
-                current_job.start_time = time
-
-            exec_time = min(time_quantum, current_job.remaining_time)
-            time += exec_time
-            current_job.remaining_time -= exec_time
-            current_job.vruntime += exec_time  # Increase virtual runtime proportional to execution
-
-            # New arrivals during execution
-            while job_index < len(jobs) and jobs[job_index].arrival_time <= time:
-                heapq.heappush(ready_queue, (jobs[job_index].vruntime, jobs[job_index].id, jobs[job_index]))
-                job_index += 1
-
-            if current_job.remaining_time == 0:
-                current_job.completion_time = time
-                completed_jobs.append(current_job)
-            else:
-                heapq.heappush(ready_queue, (current_job.vruntime, current_job.id, current_job))
+from schedlers.engine import simulate
 
+# Linux sched_prio_to_weight: nice -20 .. 19, her adım ~%10 CPU payı
+NICE_TO_WEIGHT = (
+    88761, 71755, 56483, 46273, 36291,
+    29154, 23254, 18705, 14949, 11916,
+    9548, 7620, 6100, 4904, 3906,
+    3121, 2501, 1991, 1586, 1277,
+    1024, 820, 655, 526, 423,
+    335, 272, 215, 172, 137,
+    110, 87, 70, 56, 45,
+    36, 29, 23, 18, 15,
+)
+NICE_0_WEIGHT = 1024
+
+
+def nice_weight(job):
+    return NICE_TO_WEIGHT[getattr(job, 'nice', 0) + 20]
+
+
+def task_weight(job):
+    # nice ağırlığı, job.priority ile ölçeklenmiş (priority=1: Linux ile aynı)
+    priority = getattr(job, 'priority', 1)
+    weight = nice_weight(job)
+    return weight if priority == 1 else weight * priority
+
+
+class CFSPolicy:
+    """Completely Fair Scheduler run queue.
+
+    vruntime grows by exec_time * 1024 / weight, so a job's CPU share follows
+    its weight: the nice weight, scaled by job.priority. Arriving jobs are
+    placed at max(vruntime, min_vruntime) instead of jumping ahead of
+    everyone with vruntime 0. With time_quantum=None the slice is the job's
+    weighted share of the scheduling period,
+    max(sched_latency, runnable * min_granularity), as in Linux; otherwise
+    every slice is time_quantum long. A job whose nice is outside -20..19
+    is rejected with ValueError when it is admitted.
+
+    The run queue is a heap keyed by (vruntime, id): insert and pick-next are
+    O(log n), which is all the engine needs even with 10k+ runnable jobs.
+    """
+
+    def __init__(self, time_quantum=2, sched_latency=6, min_granularity=0.75):
+        self.time_quantum = time_quantum
+        self.sched_latency = sched_latency
+        self.min_granularity = min_granularity
+        self.ready_queue = []
+        self.total_weight = 0
+        self.min_vruntime = 0
+
+    def __len__(self):
+        return len(self.ready_queue)
+
+    def enqueue(self, job):
+        heapq.heappush(self.ready_queue, (job.vruntime, job.id, job))
+        self.total_weight += task_weight(job)
+
+    def admit(self, job, time):
+        # Tablo dışı nice negatif indeksle sarar ya da ortada IndexError verir
+        nice = getattr(job, 'nice', 0)
+        if not -20 <= nice <= 19:
+            raise ValueError(f"Job {job.id}: nice must be in -20..19, got {nice}")
+        job.vruntime = max(job.vruntime, self.min_vruntime)
+        self.enqueue(job)
+
+    def timeslice(self, job):
+        if self.time_quantum is not None:
+            return self.time_quantum
+        # Çalışacak iş de toplam ağırlığın içinde
+        period = max(self.sched_latency, len(self.ready_queue) * self.min_granularity)
+        return max(period * task_weight(job) / self.total_weight, self.min_granularity)
+
+    def pick(self, time, next_arrival):
+        job = self.ready_queue[0][2]
+        quantum = self.timeslice(job)
+        heapq.heappop(self.ready_queue)
+        self.total_weight -= task_weight(job)
+        return job, quantum
+
+    def charge(self, job, exec_time):
+        weight = task_weight(job)
+        if weight == NICE_0_WEIGHT:
+            job.vruntime += exec_time
         else:
-            # CPU idle
-            time += 1
+            job.vruntime += exec_time * NICE_0_WEIGHT / weight
+        # min_vruntime sadece ileri gider: çalışan iş ile kuyruğun en solundakinin minimumu
+        current = job.vruntime
+        if self.ready_queue:
+            current = min(current, self.ready_queue[0][0])
+        self.min_vruntime = max(self.min_vruntime, current)
+
+    def preempt(self, job, time):
+        self.enqueue(job)
+
 
-    return completed_jobs
\ No newline at end of file
+def CFSScheduler(jobs, time_quantum=2, cpus=1, smp='global', stats=None,
+                 sched_latency=6, min_granularity=0.75, log=None):
+    return simulate(jobs, lambda: CFSPolicy(time_quantum, sched_latency, min_granularity), cpus, smp, stats,
+                    log=log)
@@ -0,0 +1,315 @@
+import os
+import time as time_module
+from multiprocessing import Pool, shared_memory
+
+import numpy as np
+
+from Job import by_arrival
+from schedlers.DP_algs import OBJECTIVES, objective_title, objective_weight, smith_before
+
+
+class SharedArrays:
+    # Adlandırılmış 1-boyutlu NumPy dizileri tek bir shared memory bloğunda
+    def __init__(self, fields, name=None):
+        self.fields = fields
+        if name is None:
+            size = sum(np.dtype(dtype).itemsize * length for _, dtype, length in fields)
+            self.shm = shared_memory.SharedMemory(create=True, size=max(1, size))
+        else:
+            self.shm = shared_memory.SharedMemory(name=name)
+        self.arrays = {}
+        offset = 0
+        for field, dtype, length in fields:
+            self.arrays[field] = np.ndarray((length,), dtype=dtype, buffer=self.shm.buf, offset=offset)
+            offset += np.dtype(dtype).itemsize * length
+
+    @property
+    def spec(self):
+        return self.shm.name, self.fields
+
+    def close(self, unlink=False):
+        self.arrays = {}  # view'lar açıkken close() BufferError verir
+        self.shm.close()
+        if unlink:
+            self.shm.unlink()
+
+
+def layer_fields(masks, labels):
+    # CSR: masks[k]'nın etiketleri offsets[k]:offsets[k + 1]
+    return [('masks', np.int64, masks), ('offsets', np.int64, masks + 1),
+            ('time', np.float64, labels), ('cost', np.float64, labels), ('horizon', np.float64, labels),
+            ('parent', np.int64, labels), ('job', np.int64, labels)]
+
+
+def next_masks(masks, n):
+    """Masks reached from the labelled `masks` by adding one of the n jobs, sorted and unique.
+
+    Masks whose labels were all pruned never reach the next layer, so the
+    shards only get work that can produce a label.
+    """
+    # Her parça zaten sıralı: timsort birleştirir, tekrarlar komşu kalır
+    reached = np.concatenate([masks[(masks & (1 << j)) == 0] | (1 << j) for j in range(n)])
+    reached = np.sort(reached, kind='stable')
+    return reached[np.append(True, reached[1:] != reached[:-1])]
+
+
+# Worker'daki sabit iş verileri (_init ile)
+_jobs = {}
+_attached = {}
+
+
+def _init(arrivals, bursts, weights, objective):
+    _jobs.update(arrivals=arrivals, bursts=bursts, weights=weights, objective=objective)
+
+
+def expand_shard(layer, children):
+    """Pareto fronts of the masks `children` (sorted) from the previous layer.
+
+    Pull-style: every child mask looks up each of its predecessors (one bit
+    cleared) in the layer's sorted masks and extends their labels, so shards
+    never write to the same mask. Returns the layer columns of the children
+    that got at least one label.
+    """
+    arrivals = _jobs["arrivals"]
+    bursts = _jobs["bursts"]
+    weights = _jobs["weights"]
+    turnaround = _jobs["objective"].endswith('turnaround')
+    n = len(arrivals)
+    masks = layer["masks"]
+    offsets = layer["offsets"]
+    label_time = layer["time"]
+    label_job = layer["job"]
+
+    columns = {"child": [], "finish": [], "total": [], "parent": [], "job": []}
+    for j in range(n):
+        bit = 1 << j
+        child = np.flatnonzero(children & bit)
+        if not len(child):
+            continue
+        predecessor = children[child] ^ bit
+        position = np.minimum(np.searchsorted(masks, predecessor), len(masks) - 1)
+        found = masks[position] == predecessor
+        child, position = child[found], position[found]
+        first = offsets[position]
+        counts = offsets[position + 1] - first
+        # Her öncül maskenin etiketleri, tek bir indeks dizisine açılmış
+        label = np.repeat(first - np.cumsum(counts) + counts, counts) + np.arange(counts.sum())
+        child = np.repeat(child, counts)
+
+        time = label_time[label]
+        start = np.maximum(time, arrivals[j])
+        horizon = layer["horizon"][label]
+        # Aktif seçim; p = 0 olan iş ufku kendisi belirleyebilir, start == horizon'da da açılır
+        keep = (start < horizon) | ((start == horizon) & (bursts[j] == 0))
+        # Smith: j, önceki iş başladığında gelmişti ve ondan önce gelmeliydi
+        last = label_job[label]
+        has_last = last >= 0
+        last = np.where(has_last, last, 0)
+        keep &= ~(has_last & (arrivals[j] <= time - bursts[last]) & smith_before(j, last, bursts, weights))
+
+        label, child, start = label[keep], child[keep], start[keep]
+        finish = start + bursts[j]
+        total = layer["cost"][label] + weights[j] * ((finish if turnaround else start) - arrivals[j])
+        columns["child"].append(child)
+        columns["finish"].append(finish)
+        columns["total"].append(total)
+        columns["parent"].append(label)
+        columns["job"].append(np.full(len(label), j, dtype=np.int64))
+
+    columns = {name: np.concatenate(parts) if parts else np.zeros(0) for name, parts in columns.items()}
+    child = columns["child"].astype(np.int64)
+    order = np.lexsort((columns["total"], columns["finish"], child))
+    child = child[order]
+    total = columns["total"][order]
+
+    # Aynı maskede daha geç ve daha pahalı olanlar elenir: maske grubu içinde önek minimumu.
+    # Grup numarası ters çevrilip ölçeklenir, böylece tek bir accumulate gruplar arası karışmaz.
+    _, rank = np.unique(total, return_inverse=True)
+    value = (len(children) - child) * (len(order) + 1) + rank.reshape(-1)
+    keep = np.ones(len(value), dtype=bool)
+    keep[1:] = value[1:] < np.minimum.accumulate(value)[:-1]
+    order = order[keep]
+    child = child[keep]
+
+    finish = columns["finish"][order]
+    child_masks = children[child]
+    horizon = np.full(len(finish), np.inf)
+    for i in range(n):
+        remaining = (child_masks & (1 << i)) == 0
+        horizon = np.where(remaining, np.minimum(horizon, np.maximum(finish, arrivals[i]) + bursts[i]), horizon)
+
+    present, first = np.unique(child, return_index=True)
+    return {
+        "masks": children[present],
+        "offsets": np.append(first, len(child)).astype(np.int64),
+        "time": finish,
+        "cost": columns["total"][order],
+        "horizon": horizon,
+        "parent": columns["parent"][order].astype(np.int64),
+        "job": columns["job"][order].astype(np.int64),
+    }
+
+
+def _attach(name, fields):
+    # Katman her adımda değişir: eskisini bırak
+    if name not in _attached:
+        for shared in _attached.values():
+            shared.close()
+        _attached.clear()
+        _attached[name] = SharedArrays(fields, name)
+    return _attached[name]
+
+
+def _run_shard(task):
+    layer_spec, children_spec, start, stop = task
+    layer = _attach(*layer_spec)
+    children = SharedArrays(children_spec[1], children_spec[0])
+    try:
+        result = expand_shard(layer.arrays, children.arrays["masks"][start:stop])
+    finally:
+        children.close()
+    out = SharedArrays(layer_fields(len(result["masks"]), len(result["time"])))
+    for name, array in result.items():
+        out.arrays[name][:] = array
+    spec = out.spec
+    out.close()
+    return spec
+
+
+def merge_shards(results):
+    # Parçalar sıralı maske aralıkları: art arda eklemek katmanı sıralı tutar
+    masks = sum(len(result["masks"]) for result in results)
+    labels = sum(len(result["time"]) for result in results)
+    layer = SharedArrays(layer_fields(masks, labels))
+    arrays = layer.arrays
+    mask_base = 0
+    label_base = 0
+    for result in results:
+        m = len(result["masks"])
+        k = len(result["time"])
+        arrays["masks"][mask_base:mask_base + m] = result["masks"]
+        arrays["offsets"][mask_base:mask_base + m] = result["offsets"][:-1] + label_base
+        for name in ("time", "cost", "horizon", "parent", "job"):
+            arrays[name][label_base:label_base + k] = result[name]
+        mask_base += m
+        label_base += k
+    arrays["offsets"][masks] = labels
+    return layer
+
+
+def parallel_dp_scheduler(jobs, objective='turnaround', processes=None, shard_size=1 << 16, stats=None,
+                          verbose=True, log=None):
+    """dp_scheduler_bottom_up, with every popcount layer split across a process pool.
+
+    Same schedule model, dominance and Smith's-rule pruning, so the optimum
+    is the same. A layer lives in one shared memory block: its masks
+    (sorted), CSR offsets into the label columns (time, cost, horizon,
+    parent label, last job). The masks of the next layer (every labelled
+    mask plus one job, deduplicated) are cut into contiguous shards of at
+    most `shard_size`; a worker builds the Pareto fronts of its shard by
+    pulling from the predecessors of each mask, vectorized over the shard
+    with NumPy, and writes them to a block of its own. The parent
+    concatenates the shards into the next layer and keeps only (parent, job)
+    of every layer to rebuild the schedule.
+
+    processes=1 runs the shards in this process. If a dict is passed as
+    `stats` it gets the label count of every layer and the elapsed time.
+    """
+    if objective not in OBJECTIVES:
+        raise ValueError("Unknown objective")
+    started = time_module.perf_counter()
+    jobs = by_arrival(jobs)
+    n = len(jobs)
+    if n > 62:
+        raise ValueError("parallel_dp_scheduler: at most 62 jobs fit in an int64 mask")
+    arrivals = np.array([job.arrival_time for job in jobs], dtype=np.float64)
+    bursts = np.array([job.burst_time for job in jobs], dtype=np.float64)
+    weights = np.array([objective_weight(objective, job) for job in jobs], dtype=np.float64)
+    processes = processes or os.cpu_count() or 1
+    initargs = (arrivals, bursts, weights, objective)
+
+    # Kök: boş maske, tek etiket
+    layer = SharedArrays(layer_fields(1, 1))
+    root = layer.arrays
+    root["masks"][0] = 0
+    root["offsets"][:] = (0, 1)
+    root["time"][0] = root["cost"][0] = 0
+    root["horizon"][0] = (arrivals + bursts).min() if n else np.inf
+    root["parent"][0] = root["job"][0] = -1
+
+    history = []  # katman başına (parent, job)
+    layer_labels = []
+    pool = None
+    try:
+        if processes > 1 and n:
+            pool = Pool(processes, initializer=_init, initargs=initargs)
+        else:
+            _init(*initargs)
+        for _ in range(n):
+            masks = next_masks(layer.arrays["masks"], n)
+            size = max(1, min(shard_size, -(-len(masks) // processes)))
+            bounds = [(start, min(start + size, len(masks))) for start in range(0, len(masks), size)]
+            if pool is None:
+                results = [expand_shard(layer.arrays, masks[start:stop]) for start, stop in bounds]
+                new_layer = merge_shards(results)
+            else:
+                children = SharedArrays([('masks', np.int64, len(masks))])
+                children.arrays["masks"][:] = masks
+                shards = []
+                try:
+                    tasks = [(layer.spec, children.spec, start, stop) for start, stop in bounds]
+                    for name, fields in pool.imap(_run_shard, tasks):
+                        shards.append(SharedArrays(fields, name))
+                    new_layer = merge_shards([shard.arrays for shard in shards])
+                finally:
+                    children.close(unlink=True)
+                    for shard in shards:
+                        shard.close(unlink=True)
+            layer.close(unlink=True)
+            layer = new_layer
+            history.append((layer.arrays["parent"].copy(), layer.arrays["job"].astype(np.int8)))
+            layer_labels.append(len(history[-1][0]))
+
+        costs = layer.arrays["cost"]
+        best = int(np.argmin(costs)) if n else 0
+        optimal_cost = float(costs[best]) if n else 0
+    finally:
+        if pool is not None:
+            pool.close()
+            pool.join()
+        layer.close(unlink=True)
+
+    # Ebeveyn zinciri: iş sırası; zamanlar sıradan yeniden hesaplanır
+    order = []
+    label = best
+    for parent, job in reversed(history):
+        order.append(int(job[label]))
+        label = parent[label]
+    order.reverse()
+    schedule = []
+    time = 0
+    for i in order:
+        job = jobs[i]
+        start = max(time, job.arrival_time)
+        time = start + job.burst_time
+        schedule.append((job, start, time))
+
+    if stats is not None:
+        stats["layer_labels"] = layer_labels
+        stats["labels"] = sum(layer_labels) + 1
+        stats["processes"] = processes
+        stats["elapsed"] = time_module.perf_counter() - started
+
+    if verbose:
+        print(f"Optimal Total {objective_title(objective)} Time = {optimal_cost:g} "
+              f"({sum(layer_labels) + 1} labels, {processes} processes)")
+        print("\nOptimal Job Schedule:")
+    for job, start, finish in schedule:
+        if verbose:
+            print(f"Job {job.id} : Start at {start:g}, Finish at {finish:g}")
+        job.start_time = start
+        job.completion_time = finish
+        if log is not None:
+            log.append(job.id, 0, start, finish)
+
+    return schedule, jobs
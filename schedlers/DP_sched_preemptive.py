@@ -1,99 +1,204 @@
-import functools
-import matplotlib.pyplot as plt
-import random
-import numpy as np
+import sys
+import time as time_module
+
+from Job import by_arrival
+from schedlers.DP_algs import OBJECTIVES, objective_title, objective_weight
+from workloads import random_jobs, to_jobs
 
 class Job:
-    def __init__(self, id, arrival_time, burst_time, priority):
+    def __init__(self, id, arrival_time, burst_time, priority, nice=0):
         self.id = id
         self.arrival_time = arrival_time
         self.burst_time = burst_time
         self.remaining_time = burst_time
         self.start_time = None
         self.completion_time = None
-        #self.executed_intervals = []  # For Gantt chart
         self.priority = priority
+        self.nice = nice
 
     def __repr__(self):
         return f"Job(id={self.id}, arrival={self.arrival_time}, burst={self.burst_time})"
 
-def preemptive_dp_scheduler(jobs, objective='turnaround', time_quantum=1):
+def preemptive_dp_scheduler(jobs, objective='turnaround', time_quantum=1,
+                            max_states=None, time_limit=None, stats=None, verbose=True, log=None):
+    """Exact preemptive scheduler, branching only at event points.
+
+    A decision is taken when a job arrives or completes: the chosen job runs
+    until the next arrival or its own completion, whichever comes first. For
+    sum-of-completion objectives (turnaround, waiting and their weighted
+    versions, weight = job.priority) an optimal preemptive schedule only ever
+    switches jobs at these points, and a ready job is never run while
+    another ready job has no more work left and at least its weight.
+
+    For the response objective a job dispatched for the first time runs one
+    time_quantum before the next decision. Work left on a started job never
+    delays a later first dispatch (it can always be preempted), so only the
+    set of unstarted jobs is part of the state and leftover work is run in
+    the gaps.
+
+    A state is (time, remaining times); with integral arrivals and bursts the
+    remaining vector is packed into a single mixed-radix integer (otherwise
+    it stays a tuple) and the completed set is implied by it. The
+    memo keeps (cost to go, choice) per state and the schedule is rebuilt by
+    following the choices from the initial state.
+
+    max_states / time_limit (seconds) bound the search and raise RuntimeError
+    when exceeded. If a dict is passed as `stats` it is filled with the number
+    of states, the memo size in bytes and the elapsed time. The execution
+    intervals are returned as the schedule and, if given, appended to `log`
+    (an IntervalLog).
+    """
+    if objective not in OBJECTIVES:
+        raise ValueError("Unknown objective")
+    started = time_module.perf_counter()
+    jobs = by_arrival(jobs)
     n = len(jobs)
-    max_time = sum(job.burst_time for job in jobs) + max(job.arrival_time for job in jobs)
-    state_cache = {}
-
-    def dp(time, completed_mask, remaining_times):
-        key = (time, completed_mask, tuple(remaining_times))
-        if key in state_cache:
-            return state_cache[key]
-
-        if completed_mask == (1 << n) - 1:
-            return 0, []
+    arrivals = [job.arrival_time for job in jobs]
+    bursts = [job.burst_time for job in jobs]
+    weights = [objective_weight(objective, job) for job in jobs]
+
+    # remaining_times -> tek tamsayı (mixed radix); tamsayı olmayan süreler için tuple.
+    # Kesirli bir geliş, dilimi kesip kalan süreleri de kesirli yapar.
+    integral = all(float(value).is_integer() for value in bursts + arrivals)
+    radix = []
+    base = 1
+    for burst in bursts:
+        radix.append(base)
+        base *= int(burst) + 1
+
+    def state_key(time, remaining):
+        if objective == 'response':
+            # Sadece başlamamış işler önemli
+            unstarted = 0
+            for i in range(n):
+                if remaining[i] == bursts[i]:
+                    unstarted |= 1 << i
+            return time, unstarted
+        if integral:
+            return time, sum(int(rem) * r for rem, r in zip(remaining, radix))
+        return time, tuple(remaining)
+
+    def next_arrival_after(time):
+        return next((a for a in arrivals if a > time), None)
+
+    memo = {}
+
+    def dp(time, remaining):
+        key = state_key(time, remaining)
+        if key in memo:
+            return memo[key][0]
+
+        if max_states is not None and len(memo) >= max_states:
+            raise RuntimeError(f"preemptive_dp_scheduler: more than {max_states} states")
+        if time_limit is not None and len(memo) % 1024 == 0 and \
+                time_module.perf_counter() - started > time_limit:
+            raise RuntimeError(f"preemptive_dp_scheduler: time limit of {time_limit}s exceeded")
+
+        if objective == 'response':
+            ready = [i for i in range(n) if remaining[i] == bursts[i] and arrivals[i] <= time]
+        else:
+            ready = [i for i in range(n) if remaining[i] > 0 and arrivals[i] <= time]
+            # Kalan süresi daha az, ağırlığı daha büyük (eşitse indeksi küçük) hazır bir iş
+            # varken diğerini çalıştırmak hiçbir zaman daha iyi değil (yer değiştirme argümanı)
+            ready = [j for j in ready
+                     if not any(remaining[i] <= remaining[j] and weights[i] >= weights[j] and
+                                (remaining[i], -weights[i], i) < (remaining[j], -weights[j], j)
+                                for i in ready)]
+        next_arrival = next_arrival_after(time)
+
+        if not ready:
+            if next_arrival is None:
+                memo[key] = (0, None)
+                return 0
+            # Jump to the next arrival
+            cost = dp(next_arrival, remaining)
+            memo[key] = (cost, None)
+            return cost
 
         min_cost = float('inf')
-        best_schedule = []
-
-        # Identify available jobs
-        ready_jobs = [i for i in range(n) if not (completed_mask & (1 << i)) and jobs[i].arrival_time <= time and remaining_times[i] > 0]
-
-        if not ready_jobs:
-            # Jump to the next arrival
-            next_arrival = min([jobs[i].arrival_time for i in range(n) if jobs[i].arrival_time > time], default=max_time)
-            return dp(next_arrival, completed_mask, remaining_times)
-
-        for i in ready_jobs:
-            exec_time = min(time_quantum, remaining_times[i])
-            new_remaining = list(remaining_times)
-            new_remaining[i] -= exec_time
-            new_time = time + exec_time
-            new_completed = completed_mask
-
-            if new_remaining[i] == 0:
-                completion_time = new_time
-                if objective == 'turnaround':
-                    cost = completion_time - jobs[i].arrival_time
-                elif objective == 'response':
-                    cost = (time - jobs[i].arrival_time) if jobs[i].start_time is None else 0
-                elif objective == 'waiting':
-                    cost = (time - jobs[i].arrival_time) - (jobs[i].burst_time - new_remaining[i])
-                else:
-                    raise ValueError("Unknown objective")
-                new_completed |= (1 << i)
+        best_choice = None
+        for i in ready:
+            if objective == 'response':
+                run = min(time_quantum, remaining[i])
+                cost = weights[i] * (time - arrivals[i])
             else:
+                run = remaining[i]
+                if next_arrival is not None:
+                    run = min(run, next_arrival - time)
                 cost = 0
+                if run == remaining[i]:
+                    cost = time + run - arrivals[i]
+                    if not objective.endswith('turnaround'):
+                        cost -= bursts[i]
+                    cost *= weights[i]
 
-            next_cost, next_schedule = dp(new_time, new_completed, tuple(new_remaining))
-            total_cost = cost + next_cost
+            new_remaining = list(remaining)
+            new_remaining[i] -= run
+            total_cost = cost + dp(time + run, new_remaining)
 
             if total_cost < min_cost:
                 min_cost = total_cost
-                best_schedule = [(jobs[i], time, new_time)] + next_schedule
-
-        state_cache[key] = (min_cost, best_schedule)
-        return state_cache[key]
-
-    init_remaining = tuple(job.burst_time for job in jobs)
-    total_cost, schedule = dp(0, 0, init_remaining)
-
-    print(f"Optimal Total {objective.capitalize()} Time (Preemptive) = {total_cost}")
-    print("\nOptimal Job Schedule:")
+                best_choice = (i, run)
+
+        memo[key] = (min_cost, best_choice)
+        return min_cost
+
+    try:
+        remaining = list(bursts)
+        total_cost = dp(0, remaining) if n else 0
+    finally:
+        if stats is not None:
+            stats["states"] = len(memo)
+            stats["memo_bytes"] = sys.getsizeof(memo) + sum(sys.getsizeof(value) for value in memo.values())
+            stats["elapsed"] = time_module.perf_counter() - started
+
+    # Seçimleri baştan takip ederek çizelgeyi kur (ardışık dilimler birleştirilir)
+    schedule = []
+    time = 0
+    while any(rem > 0 for rem in remaining):
+        entry = memo.get(state_key(time, remaining))
+        if entry is not None and entry[1] is not None:
+            i, run = entry[1]
+        else:
+            # Karar yok: kalan işi (response) çalıştır ya da bir sonraki gelişe atla
+            next_arrival = next_arrival_after(time)
+            background = [i for i in range(n) if 0 < remaining[i] and arrivals[i] <= time]
+            if not background:
+                time = next_arrival
+                continue
+            i = background[0]
+            run = remaining[i]
+            if next_arrival is not None:
+                run = min(run, next_arrival - time)
+
+        if schedule and schedule[-1][0] is jobs[i] and schedule[-1][2] == time:
+            schedule[-1] = (jobs[i], schedule[-1][1], time + run)
+        else:
+            schedule.append((jobs[i], time, time + run))
+        remaining[i] -= run
+        time += run
+
+    if verbose:
+        print(f"Optimal Total {objective_title(objective)} Time (Preemptive) = {total_cost} ({len(memo)} states)")
+        print("\nOptimal Job Schedule:")
+    for job in jobs:
+        job.start_time = None
     for job, start, finish in schedule:
-        print(f"Job {job.id} : Start at {start}, Finish at {finish}")
-        job.start_time =start
+        if verbose:
+            print(f"Job {job.id} : Start at {start}, Finish at {finish}")
+        if job.start_time is None:
+            job.start_time = start
         job.completion_time = finish
+        job.remaining_time = 0
+        if log is not None:
+            log.append(job.id, 0, start, finish)
 
-    return schedule, jobs
+    # SortedJobs bir tuple; çağıranlar eskiden olduğu gibi liste alır
+    return schedule, list(jobs)
 
 
-def generate_random_jobs(n):
-    jobs = []
-    for i in range(1, n + 1):
-        arrival_time = random.randint(0, 20)
-        burst_time = random.randint(1, 10)
-        job = Job(id=i, arrival_time=arrival_time, burst_time=burst_time, priority=1)
-        jobs.append(job)
-    jobs.sort(key=lambda job: job.arrival_time)
-    return jobs
+def generate_random_jobs(n, seed=None):
+    return list(to_jobs(random_jobs(n, seed=seed), Job, priority=1))
 
 if __name__ == "__main__":
     random_jobs = generate_random_jobs(4)
@@ -103,3 +208,8 @@ if __name__ == "__main__":
     print("\n--- Preemptive DP Scheduler (Min Turnaround Time) ---")
     schedule, _ = preemptive_dp_scheduler(random_jobs, objective='turnaround', time_quantum=2)
 
+    print("\n--- Preemptive DP Scheduler (Min Weighted Turnaround Time) ---")
+    for job in random_jobs:
+        job.priority = job.id % 3 + 1
+    schedule, _ = preemptive_dp_scheduler(random_jobs, objective='weighted_turnaround')
+
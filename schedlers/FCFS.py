@@ -1,7 +1,41 @@
+from collections import deque
+
+import numpy as np
+
 import Job
-def FCFSScheduler(jobs: Job):
-    # Geliş zamanına göre sırala
-    jobs.sort(key=lambda job: job.arrival_time)
+from schedlers.engine import simulate
+
+
+class FCFSPolicy:
+    # Tek kuyruk, her iş bitene kadar çalışır (SMP modu için)
+    def __init__(self):
+        self.ready_queue = deque()
+
+    def __len__(self):
+        return len(self.ready_queue)
+
+    def admit(self, job, time):
+        self.ready_queue.append(job)
+
+    def pick(self, time, next_arrival):
+        return self.ready_queue.popleft(), None
+
+    def charge(self, job, exec_time):
+        pass
+
+    def preempt(self, job, time):
+        self.ready_queue.append(job)
+
+
+def FCFSScheduler(jobs: Job, cpus=1, smp='global', stats=None, log=None):
+    if cpus > 1 or stats is not None:
+        return simulate(jobs, FCFSPolicy, cpus, smp, stats, log=log)
+    if isinstance(jobs, Job.JobTable):
+        return _fcfs_table(jobs, log)
+
+    # Geliş zamanına göre sırala (SortedJobs zaten sıralı)
+    if not isinstance(jobs, Job.SortedJobs):
+        jobs.sort(key=lambda job: job.arrival_time)
 
     time = 0
     for job in jobs:
@@ -11,5 +45,25 @@ def FCFSScheduler(jobs: Job):
         time += job.burst_time
         job.remaining_time = 0
         job.completion_time = time
+        if log is not None:
+            log.append(job.id, 0, job.start_time, time)
+
+    return jobs
+
+
+def _fcfs_table(table, log=None):
+    # completion_k = max(completion_{k-1}, arrival_k) + burst_k, açılmış hali:
+    # completion_k = cumsum_k + max(0, max_{j<=k}(arrival_j - cumsum_{j-1}))
+    order = table.arrival_order()
+    arrival = table.arrival_time[order]
+    burst = table.burst_time[order]
+    cumulative = np.cumsum(burst)
+    idle = np.maximum(np.maximum.accumulate(arrival - (cumulative - burst)), 0)
+    completion = cumulative + idle
 
-    return jobs
\ No newline at end of file
+    table.start_time[order] = completion - burst
+    table.completion_time[order] = completion
+    table.remaining_time[:] = 0
+    if log is not None:
+        log.extend(table.id[order], 0, completion - burst, completion)
+    return table
@@ -1,5 +1,7 @@
 import heapq
-import matplotlib.pyplot as plt
+
+from Job import IntervalLog
+from report import plot_gantt
 
 # -----------------------------
 # Operation Class
@@ -17,14 +19,41 @@ class Operation:
         return f"Job {self.job_id} - Op {self.op_index} (M{self.machine_id}, {self.duration})"
 
 
+# -----------------------------
+# Dispatch rules
+# -----------------------------
+# Makine kuyruğundaki bir operasyonun önceliği (küçük olan önce); eşitlikte job id
+DISPATCH_RULES = {
+    'FIFO': lambda op, ready_time, work_left, due_date: ready_time,
+    'SPT': lambda op, ready_time, work_left, due_date: op.duration,
+    'MWKR': lambda op, ready_time, work_left, due_date: -work_left,
+    'EDD': lambda op, ready_time, work_left, due_date: due_date,
+}
+
+
 # -----------------------------
 # Job Shop Scheduler
 # -----------------------------
 class JobShopScheduler:
-    def __init__(self, job_operations):
+    """Greedy job-shop scheduling.
+
+    rule='EST' (default) repeatedly schedules the next operation that can
+    start earliest over all jobs (ties: lowest job id). The candidates are
+    kept per machine, so only the machine and the job that just changed are
+    re-evaluated.
+
+    Any other rule runs an event-driven, non-delay dispatcher: whenever a
+    machine becomes free it starts the queued operation with the smallest
+    priority. rule is a name from DISPATCH_RULES (FIFO, SPT, MWKR, EDD) or a
+    callable (op, ready_time, work_left, due_date) -> priority. due_dates
+    maps job id to due date for EDD; by default it is the job's total work.
+    """
+
+    def __init__(self, job_operations, rule='EST', due_dates=None):
         self.job_operations = job_operations
         self.num_jobs = len(job_operations)
         self.num_machines = max(m for ops in job_operations.values() for (m, _) in ops) + 1
+        self.rule = rule
 
         self.jobs = {
             job_id: [
@@ -33,6 +62,9 @@ class JobShopScheduler:
             ]
             for job_id, ops in job_operations.items()
         }
+        if due_dates is None:
+            due_dates = {job_id: sum(op.duration for op in ops) for job_id, ops in self.jobs.items()}
+        self.due_dates = due_dates
 
         self.machine_available_time = [0] * self.num_machines
         self.job_next_op_index = [0] * self.num_jobs
@@ -41,31 +73,115 @@ class JobShopScheduler:
         self.schedule = []
 
     def run(self):
-        total_operations = sum(len(ops) for ops in self.job_operations.values())
-        scheduled_ops = 0
-
-        while scheduled_ops < total_operations:
-            ready_ops = []
-
-            for job_id in range(self.num_jobs):
-                op_index = self.job_next_op_index[job_id]
-                if op_index < len(self.jobs[job_id]):
-                    op = self.jobs[job_id][op_index]
-                    earliest_start = max(self.machine_available_time[op.machine_id],
-                                         self.job_available_time[op.job_id])
-                    heapq.heappush(ready_ops, (earliest_start, job_id, op))
-
-            if ready_ops:
-                start_time, _, selected_op = heapq.heappop(ready_ops)
-                selected_op.start_time = start_time
-                selected_op.end_time = start_time + selected_op.duration
-
-                self.machine_available_time[selected_op.machine_id] = selected_op.end_time
-                self.job_available_time[selected_op.job_id] = selected_op.end_time
-                self.job_next_op_index[selected_op.job_id] += 1
-
-                self.schedule.append(selected_op)
-                scheduled_ops += 1
+        if self.rule == 'EST':
+            self.run_earliest_start()
+        else:
+            self.dispatch(self.rule)
+
+    def start(self, op, start_time):
+        op.start_time = start_time
+        op.end_time = start_time + op.duration
+
+        self.machine_available_time[op.machine_id] = op.end_time
+        self.job_available_time[op.job_id] = op.end_time
+        self.job_next_op_index[op.job_id] += 1
+
+        self.schedule.append(op)
+
+    def next_op(self, job_id):
+        ops = self.jobs[job_id]
+        op_index = self.job_next_op_index[job_id]
+        return ops[op_index] if op_index < len(ops) else None
+
+    def run_earliest_start(self):
+        # Makine başına: pending = (job hazır olma anı, job id), ready = makine boşalmadan hazır olan job id'ler.
+        # Makinenin en iyi adayı: ready doluysa (makine boş anı, en küçük id), değilse pending'in başı.
+        pending = [[] for _ in range(self.num_machines)]
+        ready = [[] for _ in range(self.num_machines)]
+        version = [0] * self.num_machines
+        candidates = []  # (earliest start, job id, machine, version); eski sürümler atlanır
+
+        def refresh(m):
+            free = self.machine_available_time[m]
+            while pending[m] and pending[m][0][0] <= free:
+                heapq.heappush(ready[m], heapq.heappop(pending[m])[1])
+            version[m] += 1
+            if ready[m]:
+                heapq.heappush(candidates, (free, ready[m][0], m, version[m]))
+            elif pending[m]:
+                heapq.heappush(candidates, (*pending[m][0], m, version[m]))
+
+        def enqueue(job_id):
+            op = self.next_op(job_id)
+            if op is not None:
+                heapq.heappush(pending[op.machine_id], (self.job_available_time[job_id], job_id))
+                refresh(op.machine_id)
+
+        for job_id in range(self.num_jobs):
+            enqueue(job_id)
+
+        while candidates:
+            start_time, job_id, m, v = heapq.heappop(candidates)
+            if v != version[m]:
+                continue
+            if ready[m]:
+                heapq.heappop(ready[m])
+            else:
+                heapq.heappop(pending[m])
+
+            self.start(self.next_op(job_id), start_time)
+            enqueue(job_id)
+            refresh(m)
+
+    def dispatch(self, rule):
+        priority = DISPATCH_RULES[rule] if isinstance(rule, str) else rule
+        # Her operasyon için işin kalan toplam süresi (bu operasyon dahil)
+        work_left = {job_id: [0] * len(ops) for job_id, ops in self.jobs.items()}
+        for job_id, ops in self.jobs.items():
+            total = 0
+            for op in reversed(ops):
+                total += op.duration
+                work_left[job_id][op.op_index] = total
+
+        queues = [[] for _ in range(self.num_machines)]  # (priority, job id, op)
+        running = [None] * self.num_machines
+        events = []  # (end time, machine)
+
+        def enqueue(job_id, time):
+            op = self.next_op(job_id)
+            if op is None:
+                return None
+            key = priority(op, time, work_left[job_id][op.op_index], self.due_dates[job_id])
+            heapq.heappush(queues[op.machine_id], (key, job_id, op))
+            return op.machine_id
+
+        def start_machine(m, time):
+            if running[m] is None and queues[m]:
+                _, _, op = heapq.heappop(queues[m])
+                self.start(op, time)
+                running[m] = op
+                heapq.heappush(events, (op.end_time, m))
+
+        for job_id in range(self.num_jobs):
+            enqueue(job_id, 0)
+        for m in range(self.num_machines):
+            start_machine(m, 0)
+
+        while events:
+            time = events[0][0]
+            finished = []
+            while events and events[0][0] == time:
+                _, m = heapq.heappop(events)
+                finished.append(running[m])
+                running[m] = None
+            # Biten operasyonların işleri sıradaki makinelerine; sadece değişen makineler denenir
+            touched = [op.machine_id for op in finished]
+            for op in finished:
+                target = enqueue(op.job_id, time)
+                if target is not None:
+                    touched.append(target)
+            for m in touched:
+                start_machine(m, time)
 
     def print_schedule(self):
         print("Scheduled Operations:\n")
@@ -82,57 +198,36 @@ class JobShopScheduler:
 # -----------------------------
 # Gantt Chart Plot Function
 # -----------------------------
-def plot_gantt_chart(schedule):
-    fig, ax = plt.subplots(figsize=(12, 5))
-    colors = ['tab:blue', 'tab:orange', 'tab:green', 'tab:red', 'tab:purple', 'tab:gray']
-    machine_y = {}
-
-    for op in schedule:
-        m_id = op.machine_id
-        job_label = f"Job {op.job_id}-Op {op.op_index}"
-        color = colors[op.job_id % len(colors)]
-
-        if m_id not in machine_y:
-            machine_y[m_id] = len(machine_y)
-
-        y = machine_y[m_id]
-        ax.barh(y=y,
-                width=op.duration,
-                left=op.start_time,
-                height=0.5,
-                align='center',
-                color=color,
-                edgecolor='black')
-        ax.text(op.start_time + op.duration / 2, y,
-                job_label,
-                ha='center', va='center', color='white', fontsize=8)
-
-    ax.set_yticks(list(machine_y.values()))
-    ax.set_yticklabels([f"Machine {m}" for m in machine_y.keys()])
-    ax.set_xlabel("Time")
-    ax.set_title("Gantt Chart for Job Shop Scheduling")
-    ax.grid(True, axis='x', linestyle='--', alpha=0.6)
-
-    plt.tight_layout()
-    plt.show()
+def plot_gantt_chart(schedule, path="jss_gantt.png"):
+    # Makine başına tek lane; her operasyon bir satır (birleştirme yok)
+    log = IntervalLog()
+    log.extend([op.job_id for op in schedule], [op.machine_id for op in schedule],
+               [op.start_time for op in schedule], [op.end_time for op in schedule])
+    return plot_gantt(log, lanes='cpu', path=path, title="Gantt Chart for Job Shop Scheduling",
+                      lane_name="Machine {}", labels=[f"Job {op.job_id}-Op {op.op_index}" for op in schedule])
 
 
 # -----------------------------
 # Example: 5 Jobs, 3 Machines
 # -----------------------------
-job_operations = {
-    0: [(0, 4), (1, 3), (2, 2)],
-    1: [(1, 2), (0, 1), (2, 4)],
-    2: [(2, 3), (1, 5), (0, 2)],
-    3: [(0, 2), (2, 1), (1, 3)],
-    4: [(1, 4), (2, 3), (0, 1)],
-}
-
-scheduler = JobShopScheduler(job_operations)
-scheduler.run()
-scheduler.print_schedule()
-
-print(f"\n🧮 Makespan: {scheduler.get_makespan()}")
-
-# Show Gantt chart
-plot_gantt_chart(scheduler.schedule)
+if __name__ == "__main__":
+    job_operations = {
+        0: [(0, 4), (1, 3), (2, 2)],
+        1: [(1, 2), (0, 1), (2, 4)],
+        2: [(2, 3), (1, 5), (0, 2)],
+        3: [(0, 2), (2, 1), (1, 3)],
+        4: [(1, 4), (2, 3), (0, 1)],
+    }
+
+    scheduler = JobShopScheduler(job_operations)
+    scheduler.run()
+    scheduler.print_schedule()
+
+    print(f"\n🧮 Makespan: {scheduler.get_makespan()}")
+
+    # Save Gantt chart
+    plot_gantt_chart(scheduler.schedule)
+
+    # Local search on top of the greedy schedule
+    from schedlers.JSS_opt import tabu_search
+    print(f"🧮 Makespan after tabu search: {tabu_search(scheduler, seed=0)}")
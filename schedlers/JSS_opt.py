@@ -0,0 +1,312 @@
+import random
+import time as time_module
+from collections import deque
+
+
+# -----------------------------
+# Disjunctive graph
+# -----------------------------
+class DisjunctiveGraph:
+    """Job-shop solution as a disjunctive graph with fixed machine orders.
+
+    Operations are numbered 0..n-1. Job arcs (job_prev / job_next) are fixed;
+    a solution is the operation order on every machine (machine_seq). heads[v]
+    is the earliest start of v, tails[v] the longest path from the end of v
+    to the sink, so the makespan is max(heads[v] + duration[v] + tails[v]).
+    """
+
+    def __init__(self, scheduler):
+        self.ops = [op for job_id in sorted(scheduler.jobs) for op in scheduler.jobs[job_id]]
+        n = len(self.ops)
+        self.n = n
+        self.num_machines = scheduler.num_machines
+        self.duration = [op.duration for op in self.ops]
+        self.machine = [op.machine_id for op in self.ops]
+        self.job_prev = [-1] * n
+        self.job_next = [-1] * n
+        for v in range(1, n):
+            if self.ops[v].job_id == self.ops[v - 1].job_id:
+                self.job_prev[v] = v - 1
+                self.job_next[v - 1] = v
+
+        # Başlangıç: makinedeki sıra, verilen çizelgenin başlama zamanlarına göre
+        index = {id(op): v for v, op in enumerate(self.ops)}
+        self.machine_seq = [[] for _ in range(self.num_machines)]
+        for op in sorted(self.ops, key=lambda op: (op.start_time, op.job_id)):
+            self.machine_seq[op.machine_id].append(index[id(op)])
+        self.position = [0] * n
+        for seq in self.machine_seq:
+            for k, v in enumerate(seq):
+                self.position[v] = k
+
+        self.heads = [0] * n
+        self.tails = [0] * n
+        self.makespan = None
+
+    def machine_prev(self, v):
+        k = self.position[v]
+        return self.machine_seq[self.machine[v]][k - 1] if k > 0 else -1
+
+    def machine_next(self, v):
+        seq = self.machine_seq[self.machine[v]]
+        k = self.position[v]
+        return seq[k + 1] if k + 1 < len(seq) else -1
+
+    def evaluate(self):
+        """Recompute heads, tails and the makespan; False if the orders contain a cycle."""
+        n = self.n
+        duration, heads, tails = self.duration, self.heads, self.tails
+        indegree = [(self.job_prev[v] != -1) + (self.position[v] > 0) for v in range(n)]
+        queue = deque(v for v in range(n) if indegree[v] == 0)
+        order = []
+        while queue:
+            v = queue.popleft()
+            order.append(v)
+            head = 0
+            for u in (self.job_prev[v], self.machine_prev(v)):
+                if u != -1 and heads[u] + duration[u] > head:
+                    head = heads[u] + duration[u]
+            heads[v] = head
+            for w in (self.job_next[v], self.machine_next(v)):
+                if w != -1:
+                    indegree[w] -= 1
+                    if indegree[w] == 0:
+                        queue.append(w)
+        if len(order) < n:
+            return False
+
+        for v in reversed(order):
+            tail = 0
+            for w in (self.job_next[v], self.machine_next(v)):
+                if w != -1 and tails[w] + duration[w] > tail:
+                    tail = tails[w] + duration[w]
+            tails[v] = tail
+        self.makespan = max((heads[v] + duration[v] + tails[v] for v in range(n)), default=0)
+        return True
+
+    def critical_blocks(self):
+        # Kritik yol (sondan geriye), sonra aynı makinedeki ardışık operasyonlar blok olur
+        heads, duration = self.heads, self.duration
+        v = next(v for v in range(self.n) if heads[v] + duration[v] + self.tails[v] == self.makespan
+                 and self.tails[v] == 0)
+        path = [v]
+        while heads[v] > 0:
+            for u in (self.machine_prev(v), self.job_prev[v]):
+                if u != -1 and heads[u] + duration[u] == heads[v]:
+                    v = u
+                    break
+            path.append(v)
+        path.reverse()
+
+        blocks = [[path[0]]]
+        for u, v in zip(path, path[1:]):
+            if self.machine[u] == self.machine[v] and self.position[v] == self.position[u] + 1:
+                blocks[-1].append(v)
+            else:
+                blocks.append([v])
+        return blocks
+
+    def estimate(self, segment, first):
+        """Makespan estimate after re-ordering machine positions first.. as segment.
+
+        Heads are pushed forward through the new order and tails backward,
+        using the current values of everything outside the segment (the usual
+        head/tail approximation, exact for adjacent swaps on a critical path).
+        """
+        heads, tails, duration = self.heads, self.tails, self.duration
+        seq = self.machine_seq[self.machine[segment[0]]]
+        last = first + len(segment) - 1
+        before = seq[first - 1] if first > 0 else -1
+        after = seq[last + 1] if last + 1 < len(seq) else -1
+
+        new_heads = []
+        head = heads[before] + duration[before] if before != -1 else 0
+        for v in segment:
+            u = self.job_prev[v]
+            if u != -1 and heads[u] + duration[u] > head:
+                head = heads[u] + duration[u]
+            new_heads.append(head)
+            head += duration[v]
+
+        estimate = 0
+        tail = tails[after] + duration[after] if after != -1 else 0
+        for v, head in zip(reversed(segment), reversed(new_heads)):
+            w = self.job_next[v]
+            if w != -1 and tails[w] + duration[w] > tail:
+                tail = tails[w] + duration[w]
+            estimate = max(estimate, head + duration[v] + tail)
+            tail += duration[v]
+        return estimate
+
+    def apply(self, segment, first):
+        seq = self.machine_seq[self.machine[segment[0]]]
+        previous = seq[first:first + len(segment)]
+        seq[first:first + len(segment)] = segment
+        for k, v in enumerate(segment, first):
+            self.position[v] = k
+        return previous
+
+    def write_back(self, scheduler):
+        # Yarı-aktif çizelge: her operasyon head zamanında başlar
+        for v, op in enumerate(self.ops):
+            op.start_time = self.heads[v]
+            op.end_time = self.heads[v] + op.duration
+        scheduler.schedule = sorted(self.ops, key=lambda op: (op.start_time, op.machine_id))
+        for op in scheduler.schedule:
+            scheduler.machine_available_time[op.machine_id] = op.end_time
+            scheduler.job_available_time[op.job_id] = op.end_time
+            scheduler.job_next_op_index[op.job_id] = op.op_index + 1
+
+
+# -----------------------------
+# Neighbourhoods
+# -----------------------------
+def block_moves(graph, blocks):
+    """N7 moves (which include the N5 swaps) as (segment, first position) pairs.
+
+    In each critical block an operation is moved to the start or end of the
+    block, and the first/last operation is moved to any inner position. The
+    head of the first block and the tail of the last block are left alone:
+    changing them cannot shorten the critical path.
+    """
+    moves = {}
+    for b, block in enumerate(blocks):
+        k = len(block)
+        if k < 2:
+            continue
+        first = graph.position[block[0]]
+        # İlk bloğun başı ve son bloğun sonu değişmemeli
+        head_free = b > 0
+        tail_free = b < len(blocks) - 1
+        candidates = []
+        for j in range(1, k):
+            if head_free:
+                # block[j] bloğun başına
+                candidates.append([block[j]] + block[:j] + block[j + 1:])
+                if j < k - 1 or tail_free:
+                    # block[0] block[j]'nin arkasına
+                    candidates.append(block[1:j + 1] + [block[0]] + block[j + 1:])
+        for j in range(k - 1):
+            if tail_free:
+                # block[j] bloğun sonuna
+                candidates.append(block[:j] + block[j + 1:] + [block[j]])
+                if j > 0 or head_free:
+                    # block[-1] block[j]'nin önüne
+                    candidates.append(block[:j] + [block[-1]] + block[j:-1])
+        for segment in candidates:
+            if segment != block:
+                moves[tuple(segment)] = first
+    return list(moves.items())
+
+
+def reversed_pairs(old, new):
+    # Sırası değişen (a, b) çiftleri: eskiden a b'den önceydi, şimdi sonra
+    rank = {v: k for k, v in enumerate(new)}
+    return [(a, b) for i, a in enumerate(old) for b in old[i + 1:] if rank[a] > rank[b]]
+
+
+# -----------------------------
+# Tabu search
+# -----------------------------
+def tabu_search(scheduler, max_iter=2000, time_limit=None, tabu_tenure=10, max_no_improve=500,
+                seed=None, stats=None):
+    """Improve a JobShopScheduler's schedule with tabu search over N7 block moves.
+
+    The scheduler must have been run; its operations and schedule are
+    replaced by the best schedule found. Moves are ranked by a head/tail
+    makespan estimate instead of re-simulating each neighbour; only the
+    chosen move triggers a full O(n) head/tail update. A move is tabu while
+    it would restore an operation order it reversed during the last
+    tabu_tenure (+ random jitter) iterations, unless its estimate beats the
+    best makespan. After max_no_improve iterations without improvement the
+    search restarts from the best solution with a few random moves.
+
+    Stops after max_iter iterations or time_limit seconds. Returns the best
+    makespan; `stats` (a dict) receives initial/best makespan, iterations,
+    improvements, restarts and elapsed time.
+    """
+    started = time_module.perf_counter()
+    rng = random.Random(seed)
+    graph = DisjunctiveGraph(scheduler)
+    graph.evaluate()
+    initial = best = graph.makespan
+    best_seq = [list(seq) for seq in graph.machine_seq]
+
+    tabu = {}  # (a, b) -> a'nın tekrar b'den önce gelmesi bu iterasyona kadar yasak
+    iteration = improvements = restarts = since_best = 0
+    while iteration < max_iter:
+        if time_limit is not None and time_module.perf_counter() - started > time_limit:
+            break
+        iteration += 1
+
+        moves = block_moves(graph, graph.critical_blocks())
+        if not moves:
+            break  # Tek blok: kritik yol kısaltılamaz
+
+        scored = []
+        for segment, first in moves:
+            estimate = graph.estimate(segment, first)
+            old = graph.machine_seq[graph.machine[segment[0]]][first:first + len(segment)]
+            is_tabu = any(tabu.get((b, a), 0) >= iteration for a, b in reversed_pairs(old, list(segment)))
+            if not is_tabu or estimate < best:
+                scored.append((estimate, rng.random(), segment, first))
+        if not scored:
+            scored = [(0, 0, *rng.choice(moves))]
+        scored.sort()
+
+        for _, _, segment, first in scored:
+            old = graph.apply(list(segment), first)
+            if graph.evaluate():
+                break
+            graph.apply(old, first)  # döngü oluştu, geri al
+        else:
+            graph.evaluate()
+            break
+
+        tenure = rng.randint(tabu_tenure, tabu_tenure + tabu_tenure // 2)
+        for a, b in reversed_pairs(old, list(segment)):
+            tabu[(a, b)] = iteration + tenure
+
+        if graph.makespan < best:
+            best = graph.makespan
+            best_seq = [list(seq) for seq in graph.machine_seq]
+            improvements += 1
+            since_best = 0
+        else:
+            since_best += 1
+            if since_best >= max_no_improve:
+                restarts += 1
+                since_best = 0
+                tabu.clear()
+                _restore(graph, best_seq)
+                for _ in range(rng.randint(2, 5)):
+                    moves = block_moves(graph, graph.critical_blocks())
+                    if not moves:
+                        break
+                    segment, first = rng.choice(moves)
+                    old = graph.apply(list(segment), first)
+                    if not graph.evaluate():
+                        graph.apply(old, first)
+                        graph.evaluate()
+
+    _restore(graph, best_seq)
+    graph.write_back(scheduler)
+
+    if stats is not None:
+        stats.update({
+            "initial_makespan": initial,
+            "makespan": best,
+            "iterations": iteration,
+            "improvements": improvements,
+            "restarts": restarts,
+            "elapsed": time_module.perf_counter() - started,
+        })
+    return best
+
+
+def _restore(graph, machine_seq):
+    graph.machine_seq = [list(seq) for seq in machine_seq]
+    for seq in graph.machine_seq:
+        for k, v in enumerate(seq):
+            graph.position[v] = k
+    graph.evaluate()
@@ -1,60 +1,139 @@
+import math
 from collections import deque
 
-def MLFQScheduler(jobs, queue_levels=3, time_quantums=[4, 8, None]):
-    time = 0
-    queues = [deque() for _ in range(queue_levels)]
-    jobs = sorted(jobs, key=lambda job: job.arrival_time)  # arrival time göre sırala
-    job_index = 0
-    completed_jobs = []
-
-    while job_index < len(jobs) or any(queues):
-        # Yeni gelen işleri ilk kuyruğa ekle
-        while job_index < len(jobs) and jobs[job_index].arrival_time <= time:
-            queues[0].append(jobs[job_index])
-            job_index += 1
-
-        # Çalışacak iş bul
-        current_job = None
-        current_queue_level = None
-        for level, queue in enumerate(queues):
-            if queue:
-                current_job = queue.popleft()
-                current_queue_level = level
-                break
-
-        if current_job:
-            if current_job.start_time is None:
-                current_job.start_time = time
-
-            quantum = time_quantums[current_queue_level]
-            if quantum is None:
-                # En düşük seviyede FCFS gibi çalış
-                exec_time = current_job.remaining_time
-            else:
-                exec_time = min(quantum, current_job.remaining_time)
-
-            time += exec_time
-            current_job.remaining_time -= exec_time
-
-            # Arada yeni işler gelirse onları ekleyelim
-            while job_index < len(jobs) and jobs[job_index].arrival_time <= time:
-                queues[0].append(jobs[job_index])
-                job_index += 1
-
-            if current_job.remaining_time == 0:
-                current_job.completion_time = time
-                completed_jobs.append(current_job)
-            else:
-                # Bir alt seviyeye düşür
-                if current_queue_level + 1 < queue_levels:
-                    current_job.current_queue += 1
-                    queues[current_queue_level + 1].append(current_job)
-                else:
-                    # Zaten en alttaysa tekrar aynı kuyrukta kalır
-                    queues[current_queue_level].append(current_job)
-
-        else:
-            # CPU boş, ileri sar
-            time += 1
-
-    return completed_jobs
\ No newline at end of file
+from schedlers.engine import simulate
+
+
+class MLFQPolicy:
+    """Multi-level feedback queue.
+
+    A job that has used up the allotment of its level (total run time there,
+    defaults to the level's quantum) is demoted one level. Every
+    boost_interval time units all jobs go back to the top level, so long jobs
+    are not starved. Non-empty levels are kept in a bitmap; the top one is
+    found with bm & -bm, so dispatch does not scan the levels.
+
+    New jobs enter at the top level unless their priority is below 1: a job
+    with priority 2^-k starts k levels down (capped at the bottom level).
+
+    stats() gives per-level run time, wait time and dispatch counts, plus the
+    number of demotions and boosts.
+    """
+
+    def __init__(self, queue_levels=3, time_quantums=[4, 8, None], boost_interval=None, allotments=None):
+        self.queue_levels = queue_levels
+        self.time_quantums = time_quantums
+        self.allotments = time_quantums if allotments is None else allotments
+        self.boost_interval = boost_interval
+        self.next_boost = boost_interval
+        self.queues = [deque() for _ in range(queue_levels)]
+        self.bitmap = 0
+        self.size = 0
+        self.boosts = 0
+        self.last_boost = None
+
+        self.level_time = [0] * queue_levels
+        self.level_wait = [0] * queue_levels
+        self.level_dispatches = [0] * queue_levels
+        self.demotions = 0
+
+    def __len__(self):
+        return self.size
+
+    def enqueue(self, job, time):
+        level = job.current_queue
+        self.queues[level].append((job, time))
+        self.bitmap |= 1 << level
+        self.size += 1
+
+    def initial_level(self, job):
+        # priority >= 1 en üstten başlar; 1/2, 1/4, ... birer seviye aşağıdan
+        priority = getattr(job, 'priority', 1)
+        if priority >= 1:
+            return 0
+        if priority <= 0:
+            return self.queue_levels - 1
+        return min(self.queue_levels - 1, math.ceil(math.log2(1 / priority)))
+
+    def admit(self, job, time):
+        # Yeni gelen işler önceliklerine göre (varsayılan: ilk kuyruk)
+        job.current_queue = self.initial_level(job)
+        job.allotment_used = 0
+        self.enqueue(job, time)
+
+    def boost(self, time):
+        # Herkesi en üst seviyeye taşı (geliş sırası seviye sırasına göre korunur)
+        top = self.queues[0]
+        for level in range(1, self.queue_levels):
+            queue = self.queues[level]
+            while queue:
+                job, since = queue.popleft()
+                self.level_wait[level] += time - since
+                job.current_queue = 0
+                top.append((job, time))
+        for job, _ in top:
+            job.allotment_used = 0
+        self.bitmap = 1 if top else 0
+        self.boosts += 1
+        self.last_boost = time
+
+    def check_boost(self, time):
+        if self.boost_interval is not None and time >= self.next_boost:
+            self.boost(time)
+            self.next_boost = (time // self.boost_interval + 1) * self.boost_interval
+
+    def retune(self, time):
+        # Parametreler değişti (engine.fork): sıradaki boost yeni aralığa göre.
+        # Vadesi gelmiş ama henüz uygulanmamış boost (next_boost <= time) korunur.
+        if self.boost_interval is None:
+            self.next_boost = None
+        elif self.next_boost is None or self.next_boost > time:
+            self.next_boost = (time // self.boost_interval + 1) * self.boost_interval
+
+    def pick(self, time, next_arrival):
+        self.check_boost(time)
+        level = (self.bitmap & -self.bitmap).bit_length() - 1
+        queue = self.queues[level]
+        job, since = queue.popleft()
+        if not queue:
+            self.bitmap &= ~(1 << level)
+        self.size -= 1
+        self.level_wait[level] += time - since
+        self.level_dispatches[level] += 1
+        job.dispatch_time = time
+        # None: en düşük seviyede FCFS gibi çalış
+        return job, self.time_quantums[level]
+
+    def charge(self, job, exec_time):
+        self.level_time[job.current_queue] += exec_time
+        job.allotment_used += exec_time
+
+    def preempt(self, job, time):
+        self.check_boost(time)
+        allotment = self.allotments[job.current_queue]
+        if self.last_boost is not None and self.last_boost > job.dispatch_time:
+            # Çalışırken boost oldu
+            job.current_queue = 0
+            job.allotment_used = 0
+        elif allotment is not None and job.allotment_used >= allotment:
+            # Hakkını doldurduysa bir alt seviyeye düşür, zaten en alttaysa aynı kuyrukta kalır
+            if job.current_queue + 1 < self.queue_levels:
+                job.current_queue += 1
+                self.demotions += 1
+            job.allotment_used = 0
+        self.enqueue(job, time)
+
+    def stats(self):
+        return {
+            "level_time": list(self.level_time),
+            "level_wait": list(self.level_wait),
+            "level_dispatches": list(self.level_dispatches),
+            "demotions": self.demotions,
+            "boosts": self.boosts,
+        }
+
+
+def MLFQScheduler(jobs, queue_levels=3, time_quantums=[4, 8, None], cpus=1, smp='global', stats=None,
+                  boost_interval=None, allotments=None, log=None):
+    return simulate(jobs, lambda: MLFQPolicy(queue_levels, time_quantums, boost_interval, allotments),
+                    cpus, smp, stats, log=log)
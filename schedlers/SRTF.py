@@ -1,65 +1,117 @@
-from collections import deque
+import copy
 import heapq
 
-def SRTFScheduler(jobs, time_quantum=4):
-    time = 0
-    jobs = sorted(jobs, key=lambda job: job.arrival_time)
-    job_index = 0
-    ready_queue = []
-    completed_jobs = []
-
-    while job_index < len(jobs) or ready_queue:
-        # Add jobs that have arrived
-        while job_index < len(jobs) and jobs[job_index].arrival_time <= time:
-            heapq.heappush(ready_queue, (jobs[job_index].remaining_time, jobs[job_index].id, jobs[job_index]))
-            job_index += 1
-
-        if ready_queue:
-            _, _, current_job = heapq.heappop(ready_queue)
-
-            if current_job.start_time is None:
-                current_job.start_time = time
-
-            exec_time = min(time_quantum, current_job.remaining_time)
-            time += exec_time
-            current_job.remaining_time -= exec_time
-
-            # New jobs might arrive while executing
-            while job_index < len(jobs) and jobs[job_index].arrival_time <= time:
-                heapq.heappush(ready_queue, (jobs[job_index].remaining_time, jobs[job_index].id, jobs[job_index]))
-                job_index += 1
-
-            if current_job.remaining_time == 0:
-                current_job.completion_time = time
-                completed_jobs.append(current_job)
-            else:
-                # Still work to do, push back into ready queue
-                heapq.heappush(ready_queue, (current_job.remaining_time, current_job.id, current_job))
-
+from Job import JobTable
+from schedlers.engine import simulate
+
+
+def weighted_remaining(job, remaining=None):
+    # Kalan süre / ağırlık; ağırlığı 0 olan iş en sona
+    if remaining is None:
+        remaining = job.remaining_time
+    priority = getattr(job, 'priority', 1)
+    if priority == 1:
+        return remaining
+    return remaining / priority if priority else float('inf')
+
+
+class SRTFPolicy:
+    """Shortest remaining time first.
+
+    The choice is re-evaluated every time_quantum. time_quantum=None opts
+    into exact SRPT: the running job keeps the CPU until the next arrival
+    (the only moment a shorter job can show up) and is then compared with
+    the head of the heap. It is held outside the heap while it
+    wins, ties included, so heap operations are proportional to arrivals plus
+    completions.
+
+    Jobs are ordered by remaining time / priority (weighted SRPT, Smith's
+    rule on the remaining work), which is plain SRTF when every priority is 1.
+    A running job's ratio only shrinks, so the exact mode still only needs to
+    look at arrivals.
+    """
+
+    def __init__(self, time_quantum=4):
+        self.time_quantum = time_quantum
+        self.ready_queue = []
+        self.current = None  # exact modda kesilmiş ama heap'e konmamış iş
+
+    def __len__(self):
+        return len(self.ready_queue) + (self.current is not None)
+
+    @property
+    def preempt_on_arrival(self):
+        # Exact SRPT: SMP ve online sürücüde gelen iş sadece geçtiği işi keser
+        return self.time_quantum is None
+
+    def displaces(self, job, remaining):
+        # Kuyruktaki en iyi iş, `remaining` kadar işi kalmış çalışan işi geçiyor mu (eşitlik geçmez)
+        best = float('inf')
+        if self.current is not None:
+            best = weighted_remaining(self.current)
+        if self.ready_queue:
+            best = min(best, self.ready_queue[0][0])
+        return best < weighted_remaining(job, remaining)
+
+    def admit(self, job, time):
+        heapq.heappush(self.ready_queue, (weighted_remaining(job), job.id, job))
+
+    def pick(self, time, next_arrival):
+        if self.time_quantum is not None:
+            _, _, job = heapq.heappop(self.ready_queue)
+            return job, self.time_quantum
+
+        job = self.current
+        self.current = None
+        if job is None:
+            _, _, job = heapq.heappop(self.ready_queue)
+        elif self.ready_queue and self.ready_queue[0][0] < weighted_remaining(job):
+            # Daha kısa (ağırlıklı) bir iş geldi: şimdi preempt et (eşitlikte çalışan devam eder)
+            job = heapq.heappushpop(self.ready_queue, (weighted_remaining(job), job.id, job))[2]
+        # Bir sonraki gelişe kadar kimse onu geçemez
+        return job, None if next_arrival is None else next_arrival - time
+
+    def charge(self, job, exec_time):
+        pass
+
+    def preempt(self, job, time):
+        if self.time_quantum is None and self.current is None:
+            self.current = job
         else:
-            # CPU is idle, fast-forward time
-            time += 1
+            # Still work to do, push back into ready queue
+            heapq.heappush(self.ready_queue, (weighted_remaining(job), job.id, job))
 
-    return completed_jobs
 
+def SRTFScheduler(jobs, time_quantum=4, cpus=1, smp='global', stats=None, log=None):
+    return simulate(jobs, lambda: SRTFPolicy(time_quantum), cpus, smp, stats, log=log)
 
 
-def min_response_time_scheduler(jobs):
-    import copy
-    jobs = copy.deepcopy(jobs)
+
+def _non_preemptive_scheduler(jobs, key):
+    # Geliş sırasına göre imleç + hazır işler için heap; boşta kalınca bir sonraki gelişe atla
+    table = jobs if isinstance(jobs, JobTable) else None
+    if table is not None:
+        # Tablo yerinde planlanır (engine gibi): satırlar Job'a çevrilir, sonuçlar geri yazılır
+        jobs = table.jobs(table.arrival_order())
+    else:
+        # Alanlar skaler: sığ kopya yeterli, girdi değişmez
+        jobs = [copy.copy(job) for job in jobs]
+    arrival_order = sorted(range(len(jobs)), key=lambda i: jobs[i].arrival_time)
+    next_index = 0
+    ready = []
     time = 0
-    scheduled_jobs = []
     completed_jobs = []
 
     while len(completed_jobs) < len(jobs):
-        # Hazır işlerin listesi
-        ready_jobs = [job for job in jobs if job.arrival_time <= time and job not in completed_jobs]
+        # Hazır işleri heap'e ekle (eşitlikte giriş sırası korunur)
+        while next_index < len(jobs) and jobs[arrival_order[next_index]].arrival_time <= time:
+            i = arrival_order[next_index]
+            heapq.heappush(ready, (key(jobs[i]), i))
+            next_index += 1
 
-        if ready_jobs:
-            # Response Time minimize etmek için: Arrival time'ı en küçük olanı seç
-            # (yeni gelenleri hızlı başlatmak mantıklı)
-            ready_jobs.sort(key=lambda job: job.arrival_time)
-            current_job = ready_jobs[0]
+        if ready:
+            _, i = heapq.heappop(ready)
+            current_job = jobs[i]
 
             if current_job.start_time is None:
                 current_job.start_time = time
@@ -69,37 +121,21 @@ def min_response_time_scheduler(jobs):
             completed_jobs.append(current_job)
 
         else:
-            # CPU idle
-            time += 1
+            # CPU idle: bir sonraki gelişe atla
+            time = max(time, jobs[arrival_order[next_index]].arrival_time)
 
+    if table is not None:
+        table.write_back(completed_jobs)
+        return table
     return completed_jobs
 
 
-def min_turnaround_time_scheduler(jobs):
-    import copy
-    jobs = copy.deepcopy(jobs)
-    time = 0
-    scheduled_jobs = []
-    completed_jobs = []
-
-    while len(completed_jobs) < len(jobs):
-        # Hazır işlerin listesi
-        ready_jobs = [job for job in jobs if job.arrival_time <= time and job not in completed_jobs]
-
-        if ready_jobs:
-            # Turnaround Time minimize etmek için: Burst time'ı en küçük olanı seç
-            ready_jobs.sort(key=lambda job: job.burst_time)
-            current_job = ready_jobs[0]
-
-            if current_job.start_time is None:
-                current_job.start_time = time
-
-            time += current_job.burst_time
-            current_job.completion_time = time
-            completed_jobs.append(current_job)
+def min_response_time_scheduler(jobs):
+    # Response Time minimize etmek için: Arrival time'ı en küçük olanı seç
+    # (yeni gelenleri hızlı başlatmak mantıklı)
+    return _non_preemptive_scheduler(jobs, key=lambda job: job.arrival_time)
 
-        else:
-            # CPU idle
-            time += 1
 
-    return completed_jobs
\ No newline at end of file
+def min_turnaround_time_scheduler(jobs):
+    # Turnaround Time minimize etmek için: Burst time'ı en küçük olanı seç
+    return _non_preemptive_scheduler(jobs, key=lambda job: job.burst_time)
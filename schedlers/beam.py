@@ -0,0 +1,157 @@
+import time as time_module
+
+import numpy as np
+
+from Job import by_arrival
+from schedlers.BnB import heuristic_orders, relaxation_bound, sequence_cost
+from schedlers.DP_algs import OBJECTIVES, objective_title, objective_weight
+
+
+def sequence_completions(start, releases, bursts):
+    """Completion times of job sequences run back to back from `start`.
+
+    releases / bursts are (k, m) arrays, one sequence per row; start is a
+    scalar or a (k,) array. C_j = max(C_{j-1}, r_j) + p_j unrolls to
+    P_j + max(start, max_{i<=j} (r_i - P_{i-1})) with P the prefix sums of p,
+    so every row is evaluated with one cumsum and one cumulative max.
+    """
+    prefix = np.cumsum(bursts, axis=1)
+    ready = np.maximum.accumulate(releases - prefix + bursts, axis=1)
+    return prefix + np.maximum(ready, np.reshape(start, (-1, 1)))
+
+
+def beam_scheduler(jobs, objective='turnaround', beam_width=16, branching=8, time_limit=None, seed=0,
+                   verbose=False, log=None):
+    """Beam search over dp_scheduler's (time, completed mask) states, for large n.
+
+    Uses the schedule model of dp_scheduler_bottom_up and bnb_scheduler: any
+    unscheduled job may go next and starts at max(time, arrival). Every
+    state carries a rollout: an order for its remaining jobs, initially the
+    best of bnb_scheduler's heuristic orders. A child takes
+    one of the `branching` active jobs that finish earliest (plus the
+    rollout's own next job) and keeps the rest of the parent's rollout, so
+    its score is the exact cost of a complete schedule. All children of a
+    layer are scored at once with NumPy (see sequence_completions); the
+    `beam_width` best distinct job sets survive. The best score never gets
+    worse than the starting heuristic, and the search can stop at any layer
+    (time_limit, seconds) with the best complete schedule seen.
+
+    Returns (schedule, jobs, stats) like bnb_scheduler; stats holds the best
+    cost, the heuristic it started from, the relaxation lower bound of
+    bnb_scheduler (SRPT, or weighted_completion_bound for the weighted
+    objectives) and the relative gap between them.
+    """
+    if objective not in OBJECTIVES:
+        raise ValueError("Unknown objective")
+    started = time_module.perf_counter()
+    jobs = by_arrival(jobs)
+    n = len(jobs)
+    arrivals = np.array([job.arrival_time for job in jobs], dtype=np.float64)
+    bursts = np.array([job.burst_time for job in jobs], dtype=np.float64)
+    weights = np.array([objective_weight(objective, job) for job in jobs], dtype=np.float64)
+    # response / waiting: start - arrival = completion - burst - arrival
+    offset = arrivals if objective.endswith('turnaround') else arrivals + bursts
+
+    heuristic_cost, order = min(
+        ((sequence_cost(jobs, order, objective)[0], order) for order in heuristic_orders(jobs, objective)),
+        key=lambda item: item[0])
+    lower_bound = 0
+    if n:
+        lower_bound = relaxation_bound(0, arrivals.tolist(), bursts.tolist(), weights.tolist(), objective) - \
+            weights @ arrivals
+
+    # Aynı iş kümesine ulaşan durumları ayırt etmek için Zobrist hash
+    keys = np.random.default_rng(seed).integers(1, 2**63, n, dtype=np.int64)
+
+    # Beam: her satır bir durum; rollout = kalan işlerin sırası
+    rollout = np.array([order], dtype=np.intp).reshape(1, n)
+    clock = np.zeros(1)
+    cost = np.zeros(1)
+    score = np.array([heuristic_cost], dtype=np.float64)
+    state_key = np.zeros(1, dtype=np.int64)
+    layers = []  # her katman için (parent, job, start)
+    children = 0
+    finished = True
+
+    for depth in range(n):
+        if time_limit is not None and time_module.perf_counter() - started > time_limit:
+            finished = False
+            break
+        width, m = rollout.shape
+        starts = np.maximum(clock[:, None], arrivals[rollout])
+        finish = starts + bursts[rollout]
+        horizon = finish.min(axis=1)
+        # Aktif seçimler: başka bir iş bitmeden başlayabilenler; en erken bitenler denenir
+        candidate_finish = np.where(starts < horizon[:, None], finish, np.inf)
+        candidate_finish[:, 0] = -np.inf  # rollout'un kendi seçimi her zaman
+        k = min(branching + 1, m)
+        if k < m:
+            columns = np.argpartition(candidate_finish, k - 1, axis=1)[:, :k]
+        else:
+            columns = np.broadcast_to(np.arange(m), (width, m))
+        parent = np.repeat(np.arange(width), k)
+        column = columns.reshape(-1)
+        valid = np.isfinite(candidate_finish[parent, column]) | (column == 0)
+        parent, column = parent[valid], column[valid]
+        children += len(parent)
+
+        job = rollout[parent, column]
+        job_start = starts[parent, column]
+        job_finish = finish[parent, column]
+        child_cost = cost[parent] + weights[job] * (job_finish - offset[job])
+        # Kalan sıra: ebeveynin rollout'u, seçilen sütun çıkarılmış
+        rest_columns = np.arange(m - 1)[None, :]
+        rest_columns = rest_columns + (rest_columns >= column[:, None])
+        rest = rollout[parent[:, None], rest_columns]
+        completions = sequence_completions(job_finish, arrivals[rest], bursts[rest])
+        child_score = child_cost + (weights[rest] * (completions - offset[rest])).sum(axis=1)
+        child_key = state_key[parent] ^ keys[job]
+
+        # En iyi skorlular; aynı iş kümesinden sadece en iyisi kalır
+        ranked = np.lexsort((job_finish, child_score))
+        _, first = np.unique(child_key[ranked], return_index=True)
+        keep = ranked[np.sort(first)][:beam_width]
+
+        layers.append((parent[keep], job[keep], job_start[keep]))
+        rollout = rest[keep]
+        clock = job_finish[keep]
+        cost = child_cost[keep]
+        score = child_score[keep]
+        state_key = child_key[keep]
+
+    # En iyi durum: sabit önek (ebeveyn zinciri) + kendi rollout'u
+    best = int(np.argmin(score))
+    best_cost = float(score[best])
+    prefix = []
+    index = best
+    for parents, chosen, chosen_start in reversed(layers):
+        prefix.append((int(chosen[index]), float(chosen_start[index])))
+        index = parents[index]
+    prefix.reverse()
+    schedule = [(jobs[i], start, start + jobs[i].burst_time) for i, start in prefix]
+    time = schedule[-1][2] if schedule else 0
+    if rollout.shape[1]:
+        schedule += sequence_cost(jobs, rollout[best].tolist(), objective, time)[1]
+
+    gap = (best_cost - lower_bound) / best_cost if best_cost else 0.0
+    stats = {
+        "cost": best_cost,
+        "heuristic_cost": heuristic_cost,
+        "lower_bound": lower_bound,
+        "gap": gap,
+        "finished": finished,
+        "layers": len(layers),
+        "children": children,
+        "elapsed": time_module.perf_counter() - started,
+    }
+
+    if verbose:
+        print(f"Best Total {objective_title(objective)} Time = {best_cost:g} "
+              f"(heuristic {heuristic_cost:g}, lower bound {lower_bound:g}, gap {gap:.2%})")
+    for job, start, finish in schedule:
+        job.start_time = start
+        job.completion_time = finish
+        if log is not None:
+            log.append(job.id, 0, start, finish)
+
+    return schedule, jobs, stats
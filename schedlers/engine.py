@@ -0,0 +1,548 @@
+import copy
+import heapq
+import pickle
+from collections import deque
+from itertools import islice
+
+import numpy as np
+
+from Job import JobTable, SortedJobs
+
+
+class EventEngine:
+    """Discrete-event loop shared by the preemptive schedulers.
+
+    The clock only moves from one event to the next: the end of the slice
+    that is running, or the next arrival when the CPU is idle. Which job runs
+    and for how long is decided by a policy object:
+
+        policy.admit(job, time)            -> a job has arrived
+        policy.pick(time, next_arrival)    -> (job, quantum); None = run to completion
+        policy.charge(job, exec_time)      -> bookkeeping after a slice (vruntime, ...)
+        policy.preempt(job, time)          -> the slice ended but the job is not done
+        len(policy)                        -> number of runnable jobs
+
+    A JobTable is scheduled in place and returned as is: rows are turned into
+    Job objects only while they are in flight and written back on completion.
+    A list of Job objects returns the completed jobs in completion order.
+    Any other iterable is consumed lazily as a stream that must already be
+    sorted by arrival_time; pass on_complete to receive finished jobs instead
+    of collecting them, so a stream is replayed in bounded memory. Pass an
+    IntervalLog as log to record every slice that runs.
+
+    run(until) stops at the first event at or after `until`. checkpoint()
+    serializes the whole state (clock, run queues, input cursor, counters,
+    finished jobs); EventEngine.restore() resumes it deterministically and
+    fork() continues a copy, optionally with different policy parameters:
+
+        engine = make_engine(table, lambda: MLFQPolicy(boost_interval=100))
+        engine.run(until=3600)
+        variants = [engine.fork(boost_interval=b) for b in (50, 200)]
+    """
+
+    BLOCK_SIZE = 4096
+    # Girdi ve callback durumda saklanmaz, restore'a yeniden verilir
+    INPUT_FIELDS = ('table', 'stream', 'jobs', 'order', 'block', 'block_start', 'on_complete')
+    RESULT_COLUMNS = ('remaining_time', 'start_time', 'completion_time', 'current_queue', 'vruntime')
+
+    def __init__(self, jobs, policy, on_complete=None, log=None):
+        self.table = None
+        self.stream = None
+        if isinstance(jobs, JobTable):
+            self.table = jobs
+            self.order = jobs.arrival_order()
+            self.block = []
+            self.block_start = 0
+            self.n = len(jobs)
+        elif isinstance(jobs, SortedJobs):
+            self.jobs = jobs
+            self.n = len(jobs)
+        elif isinstance(jobs, (list, tuple)):
+            self.jobs = sorted(jobs, key=lambda job: job.arrival_time)
+            self.n = len(self.jobs)
+        else:
+            self.stream = iter(jobs)
+            self.n = None
+        self.policy = policy
+        self.on_complete = on_complete
+        self.log = log
+        self.completed_jobs = []
+        self.time = 0
+        self.busy_time = 0
+        self.steps = 0  # işlenen olay sayısı (dilim sonu / boşta atlama)
+        self.completed = 0
+        self.job_index = 0
+        self.next_job = self.fetch(0)
+
+    def fetch(self, index):
+        # index'inci geliş; liste/tablo için imleç, akış için sıradaki eleman
+        if self.stream is not None:
+            job = next(self.stream, None)
+            if job is not None and index > 0 and job.arrival_time < self.next_job.arrival_time:
+                raise ValueError("job stream is not sorted by arrival_time")
+            return job
+        if index >= self.n:
+            return None
+        if self.table is None:
+            return self.jobs[index]
+        # Tablodan satırları blok blok Job nesnesine çevir
+        if index >= self.block_start + len(self.block):
+            self.block_start = index
+            self.block = self.table.jobs(self.order[index:index + self.BLOCK_SIZE])
+        return self.block[index - self.block_start]
+
+    def next_arrival(self):
+        if self.next_job is not None:
+            return self.next_job.arrival_time
+        return None
+
+    def admit_arrivals(self):
+        while self.next_job is not None and self.next_job.arrival_time <= self.time:
+            self.policy.admit(self.next_job, self.time)
+            self.job_index += 1
+            self.next_job = self.fetch(self.job_index)
+
+    def step(self):
+        self.steps += 1
+        self.admit_arrivals()
+
+        if not self.policy:
+            # CPU boş: bir sonraki gelişe atla
+            self.time = max(self.time, self.next_arrival())
+            return
+
+        job, quantum = self.policy.pick(self.time, self.next_arrival())
+        if job.start_time is None:
+            job.start_time = self.time
+
+        if quantum is None:
+            exec_time = job.remaining_time
+        else:
+            exec_time = min(quantum, job.remaining_time)
+
+        if self.log is not None:
+            self.log.append(job.id, 0, self.time, self.time + exec_time)
+        self.time += exec_time
+        self.busy_time += exec_time
+        job.remaining_time -= exec_time
+        self.policy.charge(job, exec_time)
+
+        # Arrivals during the slice are queued before the preempted job
+        self.admit_arrivals()
+
+        if job.remaining_time == 0:
+            job.completion_time = self.time
+            self.finish(job)
+        else:
+            self.policy.preempt(job, self.time)
+
+    def finish(self, job):
+        self.completed += 1
+        if self.on_complete is not None:
+            self.on_complete(job)
+        if self.table is not None:
+            self.completed_jobs.append(job)
+            if len(self.completed_jobs) >= self.BLOCK_SIZE:
+                self.flush()
+        elif self.on_complete is None:
+            self.completed_jobs.append(job)
+
+    def run(self, until=None):
+        while (self.next_job is not None or self.policy) and (until is None or self.time < until):
+            self.step()
+        return self.result()
+
+    def result(self):
+        if self.table is not None:
+            self.flush()
+            return self.table
+        return self.completed_jobs
+
+    def flush(self):
+        self.table.write_back(self.completed_jobs)
+        self.completed_jobs = []
+
+    # -- checkpoints --
+    def state(self):
+        fields = {name: value for name, value in self.__dict__.items() if name not in self.INPUT_FIELDS}
+        state = {"engine": type(self), "fields": fields}
+        if self.table is not None:
+            # Tabloya yazılmış bitmiş satırlar da duruma girer (tablo yeniden yüklenirse boş gelir)
+            self.flush()
+            rows = np.flatnonzero(~np.isnan(self.table.completion_time))
+            state["rows"] = rows
+            state["results"] = {name: getattr(self.table, name)[rows] for name in self.RESULT_COLUMNS}
+        return state
+
+    def checkpoint(self, path=None):
+        """Pickle the engine state; returns the bytes and, with a path, also writes them there.
+
+        The job input and on_complete are not part of it: restore() is given
+        them again. Finished rows of a JobTable are included.
+        """
+        data = pickle.dumps(self.state(), protocol=pickle.HIGHEST_PROTOCOL)
+        if path is not None:
+            with open(path, "wb") as f:
+                f.write(data)
+        return data
+
+    @classmethod
+    def restore(cls, checkpoint, jobs, on_complete=None):
+        """Rebuild an engine from checkpoint() bytes (or a file path).
+
+        jobs must be the input the engine was created with, from the start: a
+        fresh copy of the table or job list, or a new iterator over the same
+        stream (the part already read is skipped).
+        """
+        if isinstance(checkpoint, str):
+            with open(checkpoint, "rb") as f:
+                checkpoint = f.read()
+        state = pickle.loads(checkpoint)
+        engine = state["engine"].__new__(state["engine"])
+        engine.__dict__.update(state["fields"])
+        engine.on_complete = on_complete
+        engine.table = None
+        engine.stream = None
+
+        if isinstance(jobs, JobTable):
+            if len(jobs) != engine.n:
+                raise ValueError("checkpoint was taken on a different job table")
+            engine.table = jobs
+            engine.order = jobs.arrival_order()
+            for name, values in state["results"].items():
+                getattr(jobs, name)[state["rows"]] = values
+            # Sıradaki blok imleçten yeniden okunur
+            engine.block = []
+            engine.block_start = engine.job_index + 1
+        elif isinstance(jobs, (list, tuple)):
+            if len(jobs) != engine.n:
+                raise ValueError("checkpoint was taken on a different job list")
+            engine.jobs = jobs if isinstance(jobs, SortedJobs) else sorted(jobs, key=lambda job: job.arrival_time)
+        else:
+            # Okunmuş kısmı atla: kabul edilenler + sıradaki iş
+            engine.stream = iter(jobs)
+            deque(islice(engine.stream, engine.job_index + 1), maxlen=0)
+        return engine
+
+    def fork(self, **params):
+        """An independent copy that continues from the current state.
+
+        params are set on the policies (e.g. time_quantum=4) before the copy
+        runs, so several variants can share one warm-up prefix. A JobTable is
+        copied; a stream cannot be forked (checkpoint it and restore it with a
+        new iterator instead).
+        """
+        if self.stream is not None:
+            raise ValueError("a job stream cannot be forked")
+        if self.table is not None:
+            self.flush()
+            jobs = self.table.copy()
+        else:
+            # Henüz gelmemiş işler iki kopyada ayrı nesneler olmalı
+            ahead = self.job_index + 1
+            jobs = SortedJobs(list(self.jobs[:ahead]) + [copy.copy(job) for job in self.jobs[ahead:]])
+        engine = EventEngine.restore(self.checkpoint(), jobs, self.on_complete)
+        engine.retune(**params)
+        return engine
+
+    def unique_policies(self):
+        return [self.policy]
+
+    def retune(self, **params):
+        for policy in self.unique_policies():
+            for name, value in params.items():
+                if not hasattr(policy, name):
+                    raise TypeError(f"{type(policy).__name__} has no parameter {name!r}")
+                setattr(policy, name, value)
+            if params and hasattr(policy, 'retune'):
+                policy.retune(self.time)
+
+    def stats(self):
+        return {
+            "cpus": 1,
+            "events": self.steps,
+            "completed": self.completed,
+            "makespan": self.time,
+            "utilization": [self.busy_time / self.time if self.time else 0.0],
+            "migrations": 0,
+            "steals": 0,
+            **policy_stats(self.unique_policies()),
+        }
+
+
+class SMPEngine(EventEngine):
+    """N-CPU version of EventEngine.
+
+    mode='global': one run queue (policy) shared by all CPUs.
+    mode='per_cpu': one policy per CPU. Arrivals go to an idle CPU if there
+    is one, otherwise round robin; a CPU whose queue is empty steals the
+    next job of the longest queue.
+
+    Slice ends are kept in an event heap, idle CPUs on a stack and, in
+    per_cpu mode, queue lengths in a lazily refreshed max-heap, so no event
+    scans all CPUs. While every CPU is busy, arrivals are admitted at the
+    next slice end, like the single-CPU engine does; with cpus=1 both engines
+    produce the same schedule.
+
+    A policy with preempt_on_arrival (exact SRTF) runs its jobs without a
+    quantum instead. An arrival is admitted at once, and if
+    policy.displaces(job, remaining) says the best queued job beats a running
+    one, only that CPU is preempted: in global mode the running job that
+    would finish last (a max-heap of slice ends), in per_cpu mode the job on
+    the CPU the arrival was queued on.
+    """
+
+    def __init__(self, jobs, make_policy, cpus=2, mode='global', on_complete=None, log=None):
+        if mode not in ('global', 'per_cpu'):
+            raise ValueError("Unknown SMP mode")
+        self.mode = mode
+        self.cpus = cpus
+        if mode == 'global':
+            shared = make_policy()
+            self.policies = [shared] * cpus
+        else:
+            self.policies = [make_policy() for _ in range(cpus)]
+        super().__init__(jobs, self.policies[0], on_complete, log)
+
+        self.events = []  # (slice end, seq, cpu); kesilen dilimlerin kayıtları okunurken atılır
+        self.seq = 0
+        self.running = [None] * cpus  # (job, slice start, exec_time, seq)
+        self.victims = []  # global, preempt_on_arrival: (-slice end, seq, cpu)
+        self.arrived = []  # per_cpu: gelişlerin kuyruğa girdiği CPU'lar
+        self.idle = list(range(cpus - 1, -1, -1))
+        self.cpu_busy = [0] * cpus
+        self.queued = 0  # per_cpu: tüm kuyruklardaki iş sayısı
+        self.longest = []  # per_cpu: (-len, cpu), eski kayıtlar okunurken atılır
+        self.next_cpu = 0
+        self.migrations = 0
+        self.steals = 0
+
+    # -- run queues --
+    def runnable(self):
+        if self.mode == 'global':
+            return len(self.policy)
+        return self.queued
+
+    def queue_changed(self, cpu):
+        if self.mode == 'per_cpu':
+            heapq.heappush(self.longest, (-len(self.policies[cpu]), cpu))
+            if len(self.longest) > 4 * self.cpus + 64:
+                self.longest = [(-len(policy), c) for c, policy in enumerate(self.policies) if policy]
+                heapq.heapify(self.longest)
+
+    def longest_queue(self):
+        while self.longest:
+            length, cpu = self.longest[0]
+            if -length == len(self.policies[cpu]) and length < 0:
+                return cpu
+            heapq.heappop(self.longest)
+        return None
+
+    def admit_arrivals(self):
+        while self.next_job is not None and self.next_job.arrival_time <= self.time:
+            if self.mode == 'global':
+                self.policy.admit(self.next_job, self.time)
+            else:
+                if self.idle:
+                    cpu = self.idle[-1]
+                else:
+                    cpu = self.next_cpu
+                    self.next_cpu = (self.next_cpu + 1) % self.cpus
+                self.policies[cpu].admit(self.next_job, self.time)
+                self.queued += 1
+                self.queue_changed(cpu)
+                self.arrived.append(cpu)
+            self.job_index += 1
+            self.next_job = self.fetch(self.job_index)
+
+    # -- dispatch --
+    def displacing(self):
+        return getattr(self.policy, 'preempt_on_arrival', False)
+
+    def dispatch(self):
+        while self.idle and self.runnable():
+            cpu = self.idle.pop()
+            policy = self.policies[cpu]
+            if self.mode == 'per_cpu':
+                if not policy:
+                    victim = self.longest_queue()
+                    policy = self.policies[victim]
+                    self.steals += 1
+                    cpu_queue = victim
+                else:
+                    cpu_queue = cpu
+                self.queued -= 1
+
+            displacing = self.displacing()
+            job, quantum = policy.pick(self.time, None if displacing else self.next_arrival())
+            if self.mode == 'per_cpu':
+                self.queue_changed(cpu_queue)
+
+            if job.cpu is not None and job.cpu != cpu:
+                self.migrations += 1
+            job.cpu = cpu
+
+            if job.start_time is None:
+                job.start_time = self.time
+            if quantum is None:
+                exec_time = job.remaining_time
+            else:
+                exec_time = min(quantum, job.remaining_time)
+            self.running[cpu] = (job, self.time, exec_time, self.seq)
+            heapq.heappush(self.events, (self.time + exec_time, self.seq, cpu))
+            if displacing and self.mode == 'global':
+                heapq.heappush(self.victims, (-(self.time + exec_time), self.seq, cpu))
+                if len(self.victims) > 4 * self.cpus + 64:
+                    self.victims = [(-(slot[1] + slot[2]), slot[3], c)
+                                    for c, slot in enumerate(self.running) if slot is not None]
+                    heapq.heapify(self.victims)
+            self.seq += 1
+
+    def preempt_displaced(self):
+        # Gelen iş çalışan bir işi geçiyorsa sadece o CPU kesilir
+        if self.mode == 'global':
+            while not self.idle and self.policy and self.victims:
+                _, seq, cpu = self.victims[0]
+                slot = self.running[cpu]
+                if slot is None or slot[3] != seq:
+                    heapq.heappop(self.victims)
+                    continue
+                job, start = slot[:2]
+                if not self.policy.displaces(job, job.remaining_time - (self.time - start)):
+                    break
+                heapq.heappop(self.victims)
+                self.cut(cpu)
+                self.dispatch()
+        else:
+            for cpu in self.arrived:
+                slot = self.running[cpu]
+                policy = self.policies[cpu]
+                if slot is not None and policy and \
+                        policy.displaces(slot[0], slot[0].remaining_time - (self.time - slot[1])):
+                    self.cut(cpu)
+                    self.dispatch()
+        self.arrived = []
+
+    def cut(self, cpu):
+        # Dilimi şimdi bitir: çalıştığı kadar ücretlendir, iş kuyruğa döner
+        job, start = self.running[cpu][:2]
+        exec_time = self.time - start
+        self.running[cpu] = None
+        self.cpu_busy[cpu] += exec_time
+        if self.log is not None and exec_time > 0:
+            self.log.append(job.id, cpu, start, self.time)
+        job.remaining_time -= exec_time
+        policy = self.policies[cpu]
+        policy.charge(job, exec_time)
+        policy.preempt(job, self.time)
+        if self.mode == 'per_cpu':
+            self.queued += 1
+            self.queue_changed(cpu)
+        self.idle.append(cpu)
+
+    def next_slice_end(self):
+        while self.events:
+            end, seq, cpu = self.events[0]
+            slot = self.running[cpu]
+            if slot is not None and slot[3] == seq:
+                return end
+            heapq.heappop(self.events)
+        return None
+
+    def step(self):
+        self.steps += 1
+        end = self.next_slice_end()
+        displacing = self.displacing()
+        if end is not None and ((self.idle == [] and not displacing) or self.next_job is None
+                                or end <= self.next_job.arrival_time):
+            self.time = end
+        else:
+            # Boşta CPU var (ya da gelen iş birini kesebilir): bir sonraki gelişe atla
+            self.time = max(self.time, self.next_arrival())
+
+        ended = []
+        while self.next_slice_end() == self.time:
+            _, _, cpu = heapq.heappop(self.events)
+            job, start, exec_time, _ = self.running[cpu]
+            self.running[cpu] = None
+            self.cpu_busy[cpu] += exec_time
+            if self.log is not None:
+                self.log.append(job.id, cpu, start, self.time)
+            job.remaining_time -= exec_time
+            self.policies[cpu].charge(job, exec_time)
+            ended.append((cpu, job))
+
+        # Arrivals during the slices are queued before the preempted jobs
+        self.admit_arrivals()
+
+        for cpu, job in ended:
+            if job.remaining_time == 0:
+                job.completion_time = self.time
+                self.finish(job)
+            else:
+                self.policies[cpu].preempt(job, self.time)
+                if self.mode == 'per_cpu':
+                    self.queued += 1
+                    self.queue_changed(cpu)
+            self.idle.append(cpu)
+
+        self.dispatch()
+        if displacing:
+            self.preempt_displaced()
+        self.arrived = []
+
+    def run(self, until=None):
+        self.admit_arrivals()
+        self.dispatch()
+        self.arrived = []
+        while (self.next_job is not None or self.next_slice_end() is not None or self.runnable()) and (until is None or self.time < until):
+            self.step()
+        return self.result()
+
+    def unique_policies(self):
+        return self.policies[:1] if self.mode == 'global' else self.policies
+
+    def stats(self):
+        makespan = self.time
+        return {
+            "cpus": self.cpus,
+            "events": self.steps,
+            "completed": self.completed,
+            "makespan": makespan,
+            "utilization": [busy / makespan if makespan else 0.0 for busy in self.cpu_busy],
+            "migrations": self.migrations,
+            "steals": self.steals,
+            **policy_stats(self.unique_policies()),
+        }
+
+
+def policy_stats(policies):
+    # Policy'lerin kendi sayaçları (varsa), CPU'lar üzerinden toplanmış
+    merged = {}
+    for policy in policies:
+        if not hasattr(policy, 'stats'):
+            continue
+        for key, value in policy.stats().items():
+            if key not in merged:
+                merged[key] = value
+            elif isinstance(value, list):
+                merged[key] = [a + b for a, b in zip(merged[key], value)]
+            else:
+                merged[key] += value
+    return merged
+
+
+def make_engine(jobs, make_policy, cpus=1, smp='global', on_complete=None, log=None):
+    """EventEngine for one CPU, SMPEngine for `cpus` CPUs."""
+    if cpus == 1:
+        return EventEngine(jobs, make_policy(), on_complete, log)
+    return SMPEngine(jobs, make_policy, cpus, smp, on_complete, log)
+
+
+def simulate(jobs, make_policy, cpus=1, smp='global', stats=None, on_complete=None, log=None):
+    """Run a policy on one CPU (EventEngine) or on `cpus` CPUs (SMPEngine)."""
+    engine = make_engine(jobs, make_policy, cpus, smp, on_complete, log)
+    result = engine.run()
+    if stats is not None:
+        stats.update(engine.stats())
+    return result
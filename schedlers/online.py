@@ -0,0 +1,330 @@
+import asyncio
+import heapq
+from collections import deque
+
+from schedlers.engine import policy_stats
+
+
+class OnlineScheduler:
+    """Stateful front end of a policy for live dispatching.
+
+    The batch engines pull arrivals from a list; here the caller pushes
+    events and asks for decisions:
+
+        submit(job, time)      -> a job arrived (burst_time is its estimate)
+        tick(until)            -> the clock moved; handle slice ends up to until
+        next_decision()        -> (job, cpu, quantum) for an idle CPU, or None
+        complete(job_id, time) -> the job finished on its CPU
+
+    submit, tick and complete return the slices that ended as (job, cpu):
+    those jobs are back in the run queue and their CPUs are idle. quantum is
+    the policy's (None = until it completes or an arrival preempts it).
+    Every call is O(log n) in the queued jobs (plus O(cpus) for arrival
+    preemption): the policy heaps / deques, a heap of slice ends and a map
+    of running job ids. A slice whose estimated burst runs out keeps its CPU
+    until complete() is called.
+
+    Submitting every arrival at time t before tick(t) and then taking
+    decisions reproduces the batch engine: while every CPU is busy an
+    arrival is admitted at the next slice end, and arrivals are queued
+    before the jobs preempted at the same moment. With a preempt_on_arrival
+    policy (exact SRTF) the arrival is admitted at once and ends the slice
+    of the running job it displaces, the one that would finish last.
+
+    A completion can race with a preemption: complete() for a job that is
+    back in the run queue records it as finished there and then, and the job
+    is dropped when the policy hands it out again. Completions of unknown or
+    already finished jobs are ignored and counted ("stale_completions").
+    """
+
+    def __init__(self, policy, cpus=1, on_complete=None):
+        self.policy = policy
+        self.cpus = cpus
+        self.on_complete = on_complete
+        self.time = 0
+        self.running = [None] * cpus  # [job, slice start, slice end, seq, exec_time]
+        self.cpu_of = {}  # çalışan job id -> CPU
+        self.jobs = {}  # bitmemiş job id -> job
+        self.finished_queued = set()  # kuyruktayken bitti bildirilenler; pick'te atılır
+        self.events = []  # (slice end, seq, cpu); eski kayıtlar okunurken atılır
+        self.victims = []  # preempt_on_arrival: (-slice end, seq, cpu)
+        self.ended = []  # (cpu, slot): ücretlendi, kuyruğa dönmeyi bekliyor
+        self.waiting = deque()  # CPU'lar meşgulken gelenler
+        self.overrun = []  # (cpu, slot): tahmini süre bitti, complete() bekleniyor
+        self.seq = 0
+        self.idle = list(range(cpus - 1, -1, -1))
+        self.cpu_busy = [0] * cpus
+        self.decisions = 0
+        self.completed = 0
+        self.stale_completions = 0
+
+    def __len__(self):
+        # Kuyruktaki + çalışan işler
+        return len(self.policy) + len(self.cpu_of) + len(self.waiting)
+
+    def advance(self, time, requeue):
+        # Dilim sonları zaman sırasıyla: aynı andaki dilimler ücretlendirilir, o ana kadar
+        # bekleyen gelişler kabul edilir, sonra kesilen işler kuyruğa döner (batch engine sırası).
+        # Tam `time`da bitenler requeue=False iken tick'e kadar bekler: aynı andaki
+        # submit'ler kuyruğa önce girer.
+        if time < self.time:
+            raise ValueError("time went backwards")
+        ended = []
+        if self.ended and (requeue or self.time < time):
+            ended += self.requeue()
+        while self.events and self.events[0][0] <= time:
+            end = self.events[0][0]
+            self.time = end
+            while self.events and self.events[0][0] == end:
+                _, seq, cpu = heapq.heappop(self.events)
+                slot = self.running[cpu]
+                if slot is None or slot[3] != seq:
+                    continue
+                job = slot[0]
+                # Verilen exec_time (end - start float'ta aynı olmayabilir)
+                self.charge(cpu, job, slot[4])
+                slot[1] = end
+                slot[2] = None
+                if job.remaining_time > 0:
+                    self.ended.append((cpu, slot))
+                elif getattr(self.policy, 'preempt_on_arrival', False):
+                    # Tahmini süre bitti; complete() gelene kadar CPU'da kalır
+                    self.overrun.append((cpu, slot))
+            self.admit_waiting()
+            if self.ended and (requeue or end < time):
+                ended += self.requeue()
+        self.time = time
+        return ended
+
+    def admit_waiting(self):
+        while self.waiting:
+            self.policy.admit(self.waiting.popleft(), self.time)
+
+    def requeue(self):
+        ended = []
+        for cpu, slot in self.ended:
+            if self.running[cpu] is slot:  # arada complete() gelmiş olabilir
+                job = slot[0]
+                self.release(cpu, job)
+                self.policy.preempt(job, slot[1])
+                ended.append((job, cpu))
+        self.ended = []
+        return ended
+
+    def charge(self, cpu, job, exec_time):
+        self.cpu_busy[cpu] += exec_time
+        job.remaining_time -= exec_time
+        self.policy.charge(job, exec_time)
+
+    def release(self, cpu, job):
+        self.running[cpu] = None
+        del self.cpu_of[job.id]
+        self.idle.append(cpu)
+
+    def next_event(self):
+        """Time of the next slice end, None if nothing will expire."""
+        while self.events:
+            end, seq, cpu = self.events[0]
+            slot = self.running[cpu]
+            if slot is not None and slot[3] == seq:
+                return end
+            heapq.heappop(self.events)
+        return None
+
+    def submit(self, job, time=None):
+        ended = self.advance(self.time if time is None else time, False)
+        self.jobs[job.id] = job
+        preempt_on_arrival = getattr(self.policy, 'preempt_on_arrival', False)
+        if not self.idle and not self.ended and not preempt_on_arrival:
+            # Tüm CPU'lar meşgul: batch engine gibi bir sonraki dilim sonunda kabul edilir
+            self.waiting.append(job)
+            return ended
+        self.policy.admit(job, self.time)
+        if preempt_on_arrival:
+            self.preempt_displaced()
+        return ended
+
+    def preempt_displaced(self):
+        # Kuyruktaki en iyi iş en geç bitecek işi geçiyorsa sadece onun dilimi şimdi biter
+        # (tick'te kuyruğa döner). Boş CPU varken ya da şimdi biten bir dilim CPU'yu
+        # bırakmadan önce kesilmez: o CPU'yu zaten kuyruktaki en iyi iş alır.
+        if self.idle or self.ended or not self.policy or self.next_event() == self.time:
+            return
+        self.overrun = [(cpu, slot) for cpu, slot in self.overrun if self.running[cpu] is slot]
+        if any(slot[1] == self.time for _, slot in self.overrun):
+            return
+        while self.victims:
+            _, seq, cpu = self.victims[0]
+            slot = self.running[cpu]
+            if slot is None or slot[3] != seq or slot[2] is None or slot[2] <= self.time:
+                heapq.heappop(self.victims)
+                continue
+            job, start = slot[:2]
+            if self.policy.displaces(job, job.remaining_time - (self.time - start)):
+                heapq.heappop(self.victims)
+                self.schedule_end(cpu, slot, self.time, self.time - start)
+            return
+
+    def tick(self, until=None):
+        return self.advance(self.time if until is None else until, True)
+
+    def schedule_end(self, cpu, slot, end, exec_time):
+        self.seq += 1
+        slot[2] = end
+        slot[3] = self.seq
+        slot[4] = exec_time
+        heapq.heappush(self.events, (end, self.seq, cpu))
+
+    def next_decision(self):
+        if not self.idle or not self.policy:
+            if getattr(self.policy, 'preempt_on_arrival', False):
+                self.preempt_displaced()
+            return None
+        job, quantum = self.policy.pick(self.time, None)
+        while job.id in self.finished_queued:
+            # Kuyruktayken bitmişti: at
+            self.finished_queued.discard(job.id)
+            if not self.policy:
+                return None
+            job, quantum = self.policy.pick(self.time, None)
+        cpu = self.idle.pop()
+        if job.start_time is None:
+            job.start_time = self.time
+        if quantum is None:
+            exec_time = job.remaining_time
+        else:
+            exec_time = min(quantum, job.remaining_time)
+        slot = [job, self.time, None, None, None]
+        self.running[cpu] = slot
+        self.cpu_of[job.id] = cpu
+        self.schedule_end(cpu, slot, self.time + exec_time, exec_time)
+        if getattr(self.policy, 'preempt_on_arrival', False):
+            heapq.heappush(self.victims, (-slot[2], slot[3], cpu))
+            if len(self.victims) > 4 * self.cpus + 64:
+                self.victims = [(-slot[2], slot[3], c) for c, slot in enumerate(self.running)
+                                if slot is not None and slot[2] is not None]
+                heapq.heapify(self.victims)
+        self.decisions += 1
+        return job, cpu, quantum
+
+    def complete(self, job_id, time=None):
+        ended = self.advance(self.time if time is None else time, False)
+        cpu = self.cpu_of.get(job_id)
+        job = self.jobs.get(job_id)
+        if job is None or job_id in self.finished_queued:
+            # Bilinmeyen ya da zaten bitmiş iş
+            self.stale_completions += 1
+            return ended
+        if cpu is None:
+            # Dilimi bitip kuyruğa dönmüştü (preempt ile yarıştı): bitti say, kuyruktan pick'te atılır
+            self.finished_queued.add(job_id)
+        else:
+            start = self.running[cpu][1]
+            if self.time > start:
+                self.charge(cpu, job, self.time - start)
+            self.release(cpu, job)
+        self.admit_waiting()
+        del self.jobs[job_id]
+        job.remaining_time = 0
+        job.completion_time = self.time
+        self.completed += 1
+        if self.on_complete is not None:
+            self.on_complete(job)
+        return ended
+
+    def stats(self):
+        return {
+            "cpus": self.cpus,
+            "decisions": self.decisions,
+            "completed": self.completed,
+            "stale_completions": self.stale_completions,
+            "time": self.time,
+            "utilization": [busy / self.time if self.time else 0.0 for busy in self.cpu_busy],
+            **policy_stats([self.policy]),
+        }
+
+
+# -----------------------------
+# asyncio front end
+# -----------------------------
+class _Completion:
+    __slots__ = ('job_id',)
+
+    def __init__(self, job_id):
+        self.job_id = job_id
+
+
+class AsyncDispatcher:
+    """Serve an OnlineScheduler from an asyncio.Queue of arrivals.
+
+    Jobs put on `arrivals` are submitted at the current clock time.
+    dispatch(job, cpu, quantum) is called for every decision and
+    preempt(job, cpu) for every slice that ended with the job unfinished;
+    the worker running a job reports back with complete(job_id). Everything
+    waiting on the queue is handled as one batch, so bursts of submissions
+    cost one round of decisions. Putting None on the queue stops run(),
+    which returns the scheduler's stats.
+
+    clock() gives the scheduler time; by default seconds since run() started.
+    """
+
+    def __init__(self, scheduler, dispatch, preempt=None, clock=None, arrivals=None):
+        self.scheduler = scheduler
+        self.dispatch = dispatch
+        self.preempt = preempt
+        self.clock = clock
+        self.arrivals = asyncio.Queue() if arrivals is None else arrivals
+        self.started = None
+
+    def now(self):
+        if self.clock is not None:
+            return self.clock()
+        return asyncio.get_running_loop().time() - self.started
+
+    def submit(self, job):
+        self.arrivals.put_nowait(job)
+
+    def complete(self, job_id):
+        self.arrivals.put_nowait(_Completion(job_id))
+
+    def stop(self):
+        self.arrivals.put_nowait(None)
+
+    async def run(self):
+        scheduler = self.scheduler
+        self.started = asyncio.get_running_loop().time()
+        stopping = False
+        while not stopping:
+            wake = scheduler.next_event()
+            try:
+                if wake is None:
+                    item = await self.arrivals.get()
+                else:
+                    item = await asyncio.wait_for(self.arrivals.get(), max(wake - self.now(), 0))
+                batch = [item]
+            except asyncio.TimeoutError:
+                batch = []
+            while not self.arrivals.empty():
+                batch.append(self.arrivals.get_nowait())
+
+            now = max(self.now(), scheduler.time)
+            ended = []
+            # Önce bitenler (CPU'lar boşalır), sonra gelenler, sonra dilim sonları
+            for item in batch:
+                if isinstance(item, _Completion):
+                    ended += scheduler.complete(item.job_id, now)
+            for item in batch:
+                if item is None:
+                    stopping = True
+                elif not isinstance(item, _Completion):
+                    ended += scheduler.submit(item, now)
+            ended += scheduler.tick(now)
+
+            if self.preempt is not None:
+                for job, cpu in ended:
+                    self.preempt(job, cpu)
+            decision = scheduler.next_decision()
+            while decision is not None:
+                self.dispatch(*decision)
+                decision = scheduler.next_decision()
+        return scheduler.stats()
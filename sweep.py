@@ -0,0 +1,169 @@
+import contextlib
+import io
+import itertools
+import os
+from multiprocessing import Pool, shared_memory
+
+import numpy as np
+
+from Job import JobTable, Workload
+from metrics import compute_metrics
+from schedlers.CFS import CFSScheduler
+from schedlers.DP_algs import dp_scheduler
+from schedlers.DP_sched_preemptive import preemptive_dp_scheduler
+from schedlers.FCFS import FCFSScheduler
+from schedlers.MLFQ import MLFQScheduler
+from schedlers.SRTF import SRTFScheduler
+
+SCHEDULERS = {
+    "FCFS": FCFSScheduler,
+    "MLFQ": MLFQScheduler,
+    "SRTF": SRTFScheduler,
+    "CFS": CFSScheduler,
+    "DP": dp_scheduler,
+    "PreemptiveDP": preemptive_dp_scheduler,
+}
+
+DEFAULT_GRID = {
+    "FCFS": [{}],
+    "MLFQ": [{"queue_levels": 3, "time_quantums": [4, 8, None]},
+             {"queue_levels": 5, "time_quantums": [2, 3, 4, 5, 6]}],
+    "SRTF": [{"time_quantum": None}, {"time_quantum": 3}, {"time_quantum": 4}],
+    "CFS": [{"time_quantum": 2}, {"time_quantum": 4}],
+    "DP": [{"objective": "turnaround"}, {"objective": "response"}, {"objective": "waiting"}],
+    "PreemptiveDP": [{"objective": "turnaround"}, {"objective": "response"}, {"objective": "waiting"}],
+}
+
+
+def expand_grid(grid):
+    """Turn {"SRTF": {"time_quantum": [2, 4]}} or {"SRTF": [{...}, ...]} into (name, params) pairs."""
+    tasks = []
+    for name, params in grid.items():
+        if name not in SCHEDULERS:
+            raise ValueError(f"Unknown scheduler: {name}")
+        if isinstance(params, dict):
+            keys = list(params)
+            params = [dict(zip(keys, values)) for values in itertools.product(*params.values())]
+        for p in params:
+            tasks.append((name, p))
+    return tasks
+
+
+def scenario_label(name, params):
+    if not params:
+        return name
+    return name + " - " + ",".join(f"{key}={value}" for key, value in params.items())
+
+
+# -----------------------------
+# Shared-memory workload
+# -----------------------------
+class SharedWorkload:
+    # id/arrival/burst/nice/priority (geliş sırasına göre) tek bir shared memory bloğunda; worker'lar kopyalamadan okur
+    def __init__(self, table):
+        table = Workload.from_jobs(table)
+        n = len(table)
+        self.n = n
+        self.shm = shared_memory.SharedMemory(create=True, size=max(1, 5 * n * 8))
+        ids, arrival, burst, nice, priority = self.arrays(self.shm.buf, n)
+        ids[:] = table.id
+        arrival[:] = table.arrival_time
+        burst[:] = table.burst_time
+        nice[:] = table.nice
+        priority[:] = table.priority
+
+    @property
+    def spec(self):
+        return self.shm.name, self.n
+
+    @staticmethod
+    def arrays(buffer, n):
+        ids = np.ndarray((n,), dtype=np.int64, buffer=buffer, offset=0)
+        arrival = np.ndarray((n,), dtype=np.float64, buffer=buffer, offset=8 * n)
+        burst = np.ndarray((n,), dtype=np.float64, buffer=buffer, offset=16 * n)
+        nice = np.ndarray((n,), dtype=np.int64, buffer=buffer, offset=24 * n)
+        priority = np.ndarray((n,), dtype=np.float64, buffer=buffer, offset=32 * n)
+        return ids, arrival, burst, nice, priority
+
+    def close(self):
+        self.shm.close()
+        self.shm.unlink()
+
+
+_workloads = {}
+
+
+def _attach(specs):
+    for seed, (shm_name, n) in specs.items():
+        shm = shared_memory.SharedMemory(name=shm_name)
+        arrays = SharedWorkload.arrays(shm.buf, n)
+        for array in arrays:
+            array.flags.writeable = False
+        _workloads[seed] = (shm, arrays)
+
+
+def _run_scenario(task):
+    seed, name, params = task
+    _, (ids, arrival, burst, nice, priority) = _workloads[seed]
+    # Sadece değişen kolonlar (remaining/start/completion...) her çalıştırmada yeniden ayrılır
+    jobs = JobTable(ids, arrival, burst, is_sorted=True, nice=nice, priority=priority)
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        scheduled = SCHEDULERS[name](jobs, **params)
+    if isinstance(scheduled, tuple):  # DP schedulers: (schedule, jobs)
+        scheduled = scheduled[1]
+
+    result = compute_metrics(scheduled, scenario_label(name, params))
+    result["Seed"] = seed
+    return result
+
+
+def run_sweep(grid=DEFAULT_GRID, seeds=(0,), workload=None, n_jobs=10, processes=None):
+    """Run every scheduler x parameter x seed scenario on a process pool.
+
+    workload(n_jobs, seed) must return a Workload, a JobTable or a list of
+    jobs; by default simulator.generate_random_jobs is used. Each seed's
+    workload is sorted once, placed in shared memory and read by all workers
+    without re-sorting.
+    """
+    if workload is None:
+        from simulator import generate_random_jobs as workload
+
+    tasks = expand_grid(grid)
+    shared = {}
+    try:
+        for seed in seeds:
+            shared[seed] = SharedWorkload(workload(n_jobs, seed=seed))
+
+        specs = {seed: shm_workload.spec for seed, shm_workload in shared.items()}
+        scenarios = [(seed, name, params) for seed in seeds for name, params in tasks]
+        processes = processes or min(len(scenarios), os.cpu_count() or 1)
+        with Pool(processes, initializer=_attach, initargs=(specs,)) as pool:
+            return pool.map(_run_scenario, scenarios, chunksize=1)
+    finally:
+        for shm_workload in shared.values():
+            shm_workload.close()
+
+
+def aggregate(results, columns=("Avg Response Time", "Avg Turnaround Time", "Avg Waiting Time",
+                                "P99 Response Time", "P99 Turnaround Time")):
+    # Seed'ler üzerinden ortalama: senaryo başına tek satır
+    rows = {}
+    for result in results:
+        rows.setdefault(result["Scheduler"], []).append([result[c] for c in columns])
+    return [{"Scheduler": name, "Seeds": len(values), **dict(zip(columns, np.mean(values, axis=0).tolist()))}
+            for name, values in rows.items()]
+
+
+def format_table(rows):
+    columns = list(rows[0])
+    widths = [max(len(c), *(len(_cell(row[c])) for row in rows)) for c in columns]
+    lines = ["  ".join(c.ljust(w) for c, w in zip(columns, widths))]
+    lines.append("  ".join("-" * w for w in widths))
+    for row in rows:
+        lines.append("  ".join(_cell(row[c]).ljust(w) for c, w in zip(columns, widths)))
+    return "\n".join(lines)
+
+
+def _cell(value):
+    return f"{value:.2f}" if isinstance(value, float) else str(value)
@@ -0,0 +1,57 @@
+"""Checks for engine checkpoint / fork: resuming must not change the run.
+
+    python -m pytest -q test_checkpoint.py
+    python test_checkpoint.py
+"""
+from schedlers.engine import EventEngine, make_engine
+from schedlers.MLFQ import MLFQPolicy
+from workloads import generate
+
+# Boost aralığı kısa: kesme noktaları vadesi gelmiş ama uygulanmamış boost'lara denk gelir
+BOOST_INTERVAL = 15
+CUTS = range(10, 300, 11)
+MODES = ((1, 'global'), (3, 'global'), (3, 'per_cpu'))
+
+
+def workload():
+    return generate(800, "poisson", "pareto", utilization=0.95, integral=True, seed=4)
+
+
+def mlfq():
+    return MLFQPolicy(boost_interval=BOOST_INTERVAL)
+
+
+def times(table):
+    return table.start_time.tolist(), table.completion_time.tolist()
+
+
+def uninterrupted(trace, cpus, smp):
+    return times(make_engine(trace.table(), mlfq, cpus, smp).run())
+
+
+def test_fork_matches_uninterrupted_run():
+    trace = workload()
+    for cpus, smp in MODES:
+        expected = uninterrupted(trace, cpus, smp)
+        for cut in CUTS:
+            engine = make_engine(trace.table(), mlfq, cpus, smp)
+            engine.run(until=cut)
+            assert times(engine.fork().run()) == expected, (cpus, smp, cut)
+            # Aynı parametrelerle retune edilen kopya da sapmamalı
+            assert times(engine.fork(boost_interval=BOOST_INTERVAL).run()) == expected, (cpus, smp, cut)
+
+
+def test_restore_matches_uninterrupted_run():
+    trace = workload()
+    for cpus, smp in MODES:
+        expected = uninterrupted(trace, cpus, smp)
+        engine = make_engine(trace.table(), mlfq, cpus, smp)
+        engine.run(until=200)
+        assert times(EventEngine.restore(engine.checkpoint(), trace.table()).run()) == expected, (cpus, smp)
+
+
+if __name__ == "__main__":
+    for name, test in list(globals().items()):
+        if name.startswith("test_"):
+            test()
+            print(f"{name}: ok")
@@ -0,0 +1,169 @@
+"""Checks for the SMP engine: one CPU must match EventEngine, and on several
+CPUs every job runs on at most one CPU at a time, gets exactly its burst and
+no CPU idles while a job is waiting. The online scheduler, driven with the
+same arrivals, must reproduce the batch engine's completion times.
+
+    python -m pytest -q test_engine.py
+    python test_engine.py
+"""
+from Job import IntervalLog, Job
+from schedlers.CFS import CFSPolicy
+from schedlers.engine import EventEngine, SMPEngine, make_engine
+from schedlers.FCFS import FCFSPolicy
+from schedlers.MLFQ import MLFQPolicy
+from schedlers.online import OnlineScheduler
+from schedlers.SRTF import SRTFPolicy
+from workloads import generate
+
+EPS = 1e-9
+
+POLICIES = {
+    "FCFS": FCFSPolicy,
+    "MLFQ": lambda: MLFQPolicy(boost_interval=15),
+    "SRTF": SRTFPolicy,
+    "SRTF exact": lambda: SRTFPolicy(None),
+    "CFS": CFSPolicy,
+}
+
+
+def workload(seed=4):
+    return generate(300, "poisson", "pareto", utilization=0.95, cpus=3, integral=True, seed=seed)
+
+
+def times(table):
+    return table.start_time.tolist(), table.completion_time.tolist()
+
+
+def test_one_cpu_matches_event_engine():
+    trace = workload()
+    for name, make_policy in POLICIES.items():
+        expected = times(EventEngine(trace.table(), make_policy()).run())
+        for mode in ('global', 'per_cpu'):
+            assert times(SMPEngine(trace.table(), make_policy, 1, mode).run()) == expected, (name, mode)
+
+
+def check_invariants(trace, log, cpus):
+    slices = sorted(zip(log.start, log.end, log.job, log.cpu))
+    # Aynı iş ya da aynı CPU için dilimler çakışmaz
+    for key in (2, 3):
+        last_end = {}
+        for row in slices:
+            assert row[0] >= last_end.get(row[key], 0) - EPS, row
+            last_end[row[key]] = row[1]
+
+    # Her iş tam burst'ü kadar çalışır, gelişinden önce değil
+    work = {}
+    arrival = dict(zip(trace.id.tolist(), trace.arrival_time.tolist()))
+    for start, end, job, _ in slices:
+        assert start >= arrival[job] - EPS, (job, start)
+        work[job] = work.get(job, 0) + end - start
+    for job, burst in zip(trace.id.tolist(), trace.burst_time.tolist()):
+        assert abs(work.get(job, 0) - burst) < EPS, (job, work.get(job), burst)
+
+    # İş korunumu: bekleyen iş varken boş CPU yok
+    finish = {}
+    for _, end, job, _ in slices:
+        finish[job] = max(finish.get(job, 0), end)
+    moments = sorted({t for start, end, _, _ in slices for t in (start, end)} | set(arrival.values()))
+    for start, end in zip(moments, moments[1:]):
+        live = sum(1 for job in arrival if arrival[job] <= start and finish[job] > start + EPS)
+        busy = sum(1 for a, b, _, _ in slices if a <= start + EPS and b >= end - EPS)
+        assert busy == min(cpus, live), (start, busy, live)
+
+
+def test_smp_invariants():
+    trace = workload()
+    for name, make_policy in POLICIES.items():
+        for mode in ('global', 'per_cpu'):
+            log = IntervalLog()
+            SMPEngine(trace.table(), make_policy, 3, mode, log=log).run()
+            check_invariants(trace, log, 3)
+
+
+# -----------------------------
+# Online scheduler
+# -----------------------------
+def drive_online(jobs, policy, cpus):
+    """Feed `jobs` (sorted by arrival) to an OnlineScheduler like AsyncDispatcher does.
+
+    A job reports completion once it has run its burst; at every moment
+    completions go first, then arrivals, then the slice ends.
+    """
+    scheduler = OnlineScheduler(policy, cpus)
+    finishes = {}  # çalışan job id -> bitiş anı (dilim kesilmezse)
+    index = 0
+    while index < len(jobs) or len(scheduler):
+        candidates = list(finishes.values())
+        if index < len(jobs):
+            candidates.append(jobs[index].arrival_time)
+        if scheduler.next_event() is not None:
+            candidates.append(scheduler.next_event())
+        time = min(candidates)
+
+        ended = []
+        for id in [id for id, finish in finishes.items() if finish == time]:
+            del finishes[id]
+            ended += scheduler.complete(id, time)
+        while index < len(jobs) and jobs[index].arrival_time == time:
+            ended += scheduler.submit(jobs[index], time)
+            index += 1
+        ended += scheduler.tick(time)
+        for job, _ in ended:
+            finishes.pop(job.id, None)
+
+        decision = scheduler.next_decision()
+        while decision is not None:
+            job, _, quantum = decision
+            if quantum is None or quantum >= job.remaining_time:
+                finishes[job.id] = time + job.remaining_time
+            decision = scheduler.next_decision()
+    return scheduler
+
+
+def online_policies():
+    return {"SRTF exact": lambda: SRTFPolicy(None), "MLFQ": lambda: MLFQPolicy(boost_interval=15)}
+
+
+def test_online_matches_batch_engine():
+    for seed in (4, 5):
+        trace = workload(seed)
+        for name, make_policy in online_policies().items():
+            for cpus in (1, 3):
+                expected = make_engine(trace.table(), make_policy, cpus).run().completion_time.tolist()
+                jobs = list(trace.jobs())
+                drive_online(jobs, make_policy(), cpus)
+                assert [job.completion_time for job in jobs] == expected, (seed, name, cpus)
+
+
+def test_online_completion_races_preemption():
+    # A'nın dilimi t = 4'te bitip kuyruğa döndü; işçinin complete(A) bildirimi sonra geliyor
+    for make_policy in online_policies().values():
+        scheduler = OnlineScheduler(make_policy(), 1)
+        a, b = Job(1, 0, 10), Job(2, 1, 1)
+        scheduler.submit(a, 0)
+        assert scheduler.next_decision()[0] is a
+        scheduler.submit(b, 1)
+        scheduler.tick(4)
+        scheduler.complete(a.id, 4)
+        assert a.completion_time == 4
+        # Kuyrukta bitmiş sayılan A atlanır, sıradaki iş B
+        assert scheduler.next_decision()[0] is b
+        scheduler.complete(b.id, 5)
+        scheduler.complete(a.id, 5)
+        assert scheduler.next_decision() is None and len(scheduler) == 0
+        stats = scheduler.stats()
+        assert stats["completed"] == 2 and stats["stale_completions"] == 1
+
+
+def test_online_exact_srtf_keeps_cpu_on_ties():
+    # Kalan süresi eşit olan geliş çalışan işi kesmez
+    jobs = [Job(2, 0, 4), Job(1, 2, 2)]
+    drive_online(jobs, SRTFPolicy(None), 1)
+    assert [job.completion_time for job in jobs] == [4, 6]
+
+
+if __name__ == "__main__":
+    for name, test in list(globals().items()):
+        if name.startswith("test_"):
+            test()
+            print(f"{name}: ok")
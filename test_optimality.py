@@ -0,0 +1,275 @@
+"""Exhaustive-enumeration checks for the exact schedulers on small instances.
+
+Every non-preemptive solver is compared with the best of all n! job orders
+(each job starts at max(previous finish, arrival)); the preemptive DP is
+compared with a search over every unit-time choice of the running job.
+Exact SRTF (time_quantum=None) must reach the preemptive DP's total
+turnaround, keep the CPU on remaining-time ties and, on several CPUs in
+global mode, always run the jobs with the least remaining work.
+Pruning rules (dominance, Smith's rule, lower bounds) must never change the
+optimum, so any difference is a bug.
+
+    python -m pytest -q test_optimality.py
+    python test_optimality.py
+"""
+import functools
+import itertools
+import random
+
+from Job import IntervalLog, Job
+from schedlers.BnB import bnb_scheduler
+from schedlers.DP_algs import OBJECTIVES, dp_scheduler_bottom_up, job_cost, objective_weight
+from schedlers.DP_parallel import parallel_dp_scheduler
+from schedlers.DP_sched_preemptive import preemptive_dp_scheduler
+from schedlers.SRTF import SRTFScheduler
+
+INSTANCES = 40
+MAX_JOBS = 8
+
+
+def random_instance(rng, n, integral=True):
+    # Arada p = 0 işler: aktif seçim kuralı onları da açmalı; w = 0 da olur (p = w = 0 dahil)
+    jobs = []
+    for i in range(n):
+        burst = rng.randint(1, 5) if integral else round(rng.uniform(0.5, 5), 2)
+        if rng.random() < 0.3:
+            burst = 0
+        jobs.append(Job(i + 1, rng.randint(0, 10), burst, priority=rng.choice((0, 1, 1, 2, 3))))
+    return jobs
+
+
+def instances(seed, max_jobs=MAX_JOBS, integral=True):
+    # Her örnek için taze Job nesneleri: scheduler'lar işlerin alanlarını yazar
+    rng = random.Random(seed)
+    for k in range(INSTANCES):
+        n = rng.randint(0, max_jobs)
+        objective = OBJECTIVES[k % len(OBJECTIVES)]
+        yield objective, random_instance(rng, n, integral and k % 4 != 3)
+
+
+def copies(jobs):
+    return [Job(job.id, job.arrival_time, job.burst_time, priority=job.priority) for job in jobs]
+
+
+# -----------------------------
+# Brute force
+# -----------------------------
+def best_order_cost(jobs, objective):
+    """Minimum cost over all job orders (non-preemptive)."""
+    best = 0 if not jobs else float('inf')
+    for order in itertools.permutations(jobs):
+        time = cost = 0
+        for job in order:
+            start = max(time, job.arrival_time)
+            time = start + job.burst_time
+            cost += job_cost(objective, job, start, time)
+            if cost >= best:
+                break
+        else:
+            best = cost
+    return best
+
+
+def best_preemptive_cost(jobs, objective):
+    """Minimum cost over all preemptive schedules with integer times, one time unit at a time."""
+    n = len(jobs)
+    arrivals = [job.arrival_time for job in jobs]
+    bursts = [job.burst_time for job in jobs]
+    weights = [objective_weight(objective, job) for job in jobs]
+
+    @functools.lru_cache(maxsize=None)
+    def search(time, remaining, started):
+        if not any(remaining):
+            return 0
+        ready = [i for i in range(n) if remaining[i] and arrivals[i] <= time]
+        if not ready:
+            return search(min(arrivals[i] for i in range(n) if remaining[i]), remaining, started)
+        best = float('inf')
+        for i in ready:
+            cost = 0
+            if objective == 'response' and not started & (1 << i):
+                cost = weights[i] * (time - arrivals[i])
+            if objective != 'response' and remaining[i] == 1:
+                cost = weights[i] * (time + 1 - arrivals[i] - (0 if objective.endswith('turnaround') else bursts[i]))
+            rest = remaining[:i] + (remaining[i] - 1,) + remaining[i + 1:]
+            best = min(best, cost + search(time + 1, rest, started | (1 << i)))
+        return best
+
+    return search(0, tuple(bursts), 0)
+
+
+# -----------------------------
+# Schedule checks
+# -----------------------------
+def sequence_cost(jobs, schedule, objective):
+    # Her iş bir kez, gelişinden önce değil, dilimler çakışmadan
+    assert sorted(job.id for job, _, _ in schedule) == sorted(job.id for job in jobs)
+    time = 0
+    for job, start, finish in schedule:
+        assert start >= job.arrival_time and start >= time - 1e-9
+        assert abs(finish - start - job.burst_time) < 1e-9
+        time = finish
+    return sum(job_cost(objective, job, start, finish) for job, start, finish in schedule)
+
+
+def preemptive_cost(jobs, schedule, objective):
+    # Dilimler: toplam süre burst'e eşit, gelişten önce başlamaz, çakışmaz
+    first = {}
+    last = {}
+    work = {job.id: 0 for job in jobs}
+    time = 0
+    for job, start, finish in schedule:
+        assert start >= job.arrival_time and start >= time and finish > start
+        first.setdefault(job.id, start)
+        last[job.id] = finish
+        work[job.id] += finish - start
+        time = finish
+    assert all(abs(work[job.id] - job.burst_time) < 1e-9 for job in jobs)
+    weights = {job.id: objective_weight(objective, job) for job in jobs}
+    if objective == 'response':
+        return sum(first[job.id] - job.arrival_time for job in jobs)
+    if objective.endswith('turnaround'):
+        return sum(weights[job.id] * (last[job.id] - job.arrival_time) for job in jobs)
+    return sum(weights[job.id] * (last[job.id] - job.arrival_time - job.burst_time) for job in jobs)
+
+
+# p = w = 0 olan iş Smith sırasında döngü kapatıyordu: (objective, [(arrival, burst, priority)], optimum)
+REGRESSIONS = [
+    ('weighted_waiting', [(10, 4, 3), (1, 5, 2), (9, 3, 1), (9, 2, 0), (1, 0, 0)], 5),
+    ('weighted_turnaround', [(3, 4, 1), (6, 5, 3), (8, 0, 1), (0, 2, 2), (5, 3, 1), (11, 0, 0), (4, 4, 3)], 65),
+]
+
+
+def regression_instances():
+    for objective, rows, expected in REGRESSIONS:
+        jobs = [Job(i + 1, arrival, burst, priority=priority) for i, (arrival, burst, priority) in enumerate(rows)]
+        assert best_order_cost(jobs, objective) == expected
+        yield objective, jobs
+
+
+def check_sequence_solver(solve, seed):
+    for objective, jobs in itertools.chain(regression_instances(), instances(seed)):
+        expected = best_order_cost(jobs, objective)
+        schedule = solve(copies(jobs), objective)
+        cost = sequence_cost(jobs, schedule, objective)
+        assert abs(cost - expected) < 1e-9, (objective, [(j.arrival_time, j.burst_time, j.priority) for j in jobs],
+                                             cost, expected)
+
+
+# -----------------------------
+# Tests
+# -----------------------------
+def test_bottom_up_dp():
+    check_sequence_solver(lambda jobs, objective: dp_scheduler_bottom_up(jobs, objective, verbose=False)[0], 1)
+
+
+def test_bnb():
+    def solve(jobs, objective):
+        schedule, _, stats = bnb_scheduler(jobs, objective)
+        assert stats["optimal"]
+        return schedule
+    check_sequence_solver(solve, 2)
+
+
+def test_parallel_dp():
+    check_sequence_solver(lambda jobs, objective: parallel_dp_scheduler(
+        jobs, objective, processes=1, shard_size=3, verbose=False)[0], 3)
+
+
+def test_parallel_dp_pool():
+    # Birkaç örnek gerçek bir Pool ile: shared memory yolu da aynı optimumu vermeli
+    rng = random.Random(4)
+    for objective in ('turnaround', 'weighted_waiting'):
+        jobs = random_instance(rng, MAX_JOBS)
+        schedule, _ = parallel_dp_scheduler(copies(jobs), objective, processes=2, shard_size=4, verbose=False)
+        assert abs(sequence_cost(jobs, schedule, objective) - best_order_cost(jobs, objective)) < 1e-9
+
+
+def test_preemptive_dp():
+    # Tamsayı süreler: birim adımlı arama tüm kesme noktalarını kapsar
+    for objective, jobs in instances(5, max_jobs=6):
+        jobs = [Job(job.id, job.arrival_time, int(round(job.burst_time)) or 1, priority=job.priority)
+                for job in jobs]
+        expected = best_preemptive_cost(jobs, objective)
+        schedule, _ = preemptive_dp_scheduler(copies(jobs), objective, verbose=False)
+        cost = preemptive_cost(jobs, schedule, objective)
+        assert abs(cost - expected) < 1e-9, (objective, [(j.arrival_time, j.burst_time, j.priority) for j in jobs],
+                                             cost, expected)
+
+
+def test_preemptive_dp_fractional():
+    # Çeyrek birimli gelişler, tamsayı burst'ler (kalan süreler yine kesirli olur):
+    # arama 4 ile ölçeklenmiş örnekte birim adımlı
+    rng = random.Random(6)
+    for k in range(INSTANCES):
+        objective = OBJECTIVES[k % len(OBJECTIVES)]
+        jobs = [Job(i + 1, rng.randint(0, 24) / 4, rng.randint(1, 3), priority=rng.choice((1, 2, 3)))
+                for i in range(rng.randint(1, 5))]
+        scaled = [Job(job.id, job.arrival_time * 4, int(job.burst_time * 4), priority=job.priority) for job in jobs]
+        expected = best_preemptive_cost(scaled, objective) / 4
+        schedule, _ = preemptive_dp_scheduler(copies(jobs), objective, time_quantum=0.25, verbose=False)
+        cost = preemptive_cost(jobs, schedule, objective)
+        assert abs(cost - expected) < 1e-9, (objective, [(j.arrival_time, j.burst_time, j.priority) for j in jobs],
+                                             cost, expected)
+
+
+# -----------------------------
+# Exact SRTF
+# -----------------------------
+def unit_weight_instances(seed, max_jobs=MAX_JOBS):
+    # SRTF ağırlıkları priority'den alır: düz SRPT için hepsi 1, burst >= 1
+    for _, jobs in instances(seed, max_jobs):
+        yield [Job(job.id, job.arrival_time, int(round(job.burst_time)) or 1) for job in jobs]
+
+
+def test_exact_srtf_matches_preemptive_dp():
+    for jobs in unit_weight_instances(7, max_jobs=6):
+        _, expected = preemptive_dp_scheduler(copies(jobs), 'turnaround', verbose=False)
+        expected = sum(job.completion_time - job.arrival_time for job in expected)
+        completed = SRTFScheduler(copies(jobs), time_quantum=None)
+        cost = sum(job.completion_time - job.arrival_time for job in completed)
+        assert cost == expected, ([(j.arrival_time, j.burst_time) for j in jobs], cost, expected)
+
+
+def test_exact_srtf_keeps_cpu_on_ties():
+    # t = 2'de çalışan işlerin de gelenin de 2 birimi kalmış: gelen iş (küçük id) kesmemeli
+    for cpus in (1, 2, 3):
+        jobs = [Job(1, 2, 2)] + [Job(2 + k, 0, 4) for k in range(cpus)]
+        completed = {job.id: job.completion_time for job in SRTFScheduler(jobs, time_quantum=None, cpus=cpus)}
+        assert completed == {1: 6, **{2 + k: 4 for k in range(cpus)}}, (cpus, completed)
+
+
+def running_segments(jobs, log):
+    # Olay anları arasındaki her aralık için (başlangıç, çalışan işler, o anki kalan süreler, o an kesilen işler)
+    slices = list(zip(log.job, log.start, log.end))
+    times = sorted({job.arrival_time for job in jobs} | {t for _, start, end in slices for t in (start, end)})
+    for start, end in zip(times, times[1:]):
+        remaining = {job.id: job.burst_time for job in jobs if job.arrival_time <= start}
+        for id, a, b in slices:
+            if a < start:
+                remaining[id] -= min(b, start) - a
+        remaining = {id: left for id, left in remaining.items() if left > 0}
+        running = {id for id, a, b in slices if a <= start and end <= b}
+        cut = {id for id, _, b in slices if b == start and id in remaining}
+        yield start, running, remaining, cut
+
+
+def test_exact_srtf_smp_runs_least_remaining():
+    for cpus in (2, 3):
+        for jobs in unit_weight_instances(8 + cpus):
+            log = IntervalLog()
+            SRTFScheduler(copies(jobs), time_quantum=None, cpus=cpus, log=log)
+            for time, running, remaining, cut in running_segments(jobs, log):
+                waiting = [left for id, left in remaining.items() if id not in running]
+                assert len(running) == min(cpus, len(remaining)), (cpus, time, running, remaining)
+                assert not waiting or max(remaining[id] for id in running) <= min(waiting), \
+                    (cpus, time, running, remaining)
+                # Sadece geçilen iş kesilir: kesilip aynı anda başka CPU'da süren iş olmamalı
+                assert not cut & running, (cpus, time, cut & running)
+
+
+if __name__ == "__main__":
+    for name, test in list(globals().items()):
+        if name.startswith("test_"):
+            test()
+            print(f"{name}: ok")
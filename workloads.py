@@ -0,0 +1,193 @@
+"""Synthetic workload generators (NumPy-vectorized, seeded).
+
+A workload is an arrival process plus a burst distribution:
+
+    generate(n, arrivals="mmpp", bursts="pareto", utilization=0.9, seed=1)
+
+The arrival rate is derived from the target utilization, the number of
+CPUs and the mean burst, so the offered load stays the same whichever
+distributions are combined. Non-homogeneous processes (MMPP, diurnal) are
+sampled by a time change: unit-rate Poisson points are mapped through the
+inverse of the integrated intensity, so arrivals come out sorted without a
+sort and 10M jobs take a fraction of a second.
+"""
+import numpy as np
+
+from Job import Job, SortedJobs, Workload
+
+MEAN_BURST = 5.0
+
+
+# -----------------------------
+# Arrival processes
+# -----------------------------
+def _time_change(unit_arrivals, breaks_time, breaks_intensity, rates):
+    # Λ(t) parçalı doğrusal: [breaks_time[k], breaks_time[k+1]) aralığında eğim rates[k].
+    # unit_arrivals sıralı: her noktayı aramak yerine parça başına nokta sayısı sayılıp tekrarlanır
+    counts = np.diff(np.searchsorted(unit_arrivals, breaks_intensity, side='left'), append=len(unit_arrivals))
+    k = np.repeat(np.arange(len(breaks_intensity)), counts)
+    return breaks_time[k] + (unit_arrivals - breaks_intensity[k]) / rates[k]
+
+
+def poisson_arrivals(n, rate, rng):
+    return np.cumsum(rng.exponential(1.0 / rate, n))
+
+
+def mmpp_arrivals(n, rate, rng, rates=(0.5, 4.0), dwell=(100.0, 10.0)):
+    """Markov-modulated Poisson arrivals (bursty).
+
+    The process cycles through the states; state i lasts an exponential
+    time with mean dwell[i] and has an intensity proportional to rates[i].
+    Intensities are scaled so the long-run rate equals `rate`.
+    """
+    relative = np.asarray(rates, dtype=np.float64)
+    dwell = np.asarray(dwell, dtype=np.float64)
+    scaled = relative * rate * dwell.sum() / (relative * dwell).sum()
+
+    unit = np.cumsum(rng.exponential(1.0, n))
+    needed = unit[-1] if n else 0.0
+    per_cycle = (scaled * dwell).sum()
+    durations = np.empty(0)
+    total = 0.0
+    while total <= needed:
+        cycles = int(1.2 * (needed - total) / per_cycle) + 10
+        more = rng.exponential(np.tile(dwell, cycles))
+        durations = np.concatenate([durations, more])
+        total += (more * np.tile(scaled, cycles)).sum()
+    slopes = np.tile(scaled, len(durations) // len(dwell))
+    breaks_time = np.concatenate([[0.0], np.cumsum(durations)[:-1]])
+    breaks_intensity = np.concatenate([[0.0], np.cumsum(durations * slopes)[:-1]])
+    return _time_change(unit, breaks_time, breaks_intensity, slopes)
+
+
+def diurnal_arrivals(n, rate, rng, period=1440.0, amplitude=0.8, phase=0.0, steps=96):
+    """Poisson arrivals under a daily load curve.
+
+    The intensity is rate * (1 + amplitude * sin(2*pi*t/period + phase)),
+    held constant over `steps` slots per period (0 <= amplitude < 1).
+    """
+    # Yoğunluk periyodik: tek periyodun Λ'sı kurulur, fazlası tam periyot sayısıyla eklenir
+    unit = np.cumsum(rng.exponential(1.0, n))
+    slot = period / steps
+    breaks_time = np.arange(steps) * slot
+    slopes = rate * (1 + amplitude * np.sin(2 * np.pi * (breaks_time + slot / 2) / period + phase))
+    breaks_intensity = np.concatenate([[0.0], np.cumsum(slopes * slot)])
+    per_period = breaks_intensity[-1]
+    periods = np.floor(unit / per_period)
+    within = unit - periods * per_period
+
+    # Slot araması: Λ ekseninde eşit hücreli tablo + ileri düzeltme (searchsorted'dan hızlı)
+    cells = 64 * steps
+    first_slot = np.searchsorted(breaks_intensity, np.arange(cells) * (per_period / cells), side='right') - 1
+    k = np.minimum(within * (cells / per_period), cells - 1).astype(np.intp)
+    k = first_slot.take(k)
+    upper = np.append(breaks_intensity[1:-1], np.inf)
+    while True:
+        ahead = within >= upper.take(k)
+        if not ahead.any():
+            break
+        k += ahead
+    # t = periyot başı + breaks_time[k] + (within - breaks_intensity[k]) / slopes[k]
+    offset = breaks_time - breaks_intensity[:-1] / slopes
+    return periods * period + offset.take(k) + within / slopes.take(k)
+
+
+ARRIVALS = {
+    "poisson": poisson_arrivals,
+    "mmpp": mmpp_arrivals,
+    "diurnal": diurnal_arrivals,
+}
+
+
+# -----------------------------
+# Burst distributions
+# -----------------------------
+def exponential_bursts(n, mean, rng):
+    return rng.exponential(mean, n)
+
+
+def uniform_bursts(n, mean, rng, low=1.0):
+    return rng.uniform(low, 2 * mean - low, n)
+
+
+def pareto_bursts(n, mean, rng, alpha=1.5):
+    # Klasik Pareto: x_m * exp(E / alpha), E ~ Exp(1); ortalama = alpha * x_m / (alpha - 1), alpha > 1
+    scale = mean * (alpha - 1) / alpha
+    return scale * np.exp(rng.standard_exponential(n) / alpha)
+
+
+def lognormal_bursts(n, mean, rng, sigma=1.0):
+    return rng.lognormal(np.log(mean) - sigma ** 2 / 2, sigma, n)
+
+
+def bimodal_bursts(n, mean, rng, long_fraction=0.1, ratio=20.0):
+    """Mostly short jobs plus a fraction of long ones (ratio x longer), both exponential."""
+    short = mean / (1 - long_fraction + long_fraction * ratio)
+    means = np.where(rng.random(n) < long_fraction, short * ratio, short)
+    return rng.exponential(means)
+
+
+BURSTS = {
+    "exponential": exponential_bursts,
+    "uniform": uniform_bursts,
+    "pareto": pareto_bursts,
+    "lognormal": lognormal_bursts,
+    "bimodal": bimodal_bursts,
+}
+
+
+# -----------------------------
+# Workloads
+# -----------------------------
+def arrival_rate(utilization, mean_burst=MEAN_BURST, cpus=1):
+    # Hedef kullanım: rate * mean_burst = utilization * cpus
+    return utilization * cpus / mean_burst
+
+
+def generate(n, arrivals="poisson", bursts="exponential", utilization=0.8, cpus=1, mean_burst=MEAN_BURST,
+             integral=False, seed=None, arrival_params=None, burst_params=None):
+    """Sample an n-job Workload.
+
+    arrivals / bursts name an entry of ARRIVALS / BURSTS; arrival_params and
+    burst_params are passed on to it. integral=True rounds bursts to whole
+    time units (at least 1) and floors arrivals. The same seed always gives
+    the same workload.
+    """
+    if arrivals not in ARRIVALS:
+        raise ValueError(f"Unknown arrival process: {arrivals}")
+    if bursts not in BURSTS:
+        raise ValueError(f"Unknown burst distribution: {bursts}")
+    rng = np.random.default_rng(seed)
+    rate = arrival_rate(utilization, mean_burst, cpus)
+    burst_time = BURSTS[bursts](n, mean_burst, rng, **(burst_params or {}))
+    arrival_time = ARRIVALS[arrivals](n, rate, rng, **(arrival_params or {}))
+    if integral:
+        burst_time = np.maximum(np.round(burst_time), 1)
+        arrival_time = np.floor(arrival_time)
+    return Workload(np.arange(1, n + 1), arrival_time, burst_time)
+
+
+def random_jobs(n, max_arrival=20, max_burst=10, seed=None):
+    """The demo workload: integer arrivals in [0, max_arrival], bursts in [1, max_burst]."""
+    rng = np.random.default_rng(seed)
+    arrival_time = rng.integers(0, max_arrival + 1, n)
+    burst_time = rng.integers(1, max_burst + 1, n)
+    return Workload(np.arange(1, n + 1), arrival_time, burst_time)
+
+
+def to_jobs(workload, job_class=Job, **fields):
+    """Job objects in arrival order; whole-number times are given as ints.
+
+    The workload's priority and nice columns are carried over; explicit
+    `fields` override them.
+    """
+    columns = []
+    for column in (workload.arrival_time, workload.burst_time):
+        if np.all(np.mod(column, 1) == 0):
+            column = column.astype(np.int64)
+        columns.append(column.tolist())
+    names = [name for name in ('priority', 'nice') if name not in fields and getattr(workload, name, None) is not None]
+    for name in names:
+        columns.append(getattr(workload, name).tolist())
+    return SortedJobs(job_class(id, arrival, burst, **dict(zip(names, rest)), **fields)
+                      for id, arrival, burst, *rest in zip(workload.id.tolist(), *columns))